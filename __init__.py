@@ -3,3 +3,5 @@ from undirected_graph import *
 from directed_graph import *
 
 from tree import *
+
+from graph_io import *
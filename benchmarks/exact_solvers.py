@@ -0,0 +1,37 @@
+"""
+Benchmark for the exact exponential solvers of an undirected graph on random instances with a few dozen nodes
+"""
+
+from pathlib import Path
+
+from random import Random
+
+from sys import path, argv
+
+from time import perf_counter
+
+path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from undirected_graph import UndirectedGraph, WeightedNodesUndirectedGraph
+
+
+def random_graph(n: int, p: float, seed: int = 0) -> WeightedNodesUndirectedGraph:
+    rng = Random(seed)
+    return WeightedNodesUndirectedGraph(
+        {i: (rng.randint(1, 9), [j for j in range(i) if rng.random() < p]) for i in range(n)})
+
+
+def benchmark(name: str, solver, graph: UndirectedGraph) -> None:
+    t = perf_counter()
+    result = solver(graph)
+    print(f"{name:>24}: {perf_counter() - t:8.3f} s ({len(graph.nodes)} nodes, {len(graph.links)} links, "
+          f"result size {len(result)})")
+
+
+if __name__ == "__main__":
+    n = int(argv[1]) if len(argv) > 1 else 40
+    graph = random_graph(n, 0.2)
+    for name in ("independent_set", "weighted_independent_set", "dominating_set", "weighted_dominating_set",
+                 "hamilton_walk", "chromatic_nodes_partition"):
+        benchmark(name, getattr(type(graph), name), graph)
+    benchmark("DSatur", lambda g: g.chromatic_nodes_partition(False), graph)
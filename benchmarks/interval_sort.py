@@ -0,0 +1,40 @@
+"""
+Benchmark for the interval sort of interval graphs, which are given by random intervals
+"""
+
+from pathlib import Path
+
+from random import Random
+
+from sys import path, argv
+
+from time import perf_counter
+
+path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from undirected_graph import UndirectedGraph
+
+
+def random_intervals(n: int, length: int, seed: int = 0) -> UndirectedGraph:
+    rng = Random(seed)
+    intervals = sorted((a, a + rng.randrange(length)) for a in (rng.randrange(n) for _ in range(n)))
+    links = []
+    for i, (a, b) in enumerate(intervals):
+        for j in range(i + 1, n):
+            if intervals[j][0] > b:
+                break
+            links.append((i, j))
+    return UndirectedGraph.from_edges(links, range(n))
+
+
+if __name__ == "__main__":
+    n = int(argv[1]) if len(argv) > 1 else 20000
+    for length in (3, 10, 30):
+        graph = random_intervals(n, length)
+        t = perf_counter()
+        sort = graph.interval_sort()
+        print(f"length {length:>2}: {1000 * (perf_counter() - t):8.1f} ms ({len(graph.links)} links, "
+              f"{'found' if sort else 'not found'})")
+        t = perf_counter()
+        sort = graph.interval_sort(sort[0])
+        print(f"  given start: {1000 * (perf_counter() - t):8.1f} ms")
@@ -0,0 +1,116 @@
+"""
+Micro-benchmark for comparing the slotted, interned Node and Link classes with the former dictionary-based ones
+"""
+
+from pathlib import Path
+
+from random import Random
+
+from sys import path, argv
+
+from time import perf_counter
+
+from tracemalloc import start, stop, get_traced_memory
+
+path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from base import Node, Link
+
+from undirected_graph import WeightedLinksUndirectedGraph
+
+
+class LegacyNode:
+    def __init__(self, value):
+        if not hasattr(value, "__hash__"):
+            raise ValueError(f"Unhashable type: {type(value).__name__}!")
+        self.__value = value
+
+    @property
+    def value(self):
+        return self.__value
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __eq__(self, other):
+        if type(other) == LegacyNode:
+            return self.value == other.value
+        return False
+
+
+class LegacyLink:
+    def __init__(self, u, v):
+        if not isinstance(u, LegacyNode):
+            u = LegacyNode(u)
+        if not isinstance(v, LegacyNode):
+            v = LegacyNode(v)
+        self.__u, self.__v = u, v
+
+    @property
+    def u(self):
+        return self.__u
+
+    @property
+    def v(self):
+        return self.__v
+
+    def __hash__(self):
+        return hash(frozenset({self.u, self.v}))
+
+    def __eq__(self, other):
+        if type(other) == LegacyLink:
+            return {self.u, self.v} == {other.u, other.v}
+        return False
+
+
+def timed(f, *args) -> float:
+    t = perf_counter()
+    f(*args)
+    return perf_counter() - t
+
+
+def memory(f, *args) -> int:
+    start()
+    res = f(*args)
+    size = get_traced_memory()[0]
+    stop()
+    del res
+    return size
+
+
+def links_workload(link_type: type, pairs: list[tuple]) -> None:
+    links = {link_type(u, v) for u, v in pairs}
+    for _ in range(4):
+        for u, v in pairs:
+            if link_type(v, u) not in links:
+                raise AssertionError
+
+
+def nodes_workload(node_type: type, n: int) -> list:
+    return [node_type(i % (n // 10)) for i in range(n)]
+
+
+def graph_workload(g: WeightedLinksUndirectedGraph) -> None:
+    for u in g.nodes:
+        g.link_weights(u)
+    g.minimal_spanning_tree()
+
+
+if __name__ == "__main__":
+    n = int(argv[1]) if len(argv) > 1 else 100000
+    rng = Random(0)
+    pairs = [(rng.randrange(n // 5), rng.randrange(n // 5)) for _ in range(n)]
+    pairs = [(u, v) for u, v in pairs if u != v]
+    for name, node_type, link_type in (("legacy", LegacyNode, LegacyLink), ("slotted", Node, Link)):
+        size = memory(nodes_workload, node_type, n) / n
+        nodes = [node_type(i) for i in range(n // 5)]
+        node_pairs = [(nodes[u], nodes[v]) for u, v in pairs]
+        print(f"{name:>7}: {timed(links_workload, link_type, node_pairs) * 1000:8.1f} ms link set build/lookup, "
+              f"{timed(nodes_workload, node_type, n) * 1000:8.1f} ms and {size:6.1f} B per node reference "
+              f"({n // 10} distinct values)")
+    neighborhood = {}
+    for u, v in pairs[:n // 10]:
+        neighborhood.setdefault(u, {})[v] = rng.random()
+    g = WeightedLinksUndirectedGraph(neighborhood)
+    print(f"  graph: {timed(graph_workload, g) * 1000:8.1f} ms link_weights + minimal_spanning_tree "
+          f"({len(g.nodes)} nodes, {len(g.links)} links)")
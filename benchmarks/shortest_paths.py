@@ -0,0 +1,38 @@
+"""
+Benchmark for comparing repeated get_shortest_path calls with batched and single-source shortest path queries
+"""
+
+from pathlib import Path
+
+from random import Random
+
+from sys import path, argv
+
+from time import perf_counter
+
+path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from undirected_graph import UndirectedGraph
+
+
+def random_graph(n: int, m: int, seed: int = 0) -> UndirectedGraph:
+    rng = Random(seed)
+    return UndirectedGraph.from_edges(((rng.randrange(n), rng.randrange(n)) for _ in range(m)), range(n))
+
+
+def timed(f, *args) -> float:
+    t = perf_counter()
+    f(*args)
+    return perf_counter() - t
+
+
+if __name__ == "__main__":
+    n = int(argv[1]) if len(argv) > 1 else 20000
+    graph, rng = random_graph(n, 5 * n), Random(1)
+    sources = [rng.randrange(n) for _ in range(10)]
+    pairs = [(rng.choice(sources), rng.randrange(n)) for _ in range(1000)]
+    single = timed(lambda: [graph.get_shortest_path(u, v) for u, v in pairs])
+    print(f"get_shortest_path x {len(pairs)}: {1000 * single:10.1f} ms")
+    print(f"shortest_paths_many:      {1000 * timed(graph.shortest_paths_many, pairs):10.1f} ms")
+    print(f"shortest_path_lengths:    {1000 * timed(graph.shortest_path_lengths, sources[0]):10.1f} ms")
+    print(f"multi_source_distances:   {1000 * timed(graph.multi_source_distances, sources):10.1f} ms")
@@ -0,0 +1,26 @@
+"""
+Benchmark for comparing Kruskal's algorithm with Boruvka's algorithm over several processes for minimal spanning forests
+"""
+
+from pathlib import Path
+
+from random import Random
+
+from sys import path, argv
+
+from time import perf_counter
+
+path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from undirected_graph import WeightedLinksUndirectedGraph
+
+
+if __name__ == "__main__":
+    n = int(argv[1]) if len(argv) > 1 else 100000
+    rng = Random(0)
+    graph = WeightedLinksUndirectedGraph.from_edges(
+        ((rng.randrange(n), rng.randrange(n), rng.random()) for _ in range(5 * n)), range(n))
+    for processes in (1, 2, 4):
+        t = perf_counter()
+        links, weight = graph.minimal_spanning_forest(processes)
+        print(f"{processes} process(es): {1000 * (perf_counter() - t):10.1f} ms, {len(links)} links, weight {weight:.3f}")
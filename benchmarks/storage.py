@@ -0,0 +1,47 @@
+"""
+Benchmark for comparing the memory per link and the BFS throughput of the storage engines of an undirected graph
+"""
+
+from pathlib import Path
+
+from random import Random
+
+from sys import path, argv
+
+from time import perf_counter
+
+from tracemalloc import start, stop, get_traced_memory
+
+path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from undirected_graph import UndirectedGraph
+
+
+def random_neighborhood(n: int, m: int, seed: int = 0) -> dict[int, set[int]]:
+    rng, res = Random(seed), {i: set() for i in range(n)}
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            res[u].add(v)
+    return res
+
+
+def benchmark(storage: str, neighborhood: dict[int, set[int]], queries: int = 50) -> None:
+    start()
+    graph = UndirectedGraph(neighborhood, storage)
+    memory = get_traced_memory()[0]
+    stop()
+    links = len(graph.links)
+    rng, nodes = Random(1), sorted(neighborhood)
+    t = perf_counter()
+    for _ in range(queries):
+        graph.get_shortest_path(rng.choice(nodes), rng.choice(nodes))
+    bfs = (perf_counter() - t) / queries
+    print(f"{storage:>4}: {memory / links:8.1f} B/link, {1000 * bfs:8.2f} ms/BFS ({len(nodes)} nodes, {links} links)")
+
+
+if __name__ == "__main__":
+    n = int(argv[1]) if len(argv) > 1 else 20000
+    neighborhood = random_neighborhood(n, 5 * n)
+    for s in ("set", "csr"):
+        benchmark(s, neighborhood)
@@ -2,24 +2,51 @@
 Module for implementing helper classes Node and Link, abstract base class Graph and helper functions
 """
 
-from collections import defaultdict
+from collections import defaultdict, deque, Counter
+
+from concurrent.futures import ProcessPoolExecutor
 
 from abc import ABC, abstractmethod
 
-from typing import Iterable, Hashable
+from heapq import heapify, heappush, heappop
+
+from hashlib import blake2b
+
+from math import inf
+
+from weakref import KeyedRef
+
+from typing import Iterable, Iterator, Hashable, Callable
+
+from itertools import count
+
+
+_interned: defaultdict[type, dict[Hashable, KeyedRef]] = defaultdict(dict)
 
-from itertools import permutations, product
+
+def _release(ref: KeyedRef) -> None:
+    if (table := _interned[type(ref.key)]).get(ref.key) is ref:
+        del table[ref.key]
 
 
 class Node:
     """
-    Helper class Node with a hashable value
+    Helper class Node with a hashable value. Nodes are interned, so equal values of the same type share one instance
     """
 
-    def __init__(self, value: Hashable) -> None:
-        if not hasattr(value, "__hash__"):
+    __slots__ = ("__value", "__hash", "__weakref__")
+
+    def __new__(cls, value: Hashable) -> "Node":
+        try:
+            ref = (table := _interned[type(value)]).get(value)
+        except TypeError:
             raise ValueError(f"Unhashable type: {type(value).__name__}!")
-        self.__value = value
+        if ref is not None and (node := ref()) is not None:
+            return node
+        node = super().__new__(cls)
+        node.__value, node.__hash = value, hash(value)
+        table[value] = KeyedRef(node, _release, value)
+        return node
 
     @property
     def value(self) -> Hashable:
@@ -30,35 +57,40 @@ class Node:
         return self.__value
 
     def __bool__(self) -> bool:
-        return bool(self.value)
+        return bool(self.__value)
 
     def __hash__(self) -> int:
-        return hash(self.value)
+        return self.__hash
 
     def __eq__(self, other: "Node") -> bool:
+        if self is other:
+            return True
         if type(other) == Node:
-            return self.value == other.value
+            return self.__hash == other.__hash and self.__value == other.__value
         return False
 
     def __lt__(self, other: "Node") -> bool:
         if isinstance(other, Node):
-            return self.value < other.value
-        return self.value < other
+            return self.__value < other.__value
+        return self.__value < other
 
     def __le__(self, other: "Node") -> bool:
         if isinstance(other, Node):
-            return self.value <= other.value
-        return self.value <= other
+            return self.__value <= other.__value
+        return self.__value <= other
 
     def __ge__(self, other: "Node") -> bool:
         if isinstance(other, Node):
-            return self.value >= other.value
-        return self.value >= other
+            return self.__value >= other.__value
+        return self.__value >= other
 
     def __gt__(self, other: "Node") -> bool:
         if isinstance(other, Node):
-            return self.value > other.value
-        return self.value > other
+            return self.__value > other.__value
+        return self.__value > other
+
+    def __reduce__(self) -> tuple:
+        return Node, (self.__value,)
 
     def __str__(self) -> str:
         return "(" + str(self.value) + ")"
@@ -68,9 +100,11 @@ class Node:
 
 class Link:
     """
-    Helper class, implementing an undirected link
+    Helper class, implementing an undirected link. Its hash is computed once, from its endpoints in canonical order
     """
 
+    __slots__ = ("__u", "__v", "__hash")
+
     def __init__(self, u: Node, v: Node) -> None:
         """
         Args:
@@ -82,6 +116,7 @@ class Link:
         if not isinstance(v, Node):
             v = Node(v)
         self.__u, self.__v = u, v
+        self.__hash = hash((hu, hv) if (hu := hash(u)) <= (hv := hash(v)) else (hv, hu))
 
     @property
     def u(self) -> Node:
@@ -108,22 +143,1060 @@ class Link:
         """
         if not isinstance(node, Node):
             node = Node(node)
-        return node in {self.u, self.v}
+        return node == self.__u or node == self.__v
 
     def __hash__(self) -> int:
-        return hash(frozenset({self.u, self.v}))
+        return self.__hash
 
     def __eq__(self, other: "Link") -> bool:
         if type(other) == Link:
-            return {self.u, self.v} == {other.u, other.v}
+            if self.__hash != other.__hash:
+                return False
+            u, v = other.__u, other.__v
+            if self.__u is u and self.__v is v or self.__u is v and self.__v is u:
+                return True
+            return self.__u == u and self.__v == v or self.__u == v and self.__v == u
         return False
 
+    def __reduce__(self) -> tuple:
+        return Link, (self.__u, self.__v)
+
     def __str__(self) -> str:
         return f"{self.u}-{self.v}"
 
     __repr__: str = __str__
 
 
+def breadth_first(source: Node, neighbors: Callable[[Node], Iterable[Node]],
+                  parents: dict[Node, Node | None] = None) -> Iterator[tuple[Node, int, Node | None]]:
+    """
+    Args:
+        source: Starting node
+        neighbors: A function, returning the nodes, that can be reached from a given node with one step
+        parents: An optional dictionary, which is filled with the parent of each visited node (None for the source)
+    Returns:
+        A generator of tuples (node, depth, parent) in BFS order, where every node is yielded when it is discovered
+    """
+    return multi_breadth_first((source,), neighbors, parents)
+
+
+def multi_breadth_first(sources: Iterable[Node], neighbors: Callable[[Node], Iterable[Node]],
+                        parents: dict[Node, Node | None] = None) -> Iterator[tuple[Node, int, Node | None]]:
+    """
+    Args:
+        sources: Starting nodes, all of which are at depth 0
+        neighbors: A function, returning the nodes, that can be reached from a given node with one step
+        parents: An optional dictionary, which is filled with the parent of each visited node (None for the sources)
+    Returns:
+        A generator of tuples (node, depth, parent) in BFS order, where depth is the distance to the closest source
+    """
+    if parents is None:
+        parents = {}
+    queue = deque()
+    for s in sources:
+        if s not in parents:
+            parents[s] = None
+            queue.append((s, 0))
+            yield s, 0, None
+    while queue:
+        u, depth = queue.popleft()
+        depth += 1
+        for v in neighbors(u):
+            if v not in parents:
+                parents[v] = u
+                yield v, depth, u
+                queue.append((v, depth))
+
+
+def depth_first(source: Node, neighbors: Callable[[Node], Iterable[Node]],
+                parents: dict[Node, Node | None] = None) -> Iterator[tuple[Node, int, Node | None]]:
+    """
+    Args:
+        source: Starting node
+        neighbors: A function, returning the nodes, that can be reached from a given node with one step
+        parents: An optional dictionary, which is filled with the parent of each visited node (None for the source)
+    Returns:
+        A generator of tuples (node, depth, parent) in DFS preorder, where depth is the one in the DFS tree
+    """
+    if parents is None:
+        parents = {}
+    parents[source], stack = None, [(source, iter(neighbors(source)))]
+    yield source, 0, None
+    while stack:
+        u, rest = stack[-1]
+        for v in rest:
+            if v not in parents:
+                parents[v] = u
+                yield v, len(stack), u
+                stack.append((v, iter(neighbors(v))))
+                break
+        else:
+            stack.pop()
+
+
+def path_to(parents: dict[Node, Node | None], v: Node) -> list[Node]:
+    """
+    Args:
+        parents: A dictionary, mapping each visited node to its parent (None for the source)
+        v: A visited node
+    Returns:
+        The path from the source to v in the search tree
+    """
+    res = [v]
+    while (v := parents[v]) is not None:
+        res.append(v)
+    res.reverse()
+    return res
+
+
+def shortest_paths(pairs: list[tuple[Node, Node]], neighbors: Callable[[Node], Iterable[Node]]) -> list[list[Node]]:
+    """
+    Args:
+        pairs: A list of pairs of nodes (u, v)
+        neighbors: A function, returning the nodes, that can be reached from a given node with one step
+    Returns:
+        One shortest path from u to v for each given pair, if such path exists, otherwise empty list
+    Pairs are grouped by their first node, so that one BFS is run per source, until it finds all of its targets.
+    """
+    targets, paths = defaultdict(set), {}
+    for u, v in pairs:
+        targets[u].add(v)
+    for u, rest in targets.items():
+        parents = {}
+        for n, _, _ in breadth_first(u, neighbors, parents):
+            if n in rest:
+                paths[u, n] = path_to(parents, n)
+                rest.remove(n)
+                if not rest:
+                    break
+    return [paths.get(p, []) for p in pairs]
+
+
+def dijkstra(sources: dict[Node, float], steps: Callable[[Node], Iterable[tuple[Node, float]]],
+             target: Node = None) -> tuple[dict[Node, float], dict[Node, Node | None]]:
+    """
+    Args:
+        sources: A dictionary, mapping each starting node to its initial distance
+        steps: A function, returning pairs of a node, that can be reached from a given node with one step, and the non-negative cost of that step
+        target: An optional node, after finding the distance to which, the search stops
+    Returns:
+        A dictionary with the distances to the reached nodes and a dictionary with their parents on a cheapest path (None for the sources)
+    """
+    distances, parents, best, tie = {}, {}, dict(sources), count()
+    heap = [(d, next(tie), s, None) for s, d in sources.items()]
+    heapify(heap)
+    while heap:
+        d, _, u, p = heappop(heap)
+        if u in distances:
+            continue
+        distances[u], parents[u] = d, p
+        if u == target:
+            break
+        for v, w in steps(u):
+            if v not in distances and (new := d + w) < best.get(v, inf):
+                best[v] = new
+                heappush(heap, (new, next(tie), v, u))
+    return distances, parents
+
+
+def cheapest_path(u: Node, v: Node, weight: float,
+                  steps: Callable[[Node], Iterable[tuple[Node, float]]]) -> tuple[list[Node], float]:
+    """
+    Args:
+        u: First given node
+        v: Second given node
+        weight: The initial cost of the path, which starts at u
+        steps: A function, returning pairs of a node, that can be reached from a given node with one step, and the non-negative cost of that step
+    Returns:
+        A cheapest path from u to v and its cost, if such path exists, otherwise an empty list and infinity
+    """
+    distances, parents = dijkstra({u: weight}, steps, v)
+    return (path_to(parents, v), distances[v]) if v in distances else ([], inf)
+
+
+def bellman_ford(sources: dict[Node, float], steps: Callable[[Node], Iterable[tuple[Node, float]]]) -> tuple[
+    dict[Node, float], dict[Node, Node | None], list[Node]]:
+    """
+    Args:
+        sources: A dictionary, mapping each starting node to its initial distance
+        steps: A function, returning pairs of a node, that can be reached from a given node with one step, and the cost of that step, which may be negative
+    Returns:
+        A dictionary with the distances to the reached nodes, a dictionary with their parents on a cheapest path (None for the sources) and a negative cycle, reachable from the sources, as a list of nodes, which starts and ends with the same node, if such exists, otherwise an empty list. If a negative cycle is found, the distances are not final
+    The queue-based variant of the Bellman-Ford algorithm is used, where only nodes, whose distance has changed, are relaxed again
+    """
+    distances, parents, lengths = dict(sources), dict.fromkeys(sources), dict.fromkeys(sources, 0)
+    queue, queued = deque(sources), set(sources)
+    while queue:
+        queued.remove(u := queue.popleft())
+        for v, w in steps(u):
+            if (new := distances[u] + w) < distances.get(v, inf):
+                distances[v], parents[v], lengths[v] = new, u, lengths[u] + 1
+                if lengths[v] >= len(distances) and (cycle := parents_cycle(parents, v)):
+                    return distances, parents, cycle
+                if v not in queued:
+                    queue.append(v), queued.add(v)
+    return distances, parents, []
+
+
+def parents_cycle(parents: dict[Node, Node | None], v: Node) -> list[Node]:
+    """
+    Args:
+        parents: A dictionary, mapping each visited node to its parent (None for the sources)
+        v: A visited node
+    Returns:
+        The cycle, which is reached by following the parents of v, as a list of nodes, which starts and ends with the same node, if such exists, otherwise an empty list
+    """
+    total = set()
+    while v is not None and v not in total:
+        total.add(v)
+        v = parents[v]
+    if v is None:
+        return []
+    res, u = [v], parents[v]
+    while u != v:
+        res.append(u)
+        u = parents[u]
+    res.append(v)
+    res.reverse()
+    return res
+
+
+def johnson(sources: dict[Node, float], steps: Callable[[Node], Iterable[tuple[Node, float]]]) -> dict[
+    Node, dict[Node, float]]:
+    """
+    Args:
+        sources: A dictionary, mapping every node to the initial distance of the paths, starting from it
+        steps: A function, returning pairs of a node, that can be reached from a given node with one step, and the cost of that step, which may be negative
+    Returns:
+        A dictionary, mapping every node to a dictionary with the distances from it to all nodes it can reach
+    The costs are made non-negative with node potentials, found by the Bellman-Ford algorithm, so that Dijkstra's algorithm can be run from every node. A ValueError is raised, if there's a negative cycle
+    """
+    h, _, cycle = bellman_ford(dict.fromkeys(sources, 0), steps)
+    if cycle:
+        raise ValueError("Negative cycle found!")
+    reweighted = lambda x: ((y, max(0, w + h[x] - h[y])) for y, w in steps(x))
+    res = {}
+    for u, weight in sources.items():
+        res[u] = {v: weight + d - h[u] + h[v] for v, d in dijkstra({u: 0}, reweighted)[0].items()}
+    return res
+
+
+def find(parents: list[int], x: int) -> int:
+    """
+    Args:
+        parents: The parent of each element in a union-find forest
+        x: An element
+    Returns:
+        The root of the tree of x. The path to it is halved on the way
+    """
+    while (p := parents[x]) != x:
+        parents[x] = x = parents[p]
+    return x
+
+
+def union(parents: list[int], sizes: list[int], x: int, y: int) -> bool:
+    """
+    Args:
+        parents: The parent of each element in a union-find forest
+        sizes: The size of the tree of each root in the forest
+        x: First element
+        y: Second element
+    Returns:
+        Whether x and y were in different trees, which are then merged, the smaller one under the larger one
+    """
+    if (x := find(parents, x)) == (y := find(parents, y)):
+        return False
+    if sizes[x] < sizes[y]:
+        x, y = y, x
+    parents[y] = x
+    sizes[x] += sizes[y]
+    return True
+
+
+def kruskal(n: int, links: list[tuple[int, int, float]]) -> list[int]:
+    """
+    Args:
+        n: The number of nodes, which are numbered from 0 to n - 1
+        links: A list of triples (u, v, w) of two nodes and the weight of the link between them
+    Returns:
+        The indices of the links of a minimal spanning forest
+    """
+    parents, sizes, res = list(range(n)), [1] * n, []
+    for i in sorted(range(len(links)), key=lambda j: links[j][2]):
+        if union(parents, sizes, links[i][0], links[i][1]):
+            res.append(i)
+            if len(res) == n - 1:
+                break
+    return res
+
+
+_links: list[tuple[int, int, float]] = []
+
+
+def _share_links(links: list[tuple[int, int, float]]) -> None:
+    global _links
+    _links = links
+
+
+def cheapest_links(labels: list[int], start: int, stop: int) -> dict[int, int]:
+    """
+    Args:
+        labels: The component of each node
+        start: The index of the first link to check
+        stop: The index after the last link to check
+    Returns:
+        A dictionary, mapping each component to the index of the cheapest link among the given ones, which leaves it. Ties are broken by the index
+    """
+    res, weights = {}, {}
+    for i in range(start, stop):
+        u, v, w = _links[i]
+        if (a := labels[u]) != (b := labels[v]):
+            if w < weights.get(a, inf):
+                res[a], weights[a] = i, w
+            if w < weights.get(b, inf):
+                res[b], weights[b] = i, w
+    return res
+
+
+def boruvka(n: int, links: list[tuple[int, int, float]], processes: int = 1) -> list[int]:
+    """
+    Args:
+        n: The number of nodes, which are numbered from 0 to n - 1
+        links: A list of triples (u, v, w) of two nodes and the weight of the link between them
+        processes: The number of processes, between which the links are split, when searching for the cheapest link, leaving each component
+    Returns:
+        The indices of the links of a minimal spanning forest
+    """
+    parents, sizes, res, size = list(range(n)), [1] * n, [], -(-len(links) // processes) or 1
+    with ProcessPoolExecutor(processes, initializer=_share_links, initargs=(links,)) as pool:
+        while True:
+            labels, best = [find(parents, x) for x in range(n)], {}
+            chunks = range(0, len(links), size)
+            for part in pool.map(cheapest_links, [labels] * len(chunks), chunks,
+                                 [min(i + size, len(links)) for i in chunks]):
+                for c, i in part.items():
+                    if c not in best or (links[i][2], i) < (links[best[c]][2], best[c]):
+                        best[c] = i
+            if not best:
+                return res
+            for i in set(best.values()):
+                if union(parents, sizes, links[i][0], links[i][1]):
+                    res.append(i)
+
+
+def strong_components(nodes: Iterable[Node], neighbors: Callable[[Node], Iterable[Node]]) -> tuple[
+    list[set[Node]], dict[Node, int]]:
+    """
+    Args:
+        nodes: All nodes of a directed graph
+        neighbors: A function, returning the nodes, that a given node points to
+    Returns:
+        A list of the strongly-connected components and a dictionary, mapping each node to the index of its component in that list. A component comes before all components, from which it can be reached
+    Tarjan's algorithm is used with an explicit stack instead of recursion
+    """
+    index, low, ids, stack, res = {}, {}, {}, [], []
+    for s in nodes:
+        if s in index:
+            continue
+        index[s] = low[s] = len(index)
+        stack.append(s)
+        work = [(s, iter(neighbors(s)))]
+        while work:
+            u, rest = work[-1]
+            for v in rest:
+                if v not in index:
+                    index[v] = low[v] = len(index)
+                    stack.append(v), work.append((v, iter(neighbors(v))))
+                    break
+                if v not in ids and index[v] < low[u]:
+                    low[u] = index[v]
+            else:
+                work.pop()
+                if work and low[u] < low[p := work[-1][0]]:
+                    low[p] = low[u]
+                if low[u] == index[u]:
+                    component, x = set(), None
+                    while x != u:
+                        ids[x := stack.pop()] = len(res)
+                        component.add(x)
+                    res.append(component)
+    return res, ids
+
+
+def kahn(nodes: Iterable[Node], prev: Callable[[Node], Iterable[Node]],
+         succ: Callable[[Node], Iterable[Node]]) -> tuple[list[list[Node]], list[Node]]:
+    """
+    Args:
+        nodes: All nodes of a directed graph
+        prev: A function, returning the nodes, that point to a given node
+        succ: A function, returning the nodes, that a given node points to
+    Returns:
+        The generations of the nodes, where each node is only pointed by nodes in earlier generations, and a cycle as a list of nodes, which starts and ends with the same node, if such exists, otherwise an empty list. If there's a cycle, the nodes, that are reachable from it, are in no generation
+    Kahn's algorithm is used, where only the number of unsorted nodes, that point to each node, is kept
+    """
+    degrees = {u: len(prev(u)) for u in nodes}
+    layer, res, total = [u for u, d in degrees.items() if not d], [], 0
+    while layer:
+        res.append(layer)
+        total += len(layer)
+        layer = []
+        for u in res[-1]:
+            for v in succ(u):
+                degrees[v] -= 1
+                if not degrees[v]:
+                    layer.append(v)
+    if total == len(degrees):
+        return res, []
+    u, order = next(u for u, d in degrees.items() if d), {}
+    while u not in order:
+        order[u] = len(order)
+        u = next(v for v in prev(u) if degrees[v])
+    cycle = list(order)[order[u]:] + [u]
+    cycle.reverse()
+    return res, cycle
+
+
+def biconnected(nodes: Iterable[Node], neighbors: Callable[[Node], Iterable[Node]]) -> tuple[
+    list[set[Node]], set[Node]]:
+    """
+    Args:
+        nodes: All nodes of an undirected graph
+        neighbors: A function, returning the neighbors of a given node
+    Returns:
+        A list of the biconnected components (blocks) of the graph and the set of its cut nodes. Blocks with 2 nodes are exactly the bridge links and a node without neighbors is a block on its own
+    The Hopcroft-Tarjan algorithm is used with an explicit stack instead of recursion
+    """
+    index, low, cut, blocks = {}, {}, set(), []
+    for s in nodes:
+        if s in index:
+            continue
+        index[s] = low[s] = len(index)
+        stack, work, children = [s], [(s, None, iter(neighbors(s)))], 0
+        while work:
+            u, p, rest = work[-1]
+            for v in rest:
+                if v not in index:
+                    index[v] = low[v] = len(index)
+                    stack.append(v), work.append((v, u, iter(neighbors(v))))
+                    break
+                if v != p and index[v] < low[u]:
+                    low[u] = index[v]
+            else:
+                work.pop()
+                if p is None:
+                    continue
+                if low[u] < low[p]:
+                    low[p] = low[u]
+                if low[u] >= index[p]:
+                    block, x = {p}, None
+                    while x != u:
+                        block.add(x := stack.pop())
+                    blocks.append(block)
+                    if p != s:
+                        cut.add(p)
+                    else:
+                        children += 1
+        if children > 1:
+            cut.add(s)
+        elif not children:
+            blocks.append({s})
+    return blocks, cut
+
+
+def hierholzer(end: Node, prev: Callable[[Node], Iterable[Node]],
+               link: Callable[[Node, Node], Hashable] = None) -> Iterator[Node]:
+    """
+    Args:
+        end: The node, where the walk ends
+        prev: A function, returning the nodes, that point to a given node (the neighbors of a node in an undirected graph)
+        link: For undirected graphs, a function, returning a key for the link between two nodes, so that every link is used once
+    Returns:
+        A generator of the nodes of a walk, which ends at end and uses every link, that's reachable from it, exactly once, provided that such walk exists
+    Hierholzer's algorithm is run backwards from the end with one iterator over the links of each node, so that the nodes of the walk are generated in order
+    """
+    rest, used, stack = {}, set(), [end]
+    while stack:
+        if (u := stack[-1]) not in rest:
+            rest[u] = iter(prev(u))
+        for v in rest[u]:
+            if link is None:
+                break
+            if (l := link(u, v)) not in used:
+                used.add(l)
+                break
+        else:
+            yield stack.pop()
+            continue
+        stack.append(v)
+
+
+def lex_bfs(order: list[Node], neighbors: Callable[[Node], Iterable[Node]]) -> list[Node]:
+    """
+    Args:
+        order: The nodes of the graph. Of nodes with equal labels, the one, which comes first in it, is visited first
+        neighbors: A function, returning the neighbors of a given node
+    Returns:
+        The nodes in lexicographic breadth-first search order, found with partition refinement in linear time. Searching with the reversed result of a search gives its LBFS+ sweep
+    """
+    adjacency, classes = {u: [] for u in order}, dict.fromkeys(order, 0)
+    for v in order:
+        for u in neighbors(v):
+            adjacency[u].append(v)
+    members, sizes, starts, prev, after, splits = [list(order)], [len(order)], [0], [None], [None], [None]
+    head, result = 0, []
+    while len(result) < len(order):
+        while not sizes[head]:
+            head = after[head]
+            prev[head] = None
+        while classes[u := members[head][starts[head]]] != head:
+            starts[head] += 1
+        starts[head], sizes[head], classes[u] = starts[head] + 1, sizes[head] - 1, None
+        result.append(u)
+        for v in adjacency[u]:
+            if (c := classes[v]) is None:
+                continue
+            if splits[c] is None or splits[c][0] != len(result):
+                n = len(members)
+                members.append([]), sizes.append(0), starts.append(0), splits.append(None)
+                prev.append(prev[c]), after.append(c)
+                if prev[c] is None:
+                    head = n
+                else:
+                    after[prev[c]] = n
+                prev[c], splits[c] = n, (len(result), n)
+            n = splits[c][1]
+            members[n].append(v)
+            classes[v], sizes[n], sizes[c] = n, sizes[n] + 1, sizes[c] - 1
+    return result
+
+
+def interval_ordering(order: list[Node], neighbors: Callable[[Node], Iterable[Node]]) -> bool:
+    """
+    Args:
+        order: The nodes of the graph
+        neighbors: A function, returning the neighbors of a given node
+    Returns:
+        Whether the neighbors of each node, which come after it in the given order, come right after it
+    """
+    position = {u: i for i, u in enumerate(order)}
+    for i, u in enumerate(order):
+        later = [j for v in neighbors(u) if (j := position[v]) > i]
+        if later and max(later) != i + len(later):
+            return False
+    return True
+
+
+def elimination_ordering(order: list[Node], neighbors: Callable[[Node], Iterable[Node]]) -> bool:
+    """
+    Args:
+        order: The nodes of the graph
+        neighbors: A function, returning the neighbors of a given node
+    Returns:
+        Whether the neighbors of each node, which come before it in the given order, form a clique. For a lexicographic breadth-first search order, this is the case exactly when the graph is chordal
+    """
+    position, required = {u: i for i, u in enumerate(order)}, {u: [] for u in order}
+    for i, u in enumerate(order):
+        if earlier := [v for v in neighbors(u) if position[v] < i]:
+            last = max(earlier, key=position.get)
+            required[last] += [v for v in earlier if v != last]
+    return all(set(required[u]).issubset(neighbors(u)) for u in order)
+
+
+def interval_order(nodes: Iterable[Node], neighbors: Callable[[Node], Iterable[Node]]) -> list[Node]:
+    """
+    Args:
+        nodes: The nodes of the graph
+        neighbors: A function, returning the neighbors of a given node
+    Returns:
+        An order of the nodes, in which the neighbors of each node, that come after it, come right after it, or an empty list, if the graph isn't an interval graph
+    """
+
+    def split(g, part, right):
+        members[g] -= part
+        members.append(part), stack.append(h := len(before))
+        for i in part:
+            group[i] = h
+        if right:
+            before.append(g), after.append(after[g])
+            if after[g] is not None:
+                before[after[g]] = h
+            after[g] = h
+        else:
+            before.append(before[g]), after.append(g)
+            if before[g] is not None:
+                after[before[g]] = h
+            before[g] = h
+        pivots.extend(u for i in min(part, members[g], key=len) for u in cliques[i] if len(at[u]) > 1)
+
+    def refine(x):
+        counts = Counter(group[i] for i in at[x])
+        if len(counts) < 2:
+            return True
+        first = last = next(iter(counts))
+        while before[first] in counts:
+            first = before[first]
+        while after[last] in counts:
+            last = after[last]
+        g, run = first, [first]
+        while g != last:
+            run.append(g := after[g])
+        if len(run) != len(counts) or any(counts[g] != len(members[g]) for g in run[1:-1]):
+            return False
+        if counts[first] != len(members[first]):
+            split(first, members[first].intersection(at[x]), True)
+        if counts[last] != len(members[last]):
+            split(last, members[last].intersection(at[x]), False)
+        done.add(x)
+        return True
+
+    order = lex_bfs(list(nodes), neighbors)
+    position = {u: i for i, u in enumerate(order)}
+    adjacency = [[position[v] for v in neighbors(u)] for u in order]
+    if not elimination_ordering(list(range(len(order))), adjacency.__getitem__):
+        return []
+    earlier, covered = [[j for j in adjacency[i] if j < i] for i in range(len(order))], set()
+    for i in range(len(order)):
+        if earlier[i] and len(earlier[j := max(earlier[i])]) + 1 == len(earlier[i]):
+            covered.add(j)
+    cliques = [[i, *earlier[i]] for i in range(len(order)) if i not in covered]
+    at = [[] for _ in order]
+    for i, clique in enumerate(cliques):
+        for u in clique:
+            at[u].append(i)
+    members, group, before, after = [set(range(len(cliques)))], [0] * len(cliques), [None], [None]
+    pivots, stack, done, q = [], [0], set(), 0
+    while True:
+        while pivots:
+            if (x := pivots.pop()) not in done and not refine(x):
+                return []
+        while stack and len(members[stack[-1]]) < 2:
+            stack.pop()
+        if not stack:
+            break
+        q = stack[-1]
+        inner = {u for i in members[q] for u in cliques[i] if
+                 len(at[u]) < len(members[q]) and all(group[j] == q for j in at[u])}
+        components, rest = [], set(inner)
+        while rest:
+            component = {v for v, _, _ in breadth_first(rest.pop(), lambda x: inner.intersection(adjacency[x]))}
+            components.append(component), rest.difference_update(component)
+        if len(components) > 1:
+            for component in components[1:]:
+                split(q, {i for u in component for i in at[u]}, True)
+        elif len(members[q]) == len(cliques):
+            split(q, {at[max(inner)][0]}, True)
+        else:
+            split(q, {at[lex_bfs(list(inner), lambda x: inner.intersection(adjacency[x]))[-1]][0]}, True)
+    while before[q] is not None:
+        q = before[q]
+    starts = {}
+    while q is not None:
+        for i in members[q]:
+            for u in cliques[i]:
+                starts.setdefault(u, len(starts))
+        q = after[q]
+    result = sorted(range(len(order)), key=starts.get)
+    return [order[i] for i in result] if interval_ordering(result, adjacency.__getitem__) else []
+
+
+def degeneracy_order(nodes: Iterable[Node], neighbors: Callable[[Node], Iterable[Node]]) -> list[Node]:
+    """
+    Args:
+        nodes: The nodes of an undirected graph
+        neighbors: A function, returning the neighbors of a node
+    Returns:
+        The nodes in the order, in which they are removed, when a node of minimal degree is removed each time. Every node has at most as many neighbors after it, as the degeneracy of the graph
+    """
+    degrees = {u: len(neighbors(u)) for u in nodes}
+    buckets = [set() for _ in range(max(degrees.values(), default=0) + 1)]
+    for u, d in degrees.items():
+        buckets[d].add(u)
+    result, d = [], 0
+    for _ in range(len(degrees)):
+        d = max(d - 1, 0)
+        while not buckets[d]:
+            d += 1
+        result.append(u := buckets[d].pop())
+        degrees[u] = -1
+        for v in neighbors(u):
+            if (k := degrees[v]) > 0:
+                buckets[k].remove(v), buckets[k - 1].add(v)
+                degrees[v] = k - 1
+    return result
+
+
+def bron_kerbosch(clique: set[Node], candidates: set[Node], excluded: set[Node],
+                  neighbors: Callable[[Node], Iterable[Node]]) -> Iterator[set[Node]]:
+    """
+    Args:
+        clique: A clique, that every generated one extends
+        candidates: The nodes, that can extend the clique. They get consumed
+        excluded: The nodes, that can extend the clique, but are already covered. They get consumed
+        neighbors: A function, returning the neighbors of a node
+    Returns:
+        A generator of all maximal by inclusion cliques, that extend the given one with candidates and don't contain excluded nodes
+    The branch on the candidates, that aren't neighbors of a pivot with most neighbors among the candidates, is skipped (Tomita et al.)
+    """
+    if not candidates:
+        if not excluded:
+            yield set(clique)
+        return
+    pivot = max(candidates | excluded, key=lambda x: len(candidates.intersection(neighbors(x))))
+    for u in candidates.difference(neighbors(pivot)):
+        yield from bron_kerbosch({*clique, u}, candidates.intersection(neighbors(u)),
+                                 excluded.intersection(neighbors(u)), neighbors)
+        candidates.remove(u), excluded.add(u)
+
+
+def maximal_cliques(nodes: Iterable[Node], neighbors: Callable[[Node], Iterable[Node]]) -> Iterator[set[Node]]:
+    """
+    Args:
+        nodes: The nodes of an undirected graph
+        neighbors: A function, returning the neighbors of a node
+    Returns:
+        A generator of all maximal by inclusion cliques in the graph. Each one is searched for among the neighbors of its first node in degeneracy order, that come after it
+    """
+    order = degeneracy_order(nodes, neighbors)
+    position = {u: i for i, u in enumerate(order)}
+    for i, u in enumerate(order):
+        later, earlier = set(), set()
+        for v in neighbors(u):
+            (later if position[v] > i else earlier).add(v)
+        yield from bron_kerbosch({u}, later, earlier, neighbors)
+
+
+def bitsets(nodes: Iterable[Node], neighbors: Callable[[Node], Iterable[Node]]) -> tuple[list[Node], list[int]]:
+    """
+    Args:
+        nodes: The nodes of a graph
+        neighbors: A function, returning the neighbors of a node among the given ones
+    Returns:
+        A list of the nodes, so that the i-th node is represented by the i-th bit of an integer, and for each node, an integer with the bits of its neighbors set
+    """
+    order = list(nodes)
+    index = {u: i for i, u in enumerate(order)}
+    return order, [sum(1 << index[v] for v in neighbors(u)) for u in order]
+
+
+def bitset_nodes(order: list[Node], mask: int) -> set[Node]:
+    """
+    Args:
+        order: The nodes, represented by the bits of an integer
+        mask: An integer
+    Returns:
+        The set of nodes, whose bits are set in the given integer
+    """
+    return {order[i] for i in bits(mask)}
+
+
+def independent_bitsets(masks: list[int], candidates: int, chosen: int = 0, excluded: int = 0,
+                        min_size: int = 0) -> Iterator[int]:
+    """
+    Args:
+        masks: The neighbors of each node as a bitset
+        candidates: The nodes, that can extend the chosen ones
+        chosen: An independent set, that every generated one extends
+        excluded: The nodes, that can extend the chosen ones, but are already covered
+        min_size: Sets with fewer nodes are skipped
+    Returns:
+        A generator of all maximal by inclusion independent sets among the chosen, candidate and excluded nodes, that extend the chosen ones and have no excluded nodes, as bitsets
+    This is the Bron-Kerbosch algorithm with pivoting, run on the complementary graph
+    """
+    if chosen.bit_count() + candidates.bit_count() < min_size:
+        return
+    if not candidates:
+        if not excluded:
+            yield chosen
+        return
+    rest, pivot = candidates | excluded, ~0
+    while rest:
+        i = (low := rest & -rest).bit_length() - 1
+        rest ^= low
+        if (candidates & (masks[i] | low)).bit_count() < (candidates & pivot).bit_count():
+            pivot = masks[i] | low
+    branch = candidates & pivot
+    while branch:
+        i = (low := branch & -branch).bit_length() - 1
+        branch ^= low
+        keep = ~(masks[i] | low)
+        yield from independent_bitsets(masks, candidates & keep, chosen | low, excluded & keep, min_size)
+        candidates ^= low
+        excluded |= low
+        if chosen.bit_count() + candidates.bit_count() < min_size:
+            return
+
+
+def bits(mask: int) -> Iterator[int]:
+    """
+    Args:
+        mask: An integer
+    Returns:
+        A generator of the positions of the set bits in the integer, from the lowest
+    """
+    while mask:
+        yield (low := mask & -mask).bit_length() - 1
+        mask ^= low
+
+
+def hamilton_bitsets(masks: list[int], start: int, ends: int) -> list[int]:
+    """
+    Args:
+        masks: The nodes, that each node points to (the neighbors of each node in an undirected graph), as a bitset
+        start: The position of the first node
+        ends: The positions of the nodes, that are allowed to be last, as a bitset
+    Returns:
+        The positions of the nodes of a Hamilton walk, that starts at start and ends in ends, if such exists, otherwise empty list
+    The search is depth-first and gives up on a partial walk, if the rest of the nodes aren't reachable from its last node through them, or if none of them could end it
+    """
+
+    def reaches_rest(x):
+        seen = frontier = masks[x] & rest
+        while frontier:
+            new = 0
+            for i in bits(frontier):
+                new |= masks[i]
+            seen |= (frontier := new & rest & ~seen)
+        return seen == rest
+
+    full = (1 << len(masks)) - 1
+    path, visited = [start], 1 << start
+    if visited == full:
+        return path if ends & visited else []
+    options = [masks[start] & ~visited]
+    while options:
+        if not (curr := options[-1]):
+            options.pop()
+            visited ^= 1 << path.pop()
+            continue
+        options[-1] ^= (low := curr & -curr)
+        visited |= low
+        if visited == full:
+            if ends & low:
+                return path + [low.bit_length() - 1]
+            visited ^= low
+            continue
+        rest = full & ~visited
+        if not ends & rest or not reaches_rest(i := low.bit_length() - 1):
+            visited ^= low
+            continue
+        path.append(i), options.append(masks[i] & rest)
+    return []
+
+
+def dominating_bitset(masks: list[int], weights: list[float]) -> int:
+    """
+    Args:
+        masks: The neighbors of each node as a bitset
+        weights: The weight of each node
+    Returns:
+        A dominating set with a minimal sum of the weights as a bitset
+    Nodes with negative weights are always taken. Otherwise, a node, that isn't dominated yet, is picked and each node, that could dominate it, is tried, as long as a lower bound of the rest of the weight can still lead to an improvement
+    """
+
+    def helper(chosen, covered, weight):
+        nonlocal result, result_weight
+        if covered == full:
+            if weight < result_weight:
+                result, result_weight = chosen, weight
+            return
+        rest = full & ~covered
+        if weight + -(-rest.bit_count() // most) * least >= result_weight:
+            return
+        u = (rest & -rest).bit_length() - 1
+        for v in sorted(bits(closed[u]), key=lambda x: weights[x] / (closed[x] & rest).bit_count()):
+            helper(chosen | 1 << v, covered | closed[v], weight + weights[v])
+
+    full = (1 << len(masks)) - 1
+    closed = [m | 1 << i for i, m in enumerate(masks)]
+    chosen = covered = weight = 0
+    for i, w in enumerate(weights):
+        if w < 0:
+            chosen, covered, weight = chosen | 1 << i, covered | closed[i], weight + w
+    most = max((c.bit_count() for c in closed), default=1)
+    least = min((w for w in weights if w >= 0), default=0)
+    result, result_weight = full, sum(weights)
+    helper(chosen, covered, weight)
+    return result
+
+
+def independent_bitset(masks: list[int], weights: list[float]) -> int:
+    """
+    Args:
+        masks: The neighbors of each node as a bitset
+        weights: The weight of each node
+    Returns:
+        An independent set with a maximal sum of the weights as a bitset
+    Only nodes with positive weights are considered. The node with most neighbors among the candidates is either taken or dropped, as long as the sum of the weights of the candidates can still lead to an improvement
+    """
+
+    def helper(chosen, candidates, weight):
+        nonlocal result, result_weight
+        if weight > result_weight:
+            result, result_weight = chosen, weight
+        if not candidates or weight + sum(weights[i] for i in bits(candidates)) <= result_weight:
+            return
+        u = max(bits(candidates), key=lambda x: (masks[x] & candidates).bit_count())
+        if not masks[u] & candidates:
+            helper(chosen | candidates, 0, weight + sum(weights[i] for i in bits(candidates)))
+            return
+        helper(chosen | 1 << u, candidates & ~masks[u] & ~(1 << u), weight + weights[u])
+        helper(chosen, candidates & ~(1 << u), weight)
+
+    result, result_weight = 0, 0
+    helper(0, sum(1 << i for i, w in enumerate(weights) if w > 0), 0)
+    return result
+
+
+def dsatur(masks: list[int]) -> list[int]:
+    """
+    Args:
+        masks: The neighbors of each node as a bitset
+    Returns:
+        The color of each node, given greedily with the DSatur heuristic. The next node to color is the one with most distinct colors among its neighbors and it gets the smallest color, that none of them has
+    """
+    colors, seen = [-1] * len(masks), [0] * len(masks)
+    heap = [(0, -m.bit_count(), i) for i, m in enumerate(masks)]
+    heapify(heap)
+    while heap:
+        saturation, _, u = heappop(heap)
+        if colors[u] >= 0 or -saturation != seen[u].bit_count():
+            continue
+        colors[u] = (c := (~seen[u] & (seen[u] + 1)).bit_length() - 1)
+        for v in bits(masks[u]):
+            if colors[v] < 0 and not seen[v] >> c & 1:
+                seen[v] |= 1 << c
+                heappush(heap, (-seen[v].bit_count(), -masks[v].bit_count(), v))
+    return colors
+
+
+def clique_bitset(masks: list[int]) -> int:
+    """
+    Args:
+        masks: The neighbors of each node as a bitset
+    Returns:
+        A large clique as a bitset, grown greedily from each node by taking the candidate with most neighbors among the candidates
+    """
+    result = 0
+    for u, candidates in enumerate(masks):
+        clique = 1 << u
+        while candidates:
+            v = max(bits(candidates), key=lambda x: (masks[x] & candidates).bit_count())
+            clique, candidates = clique | 1 << v, candidates & masks[v]
+        if clique.bit_count() > result.bit_count():
+            result = clique
+    return result
+
+
+def coloring(masks: list[int], initial: list[int] = None) -> list[int]:
+    """
+    Args:
+        masks: The neighbors of each node as a bitset
+        initial: A proper coloring to start from. If not given, the DSatur coloring is used
+    Returns:
+        The color of each node in a coloring with as few colors as possible
+    This is a branch and bound search, that colors the node with most distinct colors among its neighbors next. It starts from the initial coloring as an upper bound and from a greedy clique, whose nodes are colored in advance, as a lower bound
+    """
+
+    def paint(u, c):
+        colors[u], changed = c, []
+        for v in bits(masks[u]):
+            if not seen[v] >> c & 1:
+                seen[v] |= 1 << c
+                changed.append(v)
+        return changed
+
+    def search(k):
+        nonlocal result, upper
+        if not rest:
+            result, upper = colors.copy(), k
+            return upper == lower
+        u = max(rest, key=lambda x: (seen[x].bit_count(), masks[x].bit_count()))
+        rest.remove(u)
+        for c in range(k + 1):
+            if c + 1 >= upper:
+                break
+            if seen[u] >> c & 1:
+                continue
+            changed = paint(u, c)
+            found = search(max(k, c + 1))
+            for v in changed:
+                seen[v] ^= 1 << c
+            if found:
+                return True
+        colors[u] = -1
+        rest.add(u)
+        return False
+
+    result = dsatur(masks) if initial is None else initial
+    upper, lower = max(result, default=-1) + 1, (clique := clique_bitset(masks)).bit_count()
+    if upper == lower:
+        return result
+    colors, seen, rest = [-1] * len(masks), [0] * len(masks), set(range(len(masks))) - set(bits(clique))
+    for c, u in enumerate(bits(clique)):
+        paint(u, c)
+    search(lower)
+    return result
+
+
+def edge_coloring(links: list[tuple[Node, Node]], k: int, bipartite: bool = False) -> list[int]:
+    """
+    Args:
+        links: The links of an undirected graph as pairs of nodes
+        k: The number of available colors. It's the maximal degree for bipartite graphs and one more otherwise
+        bipartite: Whether the graph is bipartite
+    Returns:
+        The color of each link, so that links, that share a node, have different colors
+    Bipartite graphs are colored as in the proof of König's theorem: if the colors, that are free on the two ends of a link, differ, the path, that alternates them, is inverted first. Otherwise, the Misra-Gries algorithm colors each link after inverting such a path from its first end and rotating a fan around it
+    """
+    at, of = defaultdict(dict), defaultdict(dict)
+
+    def paint(x, y, c):
+        at[x][c], at[y][c], of[x][y], of[y][x] = y, x, c, c
+
+    def erase(x, y):
+        c = of[x].pop(y)
+        of[y].pop(x), at[x].pop(c), at[y].pop(c)
+        return c
+
+    def free(x):
+        return next(c for c in range(k) if c not in at[x])
+
+    def invert(x, c, d):
+        path, other = [], {c: d, d: c}
+        while c in at[x]:
+            path.append((x, y := at[x][c], c))
+            x, c = y, other[c]
+        for x, y, _ in path:
+            erase(x, y)
+        for x, y, c in path:
+            paint(x, y, other[c])
+
+    for u, v in links:
+        a, b = free(u), free(v)
+        if bipartite:
+            if a in at[v]:
+                invert(v, a, b)
+            paint(u, v, a)
+            continue
+        fan, inside = [v], {v}
+        while True:
+            for c, x in at[u].items():
+                if x not in inside and c not in at[fan[-1]]:
+                    fan.append(x), inside.add(x)
+                    break
+            else:
+                break
+        b = free(fan[-1])
+        invert(u, b, a)
+        for i, w in enumerate(fan):
+            if b not in at[w]:
+                break
+        for j in range(i):
+            paint(u, fan[j], erase(u, fan[j + 1]))
+        paint(u, fan[i], b)
+    return [of[u][v] for u, v in links]
+
+
 class Graph(ABC):
     """
     Abstract base class for graphs
@@ -261,6 +1334,56 @@ class Graph(ABC):
         """
         pass
 
+    @abstractmethod
+    def shortest_path_lengths(self, source: Node) -> dict[Node, int]:
+        """
+        Args:
+            source: A present node
+        Returns:
+            A dictionary, mapping each node, reachable from source, to the length of a shortest path to it
+        """
+        pass
+
+    @abstractmethod
+    def shortest_paths_many(self, pairs: Iterable[tuple[Node, Node]]) -> list[list[Node]]:
+        """
+        Args:
+            pairs: Pairs of present nodes (u, v)
+        Returns:
+            One shortest path from u to v for each given pair, in the same order, if such path exists, otherwise empty list
+        """
+        pass
+
+    @abstractmethod
+    def multi_source_distances(self, sources: Iterable[Node]) -> dict[Node, int]:
+        """
+        Args:
+            sources: Present nodes
+        Returns:
+            A dictionary, mapping each node, reachable from any of the sources, to its distance to the closest one
+        """
+        pass
+
+    @abstractmethod
+    def bfs(self, source: Node) -> Iterator[tuple[Node, int, Node | None]]:
+        """
+        Args:
+            source: A present node
+        Returns:
+            A generator of tuples (node, depth, parent) for all nodes, reachable from source, in BFS order
+        """
+        pass
+
+    @abstractmethod
+    def dfs(self, source: Node) -> Iterator[tuple[Node, int, Node | None]]:
+        """
+        Args:
+            source: A present node
+        Returns:
+            A generator of tuples (node, depth, parent) for all nodes, reachable from source, in DFS preorder
+        """
+        pass
+
     @abstractmethod
     def euler_tour_exists(self) -> bool:
         """
@@ -400,6 +1523,14 @@ class Graph(ABC):
         """
         pass
 
+    @abstractmethod
+    def fingerprint(self) -> str:
+        """
+        Returns:
+            A hash of the graph after Weisfeiler-Leman color refinement, which is the same for isomorphic graphs and in every process. For weighted graphs, the weights are taken into account. Graphs with the same fingerprint are still to be checked with isomorphic_bijection. It's kept until the graph changes
+        """
+        pass
+
     @abstractmethod
     def __bool__(self) -> bool:
         """
@@ -441,6 +1572,127 @@ class Graph(ABC):
         pass
 
 
+def refine(colors: list[dict[Node, Hashable]], links: list[dict[Node, dict[Node, Hashable]]]) -> list[dict[Node, int]]:
+    """
+    Args:
+        colors: For each graph, an initial color of each node
+        links: For each graph, the neighbors of each node, each with a label of the link to it
+    Returns:
+        For each graph, the color of each node after Weisfeiler-Leman color refinement. Two nodes get the same color exactly when they had the same color and the same number of neighbors of each color through links with each label. The colors are shared by all given graphs
+    """
+    ids = {}
+    colors = [{u: ids.setdefault(c, len(ids)) for u, c in curr.items()} for curr in colors]
+    while True:
+        k, ids = len(ids), {}
+        colors = [{u: ids.setdefault((c[u], frozenset(Counter((l, c[v]) for v, l in ls[u].items()).items())), len(ids))
+                   for u in c} for c, ls in zip(colors, links)]
+        if len(ids) == k:
+            return colors
+
+
+def fingerprint(colors: dict[Node, Hashable], links: dict[Node, dict[Node, Hashable]]) -> str:
+    """
+    Args:
+        colors: An initial color of each node
+        links: The neighbors of each node, each with a label of the link to it
+    Returns:
+        A hexadecimal hash of the colors of the nodes after Weisfeiler-Leman color refinement. Colors and labels are hashed by their representations, so the result doesn't depend on the process
+    """
+
+    def digest(text):
+        return blake2b(text.encode(), digest_size=16).hexdigest()
+
+    labels = {u: digest(repr(c)) for u, c in colors.items()}
+    ids = {l: digest(repr(l)) for ls in links.values() for l in set(ls.values())}
+    links = {u: [(ids[l], v) for v, l in ls.items()] for u, ls in links.items()}
+    k = len(set(labels.values()))
+    while True:
+        labels = {u: digest(c + "".join(sorted(l + labels[v] for l, v in links[u]))) for u, c in labels.items()}
+        if k == (k := len(set(labels.values()))):
+            return digest("".join(sorted(labels.values())))
+
+
+def undirected_labels(graph: "UndirectedGraph", weights: dict[Link, float]) -> dict[Node, dict[Node, float | None]]:
+    return {u: {v: weights.get(Link(u, v)) for v in graph.view.neighbors(u)} for u in graph.view.nodes}
+
+
+def directed_labels(graph: "DirectedGraph", weights: dict[tuple[Node, Node], float]) -> dict[Node, dict[Node, tuple]]:
+    result = {u: {} for u in graph.view.nodes}
+    for u in graph.view.nodes:
+        for v in graph.view.next(u):
+            result[u][v] = ((weights.get((u, v)),), result[u].get(v, (None, None))[1])
+            result[v][u] = (result[v].get(u, (None, None))[0], (weights.get((u, v)),))
+    return result
+
+
+def isomorphism(colors0: dict[Node, Hashable], colors1: dict[Node, Hashable], links0: dict[Node, dict[Node, Hashable]],
+                links1: dict[Node, dict[Node, Hashable]]) -> dict[Node, Node]:
+    """
+    Args:
+        colors0: The nodes of the first graph, each with a value, that has to be kept
+        colors1: The nodes of the second graph, each with a value, that has to be kept
+        links0: The neighbors of each node in the first graph, each with a label of the link to it, that has to be kept
+        links1: The neighbors of each node in the second graph, each with a label of the link to it, that has to be kept
+    Returns:
+        An isomorphic function between the graphs, if such exists, otherwise empty dictionary
+    Nodes are only matched to nodes with the same color after color refinement. They are matched in an order, that prefers nodes with most already ordered neighbors, then ones with rarer colors (VF2++). A pair is feasible, when the matched neighbors of both nodes correspond to each other through links with the same labels
+    """
+    if len(colors0) != len(colors1):
+        return {}
+    colors0, colors1 = refine([colors0, colors1], [links0, links1])
+    if (sizes := Counter(colors0.values())) != Counter(colors1.values()):
+        return {}
+    classes, order, placed, heap, connections, tie = defaultdict(list), [], set(), [], defaultdict(int), count()
+    for v, c in colors1.items():
+        classes[c].append(v)
+    starts = iter(sorted(colors0, key=lambda x: (sizes[colors0[x]], -len(links0[x]))))
+    while len(order) < len(colors0):
+        if not heap:
+            u = next(x for x in starts if x not in placed)
+            heappush(heap, (0, sizes[colors0[u]], -len(links0[u]), next(tie), u))
+        if (u := heappop(heap)[-1]) in placed:
+            continue
+        placed.add(u), order.append(u)
+        for v in links0[u]:
+            if v not in placed:
+                connections[v] += 1
+                heappush(heap, (-connections[v], sizes[colors0[v]], -len(links0[v]), next(tie), v))
+    position = {u: i for i, u in enumerate(order)}
+    parents = [min(filter(lambda x: position[x] < i, links0[u]), key=position.get, default=None) for i, u in
+               enumerate(order)]
+
+    def candidates(i):
+        c, p = colors0[order[i]], parents[i]
+        return iter([v for v in (classes[c] if p is None else links1[result[p]]) if colors1[v] == c and v not in used])
+
+    def feasible(u, v):
+        k = 0
+        for x, l in links0[u].items():
+            if x in result:
+                if (y := result[x]) not in links1[v] or links1[v][y] != l:
+                    return False
+                k += 1
+        return k == sum(y in used for y in links1[v])
+
+    result, used = {}, set()
+    stack = [candidates(0)] if order else []
+    while stack:
+        if (u := order[len(stack) - 1]) in result:
+            used.remove(result.pop(u))
+        for v in stack[-1]:
+            if feasible(u, v):
+                result[u] = v
+                used.add(v)
+                break
+        else:
+            stack.pop()
+            continue
+        if len(result) == len(order):
+            return result
+        stack.append(candidates(len(stack)))
+    return {}
+
+
 def combine_undirected(graph0: "UndirectedGraph", graph1: "UndirectedGraph") -> "UndirectedGraph":
     if not hasattr(graph1, "neighbors"):
         raise TypeError(f"Addition not defined between type {type(graph0).__name__} and type {type(graph1).__name__}!")
@@ -502,56 +1754,12 @@ def isomorphic_bijection_undirected(graph0: "UndirectedGraph", graph1: "Undirect
         return {}
     node_weights = hasattr(graph0, "node_weights") and hasattr(graph1, "node_weights")
     link_weights = hasattr(graph0, "link_weights") and hasattr(graph1, "link_weights")
-    if node_weights:
-        this_weights, other_weights = defaultdict(int), defaultdict(int)
-        for w in graph0.node_weights().values():
-            this_weights[w] += 1
-        for w in graph1.node_weights().values():
-            other_weights[w] += 1
-        if this_weights != other_weights:
-            return {}
-    elif len(graph0.nodes) != len(graph1.nodes):
+    if len(graph0.links) != len(graph1.links):
         return {}
-    if link_weights:
-        this_weights, other_weights = defaultdict(int), defaultdict(int)
-        for w in graph0.link_weights().values():
-            this_weights[w] += 1
-        for w in graph1.link_weights().values():
-            other_weights[w] += 1
-        if this_weights != other_weights:
-            return {}
-    elif len(graph0.links) != len(graph1.links):
-        return {}
-    this_nodes_degrees, other_nodes_degrees = defaultdict(set), defaultdict(set)
-    for n in graph0.nodes:
-        this_nodes_degrees[graph0.degrees(n)].add(n)
-    for n in graph1.nodes:
-        other_nodes_degrees[graph1.degrees(n)].add(n)
-    if any(len(this_nodes_degrees[d]) != len(other_nodes_degrees[d]) for d in this_nodes_degrees):
-        return {}
-    this_nodes_degrees = sorted(map(list, this_nodes_degrees.values()), key=len)
-    other_nodes_degrees = sorted(map(list, other_nodes_degrees.values()), key=len)
-    for possibility in product(*map(permutations, this_nodes_degrees)):
-        flatten_self = sum(map(list, possibility), [])
-        flatten_other = sum(other_nodes_degrees, [])
-        map_dict = dict(zip(flatten_self, flatten_other))
-        possible = True
-        for n, u in map_dict.items():
-            for m, v in map_dict.items():
-                if node_weights and graph0.node_weights(n) != graph1.node_weights(u):
-                    possible = False
-                    break
-                link_matching = (m in graph0.neighbors(n)) == (v in graph1.neighbors(u))
-                if link_weights:
-                    link_matching = graph0.link_weights().get(Link(n, m)) == graph1.link_weights().get(Link(u, v))
-                if not link_matching or node_weights and graph0.node_weights(m) != graph1.node_weights(v):
-                    possible = False
-                    break
-            if not possible:
-                break
-        if possible:
-            return map_dict
-    return {}
+    return isomorphism(graph0.node_weights() if node_weights else dict.fromkeys(graph0.nodes),
+                       graph1.node_weights() if node_weights else dict.fromkeys(graph1.nodes),
+                       undirected_labels(graph0, graph0.link_weights() if link_weights else {}),
+                       undirected_labels(graph1, graph1.link_weights() if link_weights else {}))
 
 
 def combine_directed(graph0: "DirectedGraph", graph1: "DirectedGraph") -> "DirectedGraph":
@@ -615,56 +1823,12 @@ def isomorphic_bijection_directed(graph0: "DirectedGraph", graph1: "DirectedGrap
         return {}
     node_weights = hasattr(graph0, "node_weights") and hasattr(graph1, "node_weights")
     link_weights = hasattr(graph0, "link_weights") and hasattr(graph1, "link_weights")
-    if node_weights:
-        this_weights, other_weights = defaultdict(int), defaultdict(int)
-        for w in graph0.node_weights().values():
-            this_weights[w] += 1
-        for w in graph1.node_weights().values():
-            other_weights[w] += 1
-        if this_weights != other_weights:
-            return {}
-    elif len(graph0.nodes) != len(graph1.nodes):
+    if len(graph0.links) != len(graph1.links):
         return {}
-    if link_weights:
-        this_weights, other_weights = defaultdict(int), defaultdict(int)
-        for w in graph0.link_weights().values():
-            this_weights[w] += 1
-        for w in graph1.link_weights().values():
-            other_weights[w] += 1
-        if this_weights != other_weights:
-            return {}
-    elif len(graph0.links) != len(graph1.links):
-        return {}
-    this_nodes_degrees, other_nodes_degrees = defaultdict(set), defaultdict(set)
-    for n in graph0.nodes:
-        this_nodes_degrees[graph0.degrees(n)].add(n)
-    for n in graph1.nodes:
-        other_nodes_degrees[graph1.degrees(n)].add(n)
-    if any(len(this_nodes_degrees[d]) != len(other_nodes_degrees[d]) for d in this_nodes_degrees):
-        return {}
-    this_nodes_degrees = sorted(map(list, this_nodes_degrees.values()), key=len)
-    other_nodes_degrees = sorted(map(list, other_nodes_degrees.values()), key=len)
-    for possibility in product(*map(permutations, this_nodes_degrees)):
-        flatten_self = sum(map(list, possibility), [])
-        flatten_other = sum(other_nodes_degrees, [])
-        map_dict = dict(zip(flatten_self, flatten_other))
-        possible = True
-        for n, u in map_dict.items():
-            for m, v in map_dict.items():
-                if node_weights and graph0.node_weights(n) != graph1.node_weights(u):
-                    possible = False
-                    break
-                link_matching = (m in graph0.next(n)) == (v in graph1.next(u))
-                if link_weights:
-                    link_matching = graph0.link_weights().get((n, m)) == graph1.link_weights().get((u, v))
-                if not link_matching or node_weights and graph0.node_weights(m) != graph1.node_weights(v):
-                    possible = False
-                    break
-            if not possible:
-                break
-        if possible:
-            return map_dict
-    return {}
+    return isomorphism(graph0.node_weights() if node_weights else dict.fromkeys(graph0.nodes),
+                       graph1.node_weights() if node_weights else dict.fromkeys(graph1.nodes),
+                       directed_labels(graph0, graph0.link_weights() if link_weights else {}),
+                       directed_labels(graph1, graph1.link_weights() if link_weights else {}))
 
 
 def compare(graph0: "Graph", graph1: "Graph") -> bool:
@@ -4,31 +4,34 @@ Module for implementing directed graphs
 
 __all__ = ["DirectedGraph", "WeightedNodesDirectedGraph", "WeightedLinksDirectedGraph", "WeightedDirectedGraph"]
 
-from base import combine_directed, isomorphic_bijection_directed, compare, string
+from itertools import chain
+
+from math import inf
+
+from typing import Iterator, Callable
+
+from base import (combine_directed, isomorphic_bijection_directed, compare, string, fingerprint, directed_labels,
+                  breadth_first, multi_breadth_first, depth_first, path_to, shortest_paths, dijkstra, cheapest_path,
+                  bellman_ford, johnson, strong_components, kahn, hierholzer, bitsets, hamilton_bitsets)
+
+from storage import DirectedView
 
 from undirected_graph import *
 
 
 def scc_dag(graph: "DirectedGraph") -> "DirectedGraph":
-    node_weights = isinstance(graph, WeightedNodesDirectedGraph)
-    link_weights = isinstance(graph, WeightedLinksDirectedGraph)
-    result = type(graph)()
-    scc = graph.strongly_connected_components()
-    for s in scc:
-        result.add((Node(frozenset(s)), sum(map(graph.node_weights, s))) if node_weights else Node(frozenset(s)))
-    for u in result.nodes:
-        for v in result.nodes:
-            if u != v:
-                for x in u.value:
-                    if any(y in v.value for y in graph.next(x)):
-                        if link_weights:
-                            result.connect(v, {u: 0})
-                            for y in graph.next(x):
-                                if y in v.value:
-                                    result.increase_weight((u, v), graph.link_weights(x, y))
-                        else:
-                            result.connect(v, [u])
-    return result
+    components, ids = graph.strongly_connected_components(), graph.scc_map()
+    nodes = names = [Node(frozenset(s)) for s in components]
+    if isinstance(graph, WeightedNodesDirectedGraph):
+        weights = graph.node_weights()
+        nodes = {n: sum(map(weights.get, s)) for n, s in zip(names, components)}
+    if isinstance(graph, WeightedLinksDirectedGraph):
+        links = {}
+        for (u, v), w in graph.link_weights().items():
+            if (i := ids[u]) != (j := ids[v]):
+                links[(i, j)] = links.get((i, j), 0) + w
+        return type(graph).from_edges(((names[i], names[j], w) for (i, j), w in links.items()), nodes)
+    return type(graph).from_edges(((names[ids[u]], names[ids[v]]) for u, v in graph.view.links), nodes)
 
 
 def transposed(graph: "DirectedGraph") -> "DirectedGraph":
@@ -63,6 +66,8 @@ class DirectedGraph(Graph):
         """
         self.__nodes, self.__links = set(), set()
         self.__prev, self.__next = {}, {}
+        self.__view = DirectedView(self.__nodes, self.__links, self.__prev, self.__next)
+        self.__version, self.__scc, self._fingerprint = 0, None, None
         for u, (prev_nodes, next_nodes) in neighborhood.items():
             self.add(u)
             for v in prev_nodes:
@@ -70,6 +75,84 @@ class DirectedGraph(Graph):
             for v in next_nodes:
                 self.add(v, [u]), self.connect(v, [u])
 
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[Node, Node]], nodes: Iterable[Node] = ()) -> "DirectedGraph":
+        """
+        Args:
+            edges: An iterable of pairs of nodes (u, v), each of which is a link from u to v. Repeated links and loops are skipped
+            nodes: Nodes to add even if they have no links
+        Returns:
+            A graph, built in a single pass over the given links, which are put into the graph at once
+        """
+        res = cls()
+        prev_nodes, next_nodes = res.__prev, res.__next
+        for u in nodes:
+            if not isinstance(u, Node):
+                u = Node(u)
+            if u not in next_nodes:
+                prev_nodes[u], next_nodes[u] = set(), set()
+        for u, v in edges:
+            if not isinstance(u, Node):
+                u = Node(u)
+            if not isinstance(v, Node):
+                v = Node(v)
+            for n in (u, v):
+                if n not in next_nodes:
+                    prev_nodes[n], next_nodes[n] = set(), set()
+            if u != v:
+                next_nodes[u].add(v), prev_nodes[v].add(u)
+        res.__nodes.update(next_nodes)
+        res.__links.update((u, v) for u, targets in next_nodes.items() for v in targets)
+        return res
+
+    @classmethod
+    def from_adjacency(cls, neighborhood: dict[Node, tuple[Iterable[Node], Iterable[Node]]]) -> "DirectedGraph":
+        """
+        Args:
+            neighborhood: A dictionary with nodes for keys. The value of each node is a tuple of 2 sets of nodes. The first one is the nodes, which point to it, and the second one is the nodes it points to
+        Returns:
+            The same graph as the one, given by the constructor, but built in a single pass
+        """
+
+        def edges():
+            for u, (prev_u, next_u) in neighborhood.items():
+                for v in prev_u:
+                    yield v, u
+                for v in next_u:
+                    yield u, v
+
+        return cls.from_edges(edges(), neighborhood)
+
+    def to_edges(self) -> Iterator[tuple[Node, Node]]:
+        """
+        Returns:
+            A generator of all links as pairs of nodes (u, v), where u points to v. Nodes without links aren't given
+        """
+        yield from self.view.links
+
+    def save(self, path: str) -> None:
+        """
+        Args:
+            path: Path to the file to write
+        Save the graph in the binary graph format
+        """
+        from graph_io import save_graph
+
+        save_graph(self, path)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = False) -> "DirectedGraph":
+        """
+        Args:
+            path: Path to a file, written by the save method of the same class
+            mmap: Whether to memory-map the file instead of reading it
+        Returns:
+            The saved graph
+        """
+        from graph_io import load_graph
+
+        return load_graph(path, mmap, None, cls)
+
     @property
     def nodes(self) -> set[Node]:
         return self.__nodes.copy()
@@ -78,15 +161,23 @@ class DirectedGraph(Graph):
     def links(self) -> set[tuple[Node, Node]]:
         return self.__links.copy()
 
+    @property
+    def view(self) -> DirectedView:
+        """
+        Returns:
+            Read-only views of the nodes, the links and the adjacency of the graph, which reflect its current state without copying anything. They should not be held onto while the graph is being changed
+        """
+        return self.__view
+
     def degrees(self, u: Node = None) -> dict[Node, tuple[int, int]] | tuple[int, int]:
         """
         Get in-degree and out-degree of a given node or the same for all nodes.
         """
         if u is None:
-            return {n: self.degrees(n) for n in self.nodes}
+            return {n: self.degrees(n) for n in self.view.nodes}
         if not isinstance(u, Node):
             u = Node(u)
-        return len(self.prev(u)), len(self.next(u))
+        return len(self.view.prev(u)), len(self.view.next(u))
 
     def next(self, u: Node = None) -> dict[Node, set[Node]] | set[Node]:
         """
@@ -96,7 +187,7 @@ class DirectedGraph(Graph):
             A set of all nodes, that node u points to, if it's given, otherwise the same for all nodes
         """
         if u is None:
-            return {n: self.next(n) for n in self.nodes}
+            return {n: self.next(n) for n in self.view.nodes}
         if not isinstance(u, Node):
             u = Node(u)
         return self.__next[u].copy()
@@ -109,7 +200,7 @@ class DirectedGraph(Graph):
             A set of all nodes, that point to node u, if it's given, otherwise the same for all nodes
         """
         if u is None:
-            return {n: self.prev(n) for n in self.nodes}
+            return {n: self.prev(n) for n in self.view.nodes}
         if not isinstance(u, Node):
             u = Node(u)
         return self.__prev[u].copy()
@@ -120,7 +211,7 @@ class DirectedGraph(Graph):
         Returns:
             All sources
         """
-        return {u for u in self.nodes if self.source(u)}
+        return {u for u in self.view.nodes if self.source(u)}
 
     @property
     def sinks(self) -> set[Node]:
@@ -128,7 +219,7 @@ class DirectedGraph(Graph):
         Returns:
             All sinks
         """
-        return {v for v in self.nodes if self.sink(v)}
+        return {v for v in self.view.nodes if self.sink(v)}
 
     def source(self, n: Node) -> bool:
         """
@@ -159,6 +250,7 @@ class DirectedGraph(Graph):
         if not isinstance(u, Node):
             u = Node(u)
         if u not in self:
+            self.__version, self._fingerprint = self.__version + 1, None
             self.__nodes.add(u)
             self.__next[u], self.__prev[u] = set(), set()
             DirectedGraph.connect(self, u, pointed_by, points_to)
@@ -171,6 +263,7 @@ class DirectedGraph(Graph):
             if n in self:
                 DirectedGraph.disconnect(self, n, self.prev(n), self.next(n))
                 self.__nodes.remove(n), self.__prev.pop(n), self.__next.pop(n)
+                self.__version, self._fingerprint = self.__version + 1, None
         return self
 
     def connect(self, u: Node, pointed_by: Iterable[Node] = (), points_to: Iterable[Node] = ()) -> "DirectedGraph":
@@ -184,17 +277,18 @@ class DirectedGraph(Graph):
         if not isinstance(u, Node):
             u = Node(u)
         if u in self:
+            self.__version, self._fingerprint = self.__version + 1, None
             for v in pointed_by:
                 if not isinstance(v, Node):
                     v = Node(v)
-                if u != v and v not in self.prev(u) and v in self:
+                if u != v and v not in self.view.prev(u) and v in self:
                     self.__links.add((v, u))
                     self.__prev[u].add(v)
                     self.__next[v].add(u)
             for v in points_to:
                 if not isinstance(v, Node):
                     v = Node(v)
-                if u != v and v not in self.next(u) and v in self:
+                if u != v and v not in self.view.next(u) and v in self:
                     self.__links.add((u, v))
                     self.__prev[v].add(u)
                     self.__next[u].add(v)
@@ -218,17 +312,18 @@ class DirectedGraph(Graph):
         if not isinstance(u, Node):
             u = Node(u)
         if u in self:
+            self.__version, self._fingerprint = self.__version + 1, None
             for v in pointed_by:
                 if not isinstance(v, Node):
                     v = Node(v)
-                if v in self.prev(u):
+                if v in self.view.prev(u):
                     self.__links.remove((v, u))
                     self.__next[v].remove(u)
                     self.__prev[u].remove(v)
             for v in points_to:
                 if not isinstance(v, Node):
                     v = Node(v)
-                if v in self.next(u):
+                if v in self.view.next(u):
                     self.__links.remove((u, v))
                     self.__next[u].remove(v)
                     self.__prev[v].remove(u)
@@ -286,8 +381,13 @@ class DirectedGraph(Graph):
             rest -= curr.nodes
         return components
 
+    def __neighbors(self, u: Node) -> Iterator[Node]:
+        return chain(self.view.prev(u), self.view.next(u))
+
     def connected(self) -> bool:
-        return DirectedGraph.undirected(self).connected()
+        if not self:
+            return True
+        return sum(1 for _ in breadth_first(next(iter(self.view.nodes)), self.__neighbors)) == len(self.view.nodes)
 
     def reachable(self, u: Node, v: Node) -> bool:
         if not isinstance(u, Node):
@@ -296,13 +396,7 @@ class DirectedGraph(Graph):
             v = Node(v)
         if u not in self or v not in self:
             raise KeyError("Unrecognized node(s).")
-        queue, total = [u], {u}
-        while queue:
-            if (n := queue.pop(0)) == v:
-                return True
-            queue += (new := self.next(n) - total)
-            total.update(new)
-        return False
+        return any(n == v for n, _, _ in breadth_first(u, self.view.next))
 
     def component(self, u: Node) -> "DirectedGraph":
         """
@@ -315,61 +409,35 @@ class DirectedGraph(Graph):
             u = Node(u)
         if u not in self:
             raise KeyError("Unrecognized node!")
-        queue, total = [u], {u}
-        while queue:
-            queue += list(next_nodes := self.prev(v := queue.pop(0)).union(self.next(v)) - total)
-            total.update(next_nodes)
-        return self.subgraph(total)
+        return self.subgraph({n for n, _, _ in breadth_first(u, self.__neighbors)})
 
     def full(self) -> bool:
-        return len(self.links) == (n := len(self.nodes)) * (n - 1)
+        return len(self.view.links) == (n := len(self.view.nodes)) * (n - 1)
 
     def subgraph(self, u_or_nodes: Node | Iterable[Node]) -> "DirectedGraph":
         try:
-            u_or_nodes = self.nodes.intersection(u_or_nodes)
-            return DirectedGraph({u: ([], self.next(u).intersection(u_or_nodes)) for u in u_or_nodes})
+            u_or_nodes = self.view.nodes.intersection(u_or_nodes)
+            return DirectedGraph({u: ([], u_or_nodes.intersection(self.view.next(u))) for u in u_or_nodes})
         except TypeError:
             if not isinstance(u_or_nodes, Node):
                 u_or_nodes = Node(u_or_nodes)
             if u_or_nodes not in self:
                 raise KeyError("Unrecognized node!")
-            queue, res = [u_or_nodes], DirectedGraph({u_or_nodes: ([], [])})
-            while queue:
-                for n in self.next(v := queue.pop(0)):
-                    if n in res:
-                        res.connect(n, [v])
-                    else:
-                        res.add(n, [v]), queue.append(n)
-            return res
+            return self.subgraph({n for n, _, _ in breadth_first(u_or_nodes, self.view.next)})
 
     def dag(self) -> bool:
         """
         Returns:
             Whether the graph is a DAG (directed acyclic graph)
         """
+        return bool(self) and not self.find_cycle()
 
-        def dfs(u):
-            for v in self.next(u):
-                if v in total:
-                    continue
-                if v in stack:
-                    return False
-                stack.add(v)
-                if not dfs(v):
-                    return False
-                stack.remove(v)
-            total.add(u)
-            return True
-
-        sources, total, stack = self.sources, set(), set()
-        if not sources or not self.sinks:
-            return False
-        for n in sources:
-            stack.add(n)
-            if not dfs(n):
-                return False
-            stack.remove(n)
-        return total == self.nodes
+    def find_cycle(self) -> list[Node]:
+        """
+        Returns:
+            A cycle in the graph as a list of nodes, which starts and ends with the same node, if such exists, otherwise an empty list
+        """
+        return kahn(self.view.nodes, self.view.prev, self.view.next)[1]
 
     def toposort(self) -> list[Node]:
         """
@@ -377,17 +445,16 @@ class DirectedGraph(Graph):
             A topological sort of the nodes if the graph is a DAG, otherwise an empty list
         A topological sort has the following property: Let u and v be nodes in the graph and let u come before v. Then there's no path from v to u in the graph. (That's also the reason a graph with cycles has no topological sort)
         """
-        if not self.dag():
-            return []
-        tmp = DirectedGraph.copy(self)
-        layer, res = tmp.sources, []
-        while layer:
-            res.append(u := layer.pop())
-            for v in tmp.next(u):
-                tmp.disconnect(v, {u})
-                if tmp.source(v):
-                    layer.add(v)
-        return res
+        generations, cycle = kahn(self.view.nodes, self.view.prev, self.view.next)
+        return [] if cycle else [u for layer in generations for u in layer]
+
+    def toposort_generations(self) -> list[set[Node]]:
+        """
+        Returns:
+            The nodes, split into generations, if the graph is a DAG, otherwise an empty list. Each generation is the set of nodes, that are only pointed by nodes in earlier generations, so there's no path between two nodes in the same one
+        """
+        generations, cycle = kahn(self.view.nodes, self.view.prev, self.view.next)
+        return [] if cycle else list(map(set, generations))
 
     def get_shortest_path(self, u: Node, v: Node) -> list[Node]:
         if not isinstance(u, Node):
@@ -396,19 +463,41 @@ class DirectedGraph(Graph):
             v = Node(v)
         if u not in self or v not in self:
             raise KeyError("Unrecognized node(s)!")
-        previous, queue, total = {}, [u], {u}
-        while queue:
-            if (n := queue.pop(0)) == v:
-                result, curr_node = [n], n
-                while curr_node != u:
-                    result.insert(0, previous[curr_node])
-                    curr_node = previous[curr_node]
-                return result
-            for y in self.next(n) - total:
-                queue.append(y), total.add(y)
-                previous[y] = n
+        parents = {}
+        for n, _, _ in breadth_first(u, self.view.next, parents):
+            if n == v:
+                return path_to(parents, v)
         return []
 
+    def shortest_path_lengths(self, source: Node) -> dict[Node, int]:
+        return {n: d for n, d, _ in self.bfs(source)}
+
+    def shortest_paths_many(self, pairs: Iterable[tuple[Node, Node]]) -> list[list[Node]]:
+        pairs = [(u if isinstance(u, Node) else Node(u), v if isinstance(v, Node) else Node(v)) for u, v in pairs]
+        if any(u not in self or v not in self for u, v in pairs):
+            raise KeyError("Unrecognized node(s)!")
+        return shortest_paths(pairs, self.view.next)
+
+    def multi_source_distances(self, sources: Iterable[Node]) -> dict[Node, int]:
+        sources = [u if isinstance(u, Node) else Node(u) for u in sources]
+        if any(u not in self for u in sources):
+            raise KeyError("Unrecognized node(s)!")
+        return {n: d for n, d, _ in multi_breadth_first(sources, self.view.next)}
+
+    def bfs(self, source: Node) -> Iterator[tuple[Node, int, Node | None]]:
+        if not isinstance(source, Node):
+            source = Node(source)
+        if source not in self:
+            raise KeyError("Unrecognized node!")
+        return breadth_first(source, self.view.next)
+
+    def dfs(self, source: Node) -> Iterator[tuple[Node, int, Node | None]]:
+        if not isinstance(source, Node):
+            source = Node(source)
+        if source not in self:
+            raise KeyError("Unrecognized node!")
+        return depth_first(source, self.view.next)
+
     def euler_tour_exists(self) -> bool:
         for d in self.degrees().values():
             if d[0] != d[1]:
@@ -430,32 +519,41 @@ class DirectedGraph(Graph):
         return self.connected()
 
     def euler_tour(self) -> list[Node]:
-        if self.euler_tour_exists():
-            tmp = DirectedGraph.copy(self)
-            return tmp.disconnect(u := (l := tmp.links.pop())[1], [v := l[0]]).euler_walk(u, v) + [u]
-        return []
+        return list(self.iter_euler_tour())
 
     def euler_walk(self, u: Node, v: Node) -> list[Node]:
+        return list(self.iter_euler_walk(u, v))
+
+    def iter_euler_tour(self) -> Iterator[Node]:
+        """
+        Returns:
+            A generator of the nodes of an Euler tour, which starts and ends with the same node, if such exists, otherwise an empty generator. The graph shouldn't be changed while it's being generated
+        """
+        if not self.view.nodes or not self.euler_tour_exists():
+            return iter(())
+        u = next((n for n in self.view.nodes if self.view.next(n)), next(iter(self.view.nodes)))
+        return hierholzer(u, self.view.prev)
+
+    def iter_euler_walk(self, u: Node, v: Node) -> Iterator[Node]:
+        """
+        Args:
+            u: First given node
+            v: Second given node
+        Returns:
+            A generator of the nodes of an Euler walk from u to v, if such exists, otherwise an empty generator. The graph shouldn't be changed while it's being generated
+        """
         if not isinstance(u, Node):
             u = Node(u)
         if not isinstance(v, Node):
             v = Node(v)
-        if u not in self or v not in self:
-            raise KeyError("Unrecognized node(s)!")
-        if self.euler_walk_exists(u, v):
-            path = self.get_shortest_path(u, v)
-            tmp = DirectedGraph.copy(self)
-            for i in range(len(path) - 1):
-                tmp.disconnect(path[i + 1], [path[i]])
-            for i, u in enumerate(path):
-                while tmp.next(u):
-                    curr = tmp.disconnect(v := tmp.next(u).pop(), [u]).get_shortest_path(v, u)
-                    for j in range(len(curr) - 1):
-                        tmp.disconnect(curr[j + 1], [curr[j]])
-                    while curr:
-                        path.insert(i + 1, curr.pop())
-            return path
-        return []
+        if not self.euler_walk_exists(u, v):
+            return iter(())
+        return hierholzer(v, self.view.prev)
+
+    def __components(self) -> tuple[list[set[Node]], dict[Node, int]]:
+        if self.__scc is None or self.__scc[0] != self.__version:
+            self.__scc = self.__version, *strong_components(self.view.nodes, self.view.next)
+        return self.__scc[1:]
 
     def strongly_connected_component(self, n: Node) -> set[Node]:
         """
@@ -465,54 +563,27 @@ class DirectedGraph(Graph):
             The maximal by inclusion strongly-connected component, to which a given node belongs
         A strongly-connected component is a set of nodes, where there exists a path from every node to every other node
         """
-
-        def helper(x):
-            def bfs(s):
-                previous, queue, so_far = {}, [s], {s}
-                while queue:
-                    for t in self.next(_s := queue.pop(0)) - so_far:
-                        previous[t] = _s
-                        if t in path:
-                            node = t
-                            while node != s:
-                                path.append(previous[node])
-                                node = previous[node]
-                            return
-                        queue.append(t), so_far.add(t)
-
-            for y in self.prev(x) - total:
-                if path := self.get_shortest_path(x, y):
-                    for u in path:
-                        res.add(u), total.add(u)
-                        for v in self.next(u):
-                            if v not in total and v not in path:
-                                bfs(v)
-                    return
-            res.add(x)
-
         if not isinstance(n, Node):
             n = Node(n)
-        res, total = set(), {n}
-        helper(n)
-        return res
+        if n not in self:
+            raise KeyError("Unrecognized node!")
+        components, ids = self.__components()
+        return components[ids[n]].copy()
 
     def strongly_connected_components(self) -> list[set[Node]]:
         """
         Returns:
-            A list of all strongly-connected components of the graph
-        """
-        if not self.connected():
-            return sum(
-                map(lambda x: x.strongly_connected_components(), self.connection_components()), [])
-        if self.dag():
-            return list(map(lambda x: {x}, self.nodes))
-        if not self.sources and not self.sinks:
-            return [self.nodes]
-        rest, res = self.nodes, []
-        while rest:
-            res.append(curr := self.strongly_connected_component(rest.copy().pop()))
-            rest -= curr
-        return res
+            A list of all strongly-connected components of the graph. A component comes before all components, from which it can be reached
+        """
+        return [s.copy() for s in self.__components()[0]]
+
+    def scc_map(self) -> dict[Node, int]:
+        """
+        Returns:
+            A dictionary, mapping each node to the index of its strongly-connected component in the list, returned by strongly_connected_components()
+        The components are found in one pass over the graph, the result of which is kept until the graph is changed
+        """
+        return self.__components()[1].copy()
 
     def scc_dag(self) -> "DirectedGraph":
         """
@@ -540,7 +611,7 @@ class DirectedGraph(Graph):
         def dfs(x, l, stack):
             if not l:
                 return (list(map(lambda link: link[0], stack)) + [v]) if x == v else []
-            for y in filter(lambda _x: (x, _x) not in stack, self.next(x)):
+            for y in filter(lambda _x: (x, _x) not in stack, self.view.next(x)):
                 res = dfs(y, l - 1, stack + [(x, y)])
                 if res:
                     return res
@@ -562,28 +633,10 @@ class DirectedGraph(Graph):
         return dfs(u, length, [])
 
     def hamilton_tour_exists(self) -> bool:
-        def dfs(x):
-            if tmp.nodes == {x}:
-                return x in can_end_in
-            if all(y not in tmp for y in can_end_in):
-                return False
-            tmp0, tmp1 = tmp.prev(x), tmp.next(x)
-            tmp.remove(x)
-            for y in tmp1:
-                if dfs(y):
-                    tmp.add(x, tmp0, tmp1)
-                    return True
-            tmp.add(x, tmp0, tmp1)
-            return False
-
-        if (n := len(self.nodes)) == 1 or len(self.links) > (n - 1) ** 2 or all(
-                sum(self.degrees(u)) >= n for u in self.nodes):
+        if (n := len(self.view.nodes)) == 1 or len(self.view.links) > (n - 1) ** 2 or all(
+                sum(self.degrees(u)) >= n for u in self.view.nodes):
             return True
-        if self.sources or self.sinks:
-            return False
-        tmp = DirectedGraph.copy(self)
-        can_end_in = tmp.prev(u := self.nodes.pop())
-        return dfs(u)
+        return bool(self.hamilton_tour())
 
     def hamilton_walk_exists(self, u: Node, v: Node) -> bool:
         if not isinstance(u, Node):
@@ -592,71 +645,51 @@ class DirectedGraph(Graph):
             v = Node(v)
         if u not in self or v not in self:
             raise KeyError("Unrecognized node(s).")
-        if u in self.next(v):
-            return True if all(n in {u, v} for n in self.nodes) else self.hamilton_tour_exists()
-        return DirectedGraph.copy(self).connect(u, [v]).hamilton_tour_exists()
+        return bool(self.hamilton_walk(u, v))
 
     def hamilton_tour(self) -> list[Node]:
         if self.sources or self.sinks or not self:
             return []
-        u = self.nodes.pop()
-        for v in self.prev(u):
-            if result := self.hamilton_walk(u, v):
-                return result + [u]
+        order, masks = bitsets(self.view.nodes, self.view.next)
+        if path := hamilton_bitsets(masks, 0, sum(1 << i for i, m in enumerate(masks) if m & 1)):
+            return [order[i] for i in path] + [order[0]]
         return []
 
     def hamilton_walk(self, u: Node = None, v: Node = None) -> list[Node]:
-        def dfs(x, stack):
-            too_many = v is not None
-            for n in tmp.nodes:
-                if not tmp.degrees(n)[0] and n != x:
-                    return []
-                if not tmp.degrees(n)[1] and n != v:
-                    if too_many:
-                        return []
-                    too_many = True
-            prev_x, next_x = tmp.prev(x), tmp.next(x)
-            tmp.remove(x)
-            if not tmp:
-                tmp.add(x, prev_x, next_x)
-                return stack
-            for y in next_x:
-                if y == v:
-                    if tmp.nodes == {v}:
-                        tmp.add(x, prev_x, next_x)
-                        return stack + [v]
-                    continue
-                if res := dfs(y, stack + [y]):
-                    tmp.add(x, prev_x, next_x)
-                    return res
-            tmp.add(x, prev_x, next_x)
-            return []
-
-        tmp = DirectedGraph.copy(self)
-        if u is None:
-            if v is not None and v not in self:
-                raise KeyError("Unrecognized node.")
-            if self.dag() and (v is None or self.sink(v)):
-                if any(self.degrees(n)[0] > 1 or self.degrees(n)[1] > 1 for n in self.nodes):
-                    return []
-                return self.toposort()
-            for _u in self.nodes:
-                if result := dfs(_u, [_u]):
-                    return result
-            return []
-        if not isinstance(u, Node):
+        if u is not None and not isinstance(u, Node):
             u = Node(u)
         if v is not None and not isinstance(v, Node):
             v = Node(v)
-        if u not in self or v is not None and v not in self:
+        if u is not None and u not in self or v is not None and v not in self:
             raise KeyError("Unrecognized node(s).")
-        return dfs(u, [u])
+        if u is None and self.dag():
+            order = self.toposort()
+            if v is not None and order[-1] != v or any(y not in self.view.next(x) for x, y in zip(order, order[1:])):
+                return []
+            return order
+        order, masks = bitsets(self.view.nodes, self.view.next)
+        index = {x: i for i, x in enumerate(order)}
+        ends = (1 << len(order)) - 1 if v is None else 1 << index[v]
+        starts = [index[u]] if u is not None else range(len(order))
+        if u is None and (sources := [i for i, x in enumerate(order) if not self.view.prev(x)]):
+            starts = sources[:1]
+        for s in starts:
+            if path := hamilton_bitsets(masks, s, ends):
+                return [order[i] for i in path]
+        return []
 
     def isomorphic_bijection(self, other: "DirectedGraph") -> dict[Node, Node]:
         return isomorphic_bijection_directed(self, other)
 
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            self._fingerprint = fingerprint(
+                self.node_weights() if hasattr(self, "node_weights") else dict.fromkeys(self.view.nodes),
+                directed_labels(self, self.link_weights() if hasattr(self, "link_weights") else {}))
+        return self._fingerprint
+
     def __bool__(self) -> bool:
-        return bool(self.nodes)
+        return bool(self.view.nodes)
 
     def __reversed__(self) -> "DirectedGraph":
         return self.transposed()
@@ -664,7 +697,7 @@ class DirectedGraph(Graph):
     def __contains__(self, u: Node) -> bool:
         if not isinstance(u, Node):
             u = Node(u)
-        return u in self.nodes
+        return u in self.view.nodes
 
     def __add__(self, other: "DirectedGraph") -> "DirectedGraph":
         """
@@ -696,7 +729,7 @@ class WeightedNodesDirectedGraph(DirectedGraph):
             neighborhood: A dictionary with nodes for keys. The value of each node is a tuple with 2 elements. The first one is the node's weight. The second one is a tuple with 2 sets of nodes. The first one is the nodes, that point to it, and the second one are the nodes it points to
         """
         super().__init__()
-        self.__node_weights = {}
+        self.__node_weights, self._negative_nodes = {}, 0
         for n, (w, _) in neighborhood.items():
             self.add((n, w))
         for u, (_, (prev_u, next_u)) in neighborhood.items():
@@ -705,6 +738,44 @@ class WeightedNodesDirectedGraph(DirectedGraph):
             for v in next_u:
                 self.add((v, 0), [u]), self.connect(v, [u])
 
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[Node, Node]],
+                   nodes: dict[Node, float] = {}) -> "WeightedNodesDirectedGraph":
+        """
+        Args:
+            edges: An iterable of pairs of nodes (u, v), each of which is a link from u to v. Repeated links and loops are skipped
+            nodes: A dictionary of node weights. Nodes, that aren't in it, get a weight of 0
+        Returns:
+            A graph, built in a single pass over the given links, which are put into the graph at once
+        """
+        try:
+            weights = {(u if isinstance(u, Node) else Node(u)): float(w) for u, w in nodes.items()}
+        except (TypeError, ValueError):
+            raise TypeError("Real value expected!")
+        res = super().from_edges(edges, weights)
+        res.__node_weights.update((u, weights.get(u, 0.0)) for u in res.view.nodes)
+        res._negative_nodes = sum(w < 0 for w in res.__node_weights.values())
+        return res
+
+    @classmethod
+    def from_adjacency(cls, neighborhood: dict[Node, tuple[float, tuple[Iterable[Node], Iterable[Node]]]]
+                       ) -> "WeightedNodesDirectedGraph":
+        """
+        Args:
+            neighborhood: A dictionary with nodes for keys. The value of each node is a tuple with 2 elements. The first one is the node's weight. The second one is a tuple with 2 sets of nodes. The first one is the nodes, that point to it, and the second one are the nodes it points to
+        Returns:
+            The same graph as the one, given by the constructor, but built in a single pass
+        """
+
+        def edges():
+            for u, (_, (prev_u, next_u)) in neighborhood.items():
+                for v in prev_u:
+                    yield v, u
+                for v in next_u:
+                    yield u, v
+
+        return cls.from_edges(edges(), {u: w for u, (w, _) in neighborhood.items()})
+
     def node_weights(self, n: Node = None) -> dict[Node, float] | float:
         """
         Args:
@@ -728,7 +799,7 @@ class WeightedNodesDirectedGraph(DirectedGraph):
             points_to: Iterable[Node] = ()) -> "WeightedNodesDirectedGraph":
         DirectedGraph.add(self, n_w[0], pointed_by, points_to)
         n = n_w[0] if isinstance(n_w[0], Node) else Node(n_w[0])
-        if n not in self.node_weights():
+        if n not in self.__node_weights:
             self.set_weight(*n_w)
         return self
 
@@ -736,8 +807,8 @@ class WeightedNodesDirectedGraph(DirectedGraph):
         for n in {u, *rest}:
             if not isinstance(n, Node):
                 n = Node(n)
-            if n in self.node_weights():
-                self.__node_weights.pop(n)
+            if n in self.__node_weights:
+                self._negative_nodes -= self.__node_weights.pop(n) < 0
         DirectedGraph.remove(self, u, *rest)
         return self
 
@@ -752,9 +823,11 @@ class WeightedNodesDirectedGraph(DirectedGraph):
             u = Node(u)
         if u in self:
             try:
-                self.__node_weights[u] = float(w)
+                w = float(w)
             except ValueError:
                 raise TypeError("Real value expected!")
+            self._negative_nodes += (w < 0) - (self.__node_weights.get(u, 0.0) < 0)
+            self.__node_weights[u], self._fingerprint = w, None
         return self
 
     def increase_weight(self, u: Node, w: float) -> "WeightedNodesDirectedGraph":
@@ -766,9 +839,9 @@ class WeightedNodesDirectedGraph(DirectedGraph):
         """
         if not isinstance(u, Node):
             u = Node(u)
-        if u in self.node_weights():
+        if u in self.__node_weights:
             try:
-                self.set_weight(u, self.node_weights(u) + float(w))
+                self.set_weight(u, self.__node_weights[u] + float(w))
             except ValueError:
                 raise TypeError("Real value expected!")
         return self
@@ -789,23 +862,16 @@ class WeightedNodesDirectedGraph(DirectedGraph):
 
     def subgraph(self, u_or_nodes: Node | Iterable[Node]) -> "WeightedNodesDirectedGraph":
         try:
-            u_or_nodes = self.nodes.intersection(u_or_nodes)
-            neighborhood = {u: (self.node_weights(u), ([], self.next(u).intersection(u_or_nodes))) for u in u_or_nodes}
+            u_or_nodes = self.view.nodes.intersection(u_or_nodes)
+            neighborhood = {u: (self.node_weights(u), ([], u_or_nodes.intersection(self.view.next(u)))) for u in
+                            u_or_nodes}
             return WeightedNodesDirectedGraph(neighborhood)
         except TypeError:
             if not isinstance(u_or_nodes, Node):
                 u_or_nodes = Node(u_or_nodes)
             if u_or_nodes not in self:
                 raise KeyError("Unrecognized node!")
-            queue = [u_or_nodes]
-            res = WeightedNodesDirectedGraph({u_or_nodes: (self.node_weights(u_or_nodes), ([], []))})
-            while queue:
-                for n in self.next(v := queue.pop(0)):
-                    if n in res:
-                        res.connect(n, [v])
-                    else:
-                        res.add((n, self.node_weights(n)), [v]), queue.append(n)
-            return res
+            return self.subgraph({n for n, _, _ in breadth_first(u_or_nodes, self.view.next)})
 
     def minimal_path_nodes(self, u: Node, v: Node) -> list[Node]:
         """
@@ -815,7 +881,16 @@ class WeightedNodesDirectedGraph(DirectedGraph):
         Returns:
             A path between u and v with the least possible sum of node weights
         """
-        return self.weighted_graph().minimal_path(u, v)
+        if not isinstance(u, Node):
+            u = Node(u)
+        if not isinstance(v, Node):
+            v = Node(v)
+        if u not in self or v not in self:
+            raise KeyError("Unrecognized node(s)!")
+        if self._negative_nodes:
+            return self.weighted_graph().minimal_path(u, v)
+        weights = self.__node_weights
+        return cheapest_path(u, v, weights[u], lambda x: ((y, weights[y]) for y in self.view.next(x)))[0]
 
 
 class WeightedLinksDirectedGraph(DirectedGraph):
@@ -829,7 +904,7 @@ class WeightedLinksDirectedGraph(DirectedGraph):
             neighborhood: A dictionary with nodes for keys. The value of each node is a tuple with 2 dictionaries. The first one contains the nodes, which point to it, and the second one contains the nodes it points to. The values in these dictionaries are the link weights
         """
         super().__init__()
-        self.__link_weights = {}
+        self.__link_weights, self._negative_links = {}, 0
         for u, (prev_pairs, next_pairs) in neighborhood.items():
             if u not in self:
                 self.add(u)
@@ -838,6 +913,63 @@ class WeightedLinksDirectedGraph(DirectedGraph):
             for v, w in next_pairs.items():
                 self.add(v, {u: w}), self.connect(v, {u: w})
 
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[Node, Node, float]],
+                   nodes: Iterable[Node] = ()) -> "WeightedLinksDirectedGraph":
+        """
+        Args:
+            edges: An iterable of triples (u, v, w), each of which is a link from u to v with a weight of w. Loops are skipped and only the first weight of a repeated link is kept
+            nodes: Nodes to add even if they have no links
+        Returns:
+            A graph, built in a single pass over the given links, which are put into the graph at once
+        """
+
+        def pairs():
+            for u, v, w in edges:
+                if not isinstance(u, Node):
+                    u = Node(u)
+                if not isinstance(v, Node):
+                    v = Node(v)
+                try:
+                    if u != v:
+                        weights.setdefault((u, v), float(w))
+                except (TypeError, ValueError):
+                    raise TypeError("Real value expected!")
+                yield u, v
+
+        weights = {}
+        res = super().from_edges(pairs(), nodes)
+        res.__link_weights.update(weights)
+        res._negative_links = sum(w < 0 for w in weights.values())
+        return res
+
+    @classmethod
+    def from_adjacency(cls, neighborhood: dict[Node, tuple[dict[Node, float], dict[Node, float]]]
+                       ) -> "WeightedLinksDirectedGraph":
+        """
+        Args:
+            neighborhood: A dictionary with nodes for keys. The value of each node is a tuple with 2 dictionaries. The first one contains the nodes, which point to it, and the second one contains the nodes it points to. The values in these dictionaries are the link weights
+        Returns:
+            The same graph as the one, given by the constructor, but built in a single pass
+        """
+
+        def edges():
+            for u, (prev_u, next_u) in neighborhood.items():
+                for v, w in prev_u.items():
+                    yield v, u, w
+                for v, w in next_u.items():
+                    yield u, v, w
+
+        return cls.from_edges(edges(), neighborhood)
+
+    def to_edges(self) -> Iterator[tuple[Node, Node, float]]:
+        """
+        Returns:
+            A generator of all links as triples (u, v, w), where u points to v and w is the weight of the link
+        """
+        for l in self.view.links:
+            yield *l, self.__link_weights[l]
+
     def link_weights(self, u_or_l: Node | tuple = None, v: Node = None) -> dict[Node, float] | dict[
         tuple[Node, Node], float] | float:
         """
@@ -858,7 +990,7 @@ class WeightedLinksDirectedGraph(DirectedGraph):
             if not isinstance(u_or_l, Node):
                 u_or_l = Node(u_or_l)
             if v is None:
-                return {n: self.link_weights((u_or_l, n)) for n in self.next(u_or_l)}
+                return {n: self.__link_weights.get((u_or_l, n)) for n in self.view.next(u_or_l)}
             if not isinstance(v, Node):
                 v = Node(v)
             return self.__link_weights[(u_or_l, v)]
@@ -884,12 +1016,12 @@ class WeightedLinksDirectedGraph(DirectedGraph):
             if not isinstance(n, Node):
                 n = Node(n)
             if n in self:
-                for v in self.next(n):
-                    if (n, v) in self.link_weights():
-                        self.__link_weights.pop((n, v))
-                for v in self.prev(n):
-                    if (v, n) in self.link_weights():
-                        self.__link_weights.pop((v, n))
+                for v in self.view.next(n):
+                    if (n, v) in self.__link_weights:
+                        self._negative_links -= self.__link_weights.pop((n, v)) < 0
+                for v in self.view.prev(n):
+                    if (v, n) in self.__link_weights:
+                        self._negative_links -= self.__link_weights.pop((v, n)) < 0
         return super().remove(u, *rest)
 
     def connect(self, u: Node, pointed_by_weights: dict[Node, float] = {},
@@ -901,12 +1033,12 @@ class WeightedLinksDirectedGraph(DirectedGraph):
             for v, w in pointed_by_weights.items():
                 if not isinstance(v, Node):
                     v = Node(v)
-                if (v, u) not in self.link_weights():
+                if (v, u) not in self.__link_weights:
                     self.set_weight((v, u), w)
             for v, w in points_to_weights.items():
                 if not isinstance(v, Node):
                     v = Node(v)
-                if (u, v) not in self.link_weights():
+                if (u, v) not in self.__link_weights:
                     self.set_weight((u, v), w)
         return self
 
@@ -924,13 +1056,13 @@ class WeightedLinksDirectedGraph(DirectedGraph):
             for v in pointed_by:
                 if not isinstance(v, Node):
                     v = Node(v)
-                if v in self.prev(u):
-                    self.__link_weights.pop((v, u))
+                if v in self.view.prev(u):
+                    self._negative_links -= self.__link_weights.pop((v, u)) < 0
             for v in points_to:
                 if not isinstance(v, Node):
                     v = Node(v)
-                if v in self.next(u):
-                    self.__link_weights.pop((u, v))
+                if v in self.view.next(u):
+                    self._negative_links -= self.__link_weights.pop((u, v)) < 0
             super().disconnect(u, pointed_by, points_to)
         return self
 
@@ -946,11 +1078,13 @@ class WeightedLinksDirectedGraph(DirectedGraph):
             if len(l) != 2:
                 raise ValueError("Directed link expected!")
             l = (l[0] if isinstance(l[0], Node) else Node(l[0]), l[1] if isinstance(l[1], Node) else Node(l[1]))
-            if l in self.links:
+            if l in self.view.links:
                 try:
-                    self.__link_weights[l] = float(w)
+                    w = float(w)
                 except TypeError:
                     raise TypeError("Real value expected!")
+                self._negative_links += (w < 0) - (self.__link_weights.get(l, 0.0) < 0)
+                self.__link_weights[l], self._fingerprint = w, None
             return self
         except ValueError:
             raise TypeError("Directed link is of type tuple[Node, Node]!")
@@ -967,9 +1101,9 @@ class WeightedLinksDirectedGraph(DirectedGraph):
             if len(l) != 2:
                 raise ValueError("Directed link expected!")
             l = (l[0] if isinstance(l[0], Node) else Node(l[0]), l[1] if isinstance(l[1], Node) else Node(l[1]))
-            if l in self.link_weights():
+            if l in self.__link_weights:
                 try:
-                    self.set_weight(l, self.link_weights(l) + float(w))
+                    self.set_weight(l, self.__link_weights[l] + float(w))
                 except TypeError:
                     raise TypeError("Real value expected!")
             return self
@@ -1000,7 +1134,7 @@ class WeightedLinksDirectedGraph(DirectedGraph):
 
     def subgraph(self, u_or_nodes: Node | Iterable[Node]) -> "WeightedLinksDirectedGraph":
         try:
-            u_or_nodes = self.nodes.intersection(u_or_nodes)
+            u_or_nodes = self.view.nodes.intersection(u_or_nodes)
             neighborhood = {u: ({}, {k: v for k, v in self.link_weights(u).items() if k in u_or_nodes}) for u in
                             u_or_nodes}
             return WeightedLinksDirectedGraph(neighborhood)
@@ -1009,14 +1143,7 @@ class WeightedLinksDirectedGraph(DirectedGraph):
                 u_or_nodes = Node(u_or_nodes)
             if u_or_nodes not in self:
                 raise KeyError("Unrecognized node!")
-            queue, res = [u_or_nodes], WeightedLinksDirectedGraph({u_or_nodes: ({}, {})})
-            while queue:
-                for n in self.next(v := queue.pop(0)):
-                    if n in res:
-                        res.connect(n, {v: self.link_weights(v, n)})
-                    else:
-                        res.add(n, {v: self.link_weights(v, n)}), queue.append(n)
-            return res
+            return self.subgraph({n for n, _, _ in breadth_first(u_or_nodes, self.view.next)})
 
     def minimal_path_links(self, u: Node, v: Node) -> list[Node]:
         """
@@ -1026,7 +1153,52 @@ class WeightedLinksDirectedGraph(DirectedGraph):
         Returns:
             A path from u to v with the least possible sum of link weights
         """
-        return self.weighted_graph().minimal_path(u, v)
+        if not isinstance(u, Node):
+            u = Node(u)
+        if not isinstance(v, Node):
+            v = Node(v)
+        if u not in self or v not in self:
+            raise KeyError("Unrecognized node(s)!")
+        if not self._negative_links:
+            weights = self.__link_weights
+            return cheapest_path(u, v, 0, lambda x: ((y, weights[(x, y)]) for y in self.view.next(x)))[0]
+        distances, parents, cycle = bellman_ford({u: 0}, lambda x: self.link_weights(x).items())
+        if cycle:
+            return self.weighted_graph().minimal_path(u, v)
+        return path_to(parents, v) if v in distances else []
+
+    def negative_cycle(self) -> list[Node]:
+        """
+        Returns:
+            A cycle with a negative sum of link weights as a list of nodes, which starts and ends with the same node, if such exists, otherwise an empty list
+        """
+        return bellman_ford(dict.fromkeys(self.view.nodes, 0), lambda x: self.link_weights(x).items())[2]
+
+    def minimal_distances(self, source: Node) -> dict[Node, float]:
+        """
+        Args:
+            source: A present node
+        Returns:
+            A dictionary, mapping each node, reachable from source, to the least possible sum of link weights of a path to it. A ValueError is raised, if a negative cycle is reachable from source
+        """
+        if not isinstance(source, Node):
+            source = Node(source)
+        if source not in self:
+            raise KeyError("Unrecognized node!")
+        if not self._negative_links:
+            weights = self.__link_weights
+            return dijkstra({source: 0}, lambda x: ((y, weights[(x, y)]) for y in self.view.next(x)))[0]
+        distances, _, cycle = bellman_ford({source: 0}, lambda x: self.link_weights(x).items())
+        if cycle:
+            raise ValueError("Negative cycle found!")
+        return distances
+
+    def all_minimal_distances(self) -> dict[Node, dict[Node, float]]:
+        """
+        Returns:
+            A dictionary, mapping every node to a dictionary with the least possible sums of link weights of paths from it to all nodes it can reach. A ValueError is raised, if there's a negative cycle
+        """
+        return johnson(dict.fromkeys(self.view.nodes, 0), lambda x: self.link_weights(x).items())
 
 
 class WeightedDirectedGraph(WeightedLinksDirectedGraph, WeightedNodesDirectedGraph):
@@ -1051,6 +1223,37 @@ class WeightedDirectedGraph(WeightedLinksDirectedGraph, WeightedNodesDirectedGra
                 self.add((v, 0), {u: w})
                 self.connect(v, {u: w})
 
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[Node, Node, float]],
+                   nodes: dict[Node, float] = {}) -> "WeightedDirectedGraph":
+        """
+        Args:
+            edges: An iterable of triples (u, v, w), each of which is a link from u to v with a weight of w. Loops are skipped and only the first weight of a repeated link is kept
+            nodes: A dictionary of node weights. Nodes, that aren't in it, get a weight of 0
+        Returns:
+            A graph, built in a single pass over the given links, which are put into the graph at once
+        """
+        return super().from_edges(edges, nodes)
+
+    @classmethod
+    def from_adjacency(cls, neighborhood: dict[Node, tuple[float, tuple[dict[Node, float], dict[Node, float]]]]
+                       ) -> "WeightedDirectedGraph":
+        """
+        Args:
+            neighborhood: A dictionary with nodes for keys. The value of each node is a tuple with its weight and another tuple with 2 dictionaries. The first one contains the nodes, which point to it, and the second one contains the nodes it points to. The values in these dictionaries are the link weights
+        Returns:
+            The same graph as the one, given by the constructor, but built in a single pass
+        """
+
+        def edges():
+            for u, (_, (prev_u, next_u)) in neighborhood.items():
+                for v, w in prev_u.items():
+                    yield v, u, w
+                for v, w in next_u.items():
+                    yield u, v, w
+
+        return cls.from_edges(edges(), {u: w for u, (w, _) in neighborhood.items()})
+
     @property
     def total_weight(self) -> float:
         """
@@ -1080,7 +1283,7 @@ class WeightedDirectedGraph(WeightedLinksDirectedGraph, WeightedNodesDirectedGra
             w: The new weight of object el
         Set the weight of object el to w
         """
-        if el in self.links:
+        if el in self.view.links:
             super().set_weight(el, w)
         else:
             if not isinstance(el, Node):
@@ -1096,7 +1299,7 @@ class WeightedDirectedGraph(WeightedLinksDirectedGraph, WeightedNodesDirectedGra
             w: A real value
         Increase the weight of object el with w
         """
-        if el in self.link_weights():
+        if el in self.view.links:
             try:
                 self.set_weight(el, self.link_weights(el) + float(w))
             except TypeError:
@@ -1136,14 +1339,46 @@ class WeightedDirectedGraph(WeightedLinksDirectedGraph, WeightedNodesDirectedGra
                 u_or_nodes = Node(u_or_nodes)
             if u_or_nodes not in self:
                 raise KeyError("Unrecognized node!")
-            queue, res = [u_or_nodes], WeightedDirectedGraph({u_or_nodes: (self.node_weights(u_or_nodes), ({}, {}))})
-            while queue:
-                for n in self.next(v := queue.pop(0)):
-                    if n in res:
-                        res.connect(n, {v: self.link_weights(v, n)})
-                    else:
-                        res.add((n, self.node_weights(n)), {v: self.link_weights(v, n)}), queue.append(n)
-            return res
+            return self.subgraph({n for n, _, _ in breadth_first(u_or_nodes, self.view.next)})
+
+    def __steps(self) -> Callable[[Node], Iterator[tuple[Node, float]]]:
+        node_weights, link_weights = self.node_weights, self.link_weights
+        return lambda x: ((y, w + node_weights(y)) for y, w in link_weights(x).items())
+
+    def __negative(self) -> bool:
+        return self._negative_nodes > 0 or self._negative_links > 0
+
+    def negative_cycle(self) -> list[Node]:
+        """
+        Returns:
+            A cycle with a negative sum of node and link weights as a list of nodes, which starts and ends with the same node, if such exists, otherwise an empty list
+        """
+        return bellman_ford(dict.fromkeys(self.view.nodes, 0), self.__steps())[2]
+
+    def minimal_distances(self, source: Node) -> dict[Node, float]:
+        """
+        Args:
+            source: A present node
+        Returns:
+            A dictionary, mapping each node, reachable from source, to the least possible sum of node and link weights of a path to it. A ValueError is raised, if a negative cycle is reachable from source
+        """
+        if not isinstance(source, Node):
+            source = Node(source)
+        if source not in self:
+            raise KeyError("Unrecognized node!")
+        if not self.__negative():
+            return dijkstra({source: self.node_weights(source)}, self.__steps())[0]
+        distances, _, cycle = bellman_ford({source: self.node_weights(source)}, self.__steps())
+        if cycle:
+            raise ValueError("Negative cycle found!")
+        return distances
+
+    def all_minimal_distances(self) -> dict[Node, dict[Node, float]]:
+        """
+        Returns:
+            A dictionary, mapping every node to a dictionary with the least possible sums of node and link weights of paths from it to all nodes it can reach. A ValueError is raised, if there's a negative cycle
+        """
+        return johnson(self.node_weights(), self.__steps())
 
     def minimal_path(self, u: Node, v: Node) -> list[Node]:
         """
@@ -1151,7 +1386,17 @@ class WeightedDirectedGraph(WeightedLinksDirectedGraph, WeightedNodesDirectedGra
             u: First given node
             v: Second given node
         Returns:
-            A path between u and v with the least possible sum of node and link weights
+            A path from u to v with the least possible sum of node and link weights
+        """
+        return self.minimal_path_cost(u, v)[0]
+
+    def minimal_path_cost(self, u: Node, v: Node) -> tuple[list[Node], float]:
+        """
+        Args:
+            u: First given node
+            v: Second given node
+        Returns:
+            A path from u to v with the least possible sum of node and link weights and that sum, if such path exists, otherwise an empty list and infinity
         """
 
         def dfs(x, current_path, current_weight, total_negative, res_path=None, res_weight=0):
@@ -1202,11 +1447,16 @@ class WeightedDirectedGraph(WeightedLinksDirectedGraph, WeightedNodesDirectedGra
             u = Node(u)
         if not isinstance(v, Node):
             v = Node(v)
-        if v in self:
-            if v in (tmp := self.subgraph(u)):
-                nodes_negative_weights = sum(tmp.node_weights(n) for n in tmp.nodes if tmp.node_weights(n) < 0)
-                links_negative_weights = sum(tmp.link_weights(l) for l in tmp.links if tmp.link_weights(l) < 0)
-                res = dfs(u, [], tmp.node_weights(u), nodes_negative_weights + links_negative_weights)
-                return [l[0] for l in res[0]] + [res[0][-1][1]]
-            return []
-        raise KeyError("Unrecognized node(s)!")
+        if u not in self or v not in self:
+            raise KeyError("Unrecognized node(s)!")
+        if not self.__negative():
+            return cheapest_path(u, v, self.node_weights(u), self.__steps())
+        distances, parents, cycle = bellman_ford({u: self.node_weights(u)}, self.__steps())
+        if not cycle:
+            return (path_to(parents, v), distances[v]) if v in distances else ([], inf)
+        if v in (tmp := self.subgraph(u)):
+            nodes_negative_weights = sum(tmp.node_weights(n) for n in tmp.nodes if tmp.node_weights(n) < 0)
+            links_negative_weights = sum(tmp.link_weights(l) for l in tmp.links if tmp.link_weights(l) < 0)
+            res = dfs(u, [], tmp.node_weights(u), nodes_negative_weights + links_negative_weights)
+            return [l[0] for l in res[0]] + [res[0][-1][1]], res[1]
+        return [], inf
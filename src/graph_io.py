@@ -0,0 +1,343 @@
+"""
+Module for streaming graphs from and to edge-list and CSV files without materialising them in memory and for saving
+graphs and trees in a compact binary format, which can be memory-mapped
+"""
+
+__all__ = ["read_edges", "load_edges", "write_edges", "save_graph", "load_graph"]
+
+from array import array
+
+from mmap import mmap as memory_map, ACCESS_READ
+
+from pickle import dumps, loads
+
+from struct import Struct
+
+from sys import byteorder
+
+from typing import Callable, Hashable, Iterable, Iterator, Sequence, BinaryIO
+
+from undirected_graph import (Node, UndirectedGraph, WeightedNodesUndirectedGraph, WeightedLinksUndirectedGraph,
+                              WeightedUndirectedGraph)
+
+from directed_graph import (DirectedGraph, WeightedNodesDirectedGraph, WeightedLinksDirectedGraph,
+                            WeightedDirectedGraph)
+
+from tree import Tree, WeightedTree
+
+from storage import OFFSET_TYPE, ID_TYPE
+
+CHUNK_SIZE = 1 << 20
+
+MAGIC, VERSION = b"GRAPHBIN", 1
+
+HEADER = Struct("<8sHBBB3xqqq")
+
+GRAPH_TYPES = (UndirectedGraph, WeightedNodesUndirectedGraph, WeightedLinksUndirectedGraph, WeightedUndirectedGraph,
+               DirectedGraph, WeightedNodesDirectedGraph, WeightedLinksDirectedGraph, WeightedDirectedGraph, Tree,
+               WeightedTree)
+
+INT_NODES, STR_NODES, PICKLED_NODES = range(3)
+
+NODE_WEIGHTS, LINK_WEIGHTS = 1, 2
+
+WEIGHT_TYPE, SIZE_TYPE = "d", "q"
+
+
+def read_chunks(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[list[str]]:
+    """
+    Args:
+        path: Path to a text file
+        chunk_size: Approximate number of characters to read at once
+    Returns:
+        A generator of lists of whole lines, read chunk by chunk
+    """
+    with open(path, encoding="utf-8") as file:
+        while chunk := file.readlines(chunk_size):
+            yield chunk
+
+
+def split_rows(chunks: Iterable[list[str]], delimiter: str | None, header: bool,
+               comment: str) -> Iterator[list[str]]:
+    """
+    Args:
+        chunks: An iterable of lists of lines
+        delimiter: The field separator. None means any whitespace
+        header: Whether to skip the first line
+        comment: Lines, that start with it, are skipped
+    Returns:
+        A generator of the fields of each non-empty line
+    """
+    for chunk in chunks:
+        for line in chunk:
+            if header:
+                header = False
+                continue
+            if not (line := line.strip()) or comment and line.startswith(comment):
+                continue
+            yield [field.strip() for field in line.split(delimiter)]
+
+
+def read_edges(path: str, delimiter: str = None, node_type: Callable[[str], Hashable] = str, weights: int = None,
+               header: bool = False, comment: str = "#",
+               chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[Node, Node] | tuple[Node, Node, float]]:
+    """
+    Args:
+        path: Path to an edge-list or a CSV file, where the first two columns of each line are the ends of a link
+        delimiter: The column separator, for example "," for CSV files. None means any whitespace
+        node_type: A function, that parses the value of a node from its text, for example int
+        weights: The index of the column with the link weights or None, if the links aren't weighted
+        header: Whether the first line is a header
+        comment: Lines, that start with it, are skipped
+        chunk_size: Approximate number of characters to read at once
+    Returns:
+        A generator of pairs of nodes or, if weights is given, of triples of two nodes and the weight of the link between them. The file is read lazily, one chunk at a time
+    """
+    if weights is not None and (not isinstance(weights, int) or weights < 2):
+        raise ValueError(f"Column {weights} can't hold the link weights!")
+    nodes = {}
+    for i, row in enumerate(split_rows(read_chunks(path, chunk_size), delimiter, header, comment)):
+        try:
+            u, v = row[0], row[1]
+            if (u_node := nodes.get(u)) is None:
+                u_node = nodes[u] = Node(node_type(u))
+            if (v_node := nodes.get(v)) is None:
+                v_node = nodes[v] = Node(node_type(v))
+            if weights is None:
+                yield u_node, v_node
+            else:
+                yield u_node, v_node, float(row[weights])
+        except (IndexError, ValueError) as error:
+            raise ValueError(f"Bad row {i + 1} in {path}: {error}")
+
+
+def load_edges(path: str, graph_type: type = UndirectedGraph, delimiter: str = None,
+               node_type: Callable[[str], Hashable] = str, weights: int = None, header: bool = False,
+               comment: str = "#", chunk_size: int = CHUNK_SIZE, **kwargs):
+    """
+    Args:
+        path: Path to an edge-list or a CSV file, where the first two columns of each line are the ends of a link
+        graph_type: The class of the graph to build. It has to have link weights exactly when weights is given
+        delimiter: The column separator, for example "," for CSV files. None means any whitespace
+        node_type: A function, that parses the value of a node from its text, for example int
+        weights: The index of the column with the link weights. It defaults to 2 for graphs with link weights
+        header: Whether the first line is a header
+        comment: Lines, that start with it, are skipped
+        chunk_size: Approximate number of characters to read at once
+        kwargs: Other arguments of the from_edges method of graph_type, such as storage or node weights
+    Returns:
+        A graph of type graph_type, which is filled straight from the stream of links
+    """
+    if not issubclass(graph_type, (UndirectedGraph, DirectedGraph)):
+        raise TypeError("Graph class expected!")
+    if issubclass(graph_type, (WeightedLinksUndirectedGraph, WeightedLinksDirectedGraph)):
+        if weights is None:
+            weights = 2
+    elif weights is not None:
+        raise ValueError(f"{graph_type.__name__} has no link weights!")
+    edges = read_edges(path, delimiter, node_type, weights, header, comment, chunk_size)
+    return graph_type.from_edges(edges, **kwargs)
+
+
+def write_edges(graph: UndirectedGraph | DirectedGraph, path: str, delimiter: str = " ", header: Iterable[str] = (),
+                chunk_size: int = CHUNK_SIZE) -> None:
+    """
+    Args:
+        graph: An undirected or a directed graph
+        path: Path to the file to write
+        delimiter: The column separator
+        header: Column names to write in the first line, if any
+        chunk_size: Approximate number of characters to write at once
+    Write each link of the graph on its own line, followed by its weight, if the graph has link weights. The links are streamed from the graph without copying them. Nodes without links aren't written
+    """
+    if not isinstance(graph, (UndirectedGraph, DirectedGraph)):
+        raise TypeError("Graph expected!")
+    with open(path, "w", encoding="utf-8") as file:
+        if header := delimiter.join(header):
+            file.write(header + "\n")
+        chunk, size = [], 0
+        for edge in graph.to_edges():
+            line = delimiter.join(str(x.value if isinstance(x, Node) else x) for x in edge) + "\n"
+            chunk.append(line)
+            if (size := size + len(line)) >= chunk_size:
+                file.writelines(chunk)
+                chunk, size = [], 0
+        file.writelines(chunk)
+
+
+def write_array(file: BinaryIO, values: array) -> None:
+    """
+    Args:
+        file: A binary file, opened for writing
+        values: An array
+    Write the array in little-endian byte order and pad it to a multiple of 8 bytes
+    """
+    if byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    file.write(values.tobytes())
+    file.write(bytes(-len(values) * values.itemsize % 8))
+
+
+def write_bytes(file: BinaryIO, data: bytes) -> None:
+    """
+    Args:
+        file: A binary file, opened for writing
+        data: Raw bytes
+    Write the data and pad it to a multiple of 8 bytes
+    """
+    file.write(data)
+    file.write(bytes(-len(data) % 8))
+
+
+def read_array(buffer: memoryview, position: int, typecode: str, count: int) -> tuple[Sequence, int]:
+    """
+    Args:
+        buffer: The contents of a binary graph file
+        position: The offset of the array in it
+        typecode: The type of the array elements
+        count: The number of the array elements
+    Returns:
+        A read-only view of the array, which isn't copied on little-endian machines, and the offset after it
+    """
+    size = count * array(typecode).itemsize
+    if position + size > len(buffer):
+        raise ValueError("Truncated graph file!")
+    values = buffer[position:position + size].cast(typecode)
+    if byteorder != "little":
+        values = array(typecode, values.tobytes())
+        values.byteswap()
+    return values, position + size + -size % 8
+
+
+def save_graph(graph: UndirectedGraph | DirectedGraph | Tree, path: str) -> None:
+    """
+    Args:
+        graph: A graph or a tree
+        path: Path to the file to write
+    Save the graph in a versioned binary format. It has a fixed header, a node table, the adjacency in compressed sparse rows and, for weighted graphs, arrays of node and link weights. Integer and string nodes are stored natively, any other nodes are pickled
+    """
+    if (graph_type := type(graph)) not in GRAPH_TYPES:
+        raise TypeError("Graph or tree expected!")
+    if isinstance(graph, Tree):
+        nodes, adjacent = [graph.root, *(u for u in graph.view.nodes if u != graph.root)], graph.view.descendants
+    elif isinstance(graph, UndirectedGraph):
+        nodes, adjacent = list(graph.view.nodes), graph.view.neighbors
+    else:
+        nodes, adjacent = list(graph.view.nodes), graph.view.next
+    ids = {u: i for i, u in enumerate(nodes)}
+    offsets, targets = array(OFFSET_TYPE, [0]), array(ID_TYPE)
+    for u in nodes:
+        targets.extend(sorted(ids[v] for v in adjacent(u)))
+        offsets.append(len(targets))
+    flags = 0
+    if isinstance(graph, (WeightedNodesUndirectedGraph, WeightedNodesDirectedGraph, WeightedTree)):
+        flags |= NODE_WEIGHTS
+    if isinstance(graph, (WeightedLinksUndirectedGraph, WeightedLinksDirectedGraph)):
+        flags |= LINK_WEIGHTS
+    values = [u.value for u in nodes]
+    if all(type(x) is int and -2 ** 63 <= x < 2 ** 63 for x in values):
+        encoding = INT_NODES
+    elif all(type(x) is str for x in values):
+        encoding = STR_NODES
+    else:
+        encoding = PICKLED_NODES
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, GRAPH_TYPES.index(graph_type), flags, encoding, len(nodes),
+                               len(targets), 0))
+        if encoding == INT_NODES:
+            write_array(file, array(SIZE_TYPE, values))
+        elif encoding == STR_NODES:
+            encoded = [x.encode("utf-8") for x in values]
+            ends = array(SIZE_TYPE, [0])
+            for x in encoded:
+                ends.append(ends[-1] + len(x))
+            write_array(file, ends), write_bytes(file, b"".join(encoded))
+        else:
+            data = dumps(values)
+            write_array(file, array(SIZE_TYPE, [len(data)])), write_bytes(file, data)
+        write_array(file, offsets), write_array(file, targets)
+        if flags & NODE_WEIGHTS:
+            weights = graph.weights if isinstance(graph, Tree) else graph.node_weights
+            write_array(file, array(WEIGHT_TYPE, map(weights, nodes)))
+        if flags & LINK_WEIGHTS:
+            link_weights = array(WEIGHT_TYPE)
+            for i, u in enumerate(nodes):
+                for j in targets[offsets[i]:offsets[i + 1]]:
+                    link_weights.append(graph.link_weights(u, nodes[j]))
+            write_array(file, link_weights)
+
+
+def load_graph(path: str, mmap: bool = False, storage: str = None,
+               graph_type: type = None) -> UndirectedGraph | DirectedGraph | Tree:
+    """
+    Args:
+        path: Path to a file, written by save_graph
+        mmap: Whether to memory-map the file instead of reading it
+        storage: The storage engine of an undirected graph, "set" or "csr". By default, it's "csr" when memory-mapping and "set" otherwise
+        graph_type: The expected class of the saved graph or None
+    Returns:
+        The saved graph or tree. An undirected graph without link weights in the "csr" storage engine uses the adjacency arrays of the file as they are, so when memory-mapped, opening it takes time in the number of nodes only and the adjacency is paged in lazily. Files with pickled nodes should only be loaded from trusted sources
+    """
+    with open(path, "rb") as file:
+        if mmap:
+            buffer = memoryview(memory_map(file.fileno(), 0, access=ACCESS_READ))
+        else:
+            buffer = memoryview(file.read())
+    if len(buffer) < HEADER.size or buffer[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not a graph file!")
+    _, version, kind, flags, encoding, n, m, _ = HEADER.unpack_from(buffer)
+    if version > VERSION:
+        raise ValueError(f"Graph file version {version} is not supported!")
+    if kind >= len(GRAPH_TYPES):
+        raise ValueError(f"Graph kind {kind} is not supported!")
+    if graph_type is not None and GRAPH_TYPES[kind] != graph_type:
+        raise TypeError(f"{path} holds {GRAPH_TYPES[kind].__name__}, not {graph_type.__name__}!")
+    graph_type, position = GRAPH_TYPES[kind], HEADER.size
+    if encoding == INT_NODES:
+        values, position = read_array(buffer, position, SIZE_TYPE, n)
+    elif encoding == STR_NODES:
+        ends, position = read_array(buffer, position, SIZE_TYPE, n + 1)
+        data, position = read_array(buffer, position, "B", ends[-1])
+        values = [str(data[ends[i]:ends[i + 1]], "utf-8") for i in range(n)]
+    elif encoding == PICKLED_NODES:
+        (size,), position = read_array(buffer, position, SIZE_TYPE, 1)
+        data, position = read_array(buffer, position, "B", size)
+        values = loads(data)
+    else:
+        raise ValueError(f"Node encoding {encoding} is not supported!")
+    nodes = [Node(x) for x in values]
+    offsets, position = read_array(buffer, position, OFFSET_TYPE, n + 1)
+    targets, position = read_array(buffer, position, ID_TYPE, m)
+    node_weights = link_weights = None
+    if flags & NODE_WEIGHTS:
+        node_weights, position = read_array(buffer, position, WEIGHT_TYPE, n)
+    if flags & LINK_WEIGHTS:
+        link_weights, position = read_array(buffer, position, WEIGHT_TYPE, m)
+
+    def rows():
+        for i, u in enumerate(nodes):
+            for k in range(offsets[i], offsets[i + 1]):
+                yield i, u, k
+
+    if issubclass(graph_type, Tree):
+        children = {u: [nodes[j] for j in targets[offsets[i]:offsets[i + 1]]] for i, u in enumerate(nodes)}
+        if node_weights is None:
+            return graph_type(nodes[0], {u: children[u] for u in nodes[1:]})
+        return graph_type((nodes[0], node_weights[0]),
+                          {u: (node_weights[i], children[u]) for i, u in enumerate(nodes) if i})
+    nodes_arg = nodes if node_weights is None else dict(zip(nodes, node_weights))
+    if issubclass(graph_type, UndirectedGraph):
+        storage = storage or ("csr" if mmap else "set")
+        if storage == "csr":
+            weights = {"node_weights": node_weights, "link_weights": link_weights}
+            return graph_type.from_csr(nodes, offsets, targets, storage=storage,
+                                       **{k: v for k, v in weights.items() if v is not None})
+        if link_weights is None:
+            edges = ((u, nodes[targets[k]]) for i, u, k in rows() if i < targets[k])
+        else:
+            edges = ((u, nodes[targets[k]], link_weights[k]) for i, u, k in rows() if i < targets[k])
+        return graph_type.from_edges(edges, nodes_arg, storage)
+    if link_weights is None:
+        return graph_type.from_edges(((u, nodes[targets[k]]) for _, u, k in rows()), nodes_arg)
+    return graph_type.from_edges(((u, nodes[targets[k]], link_weights[k]) for _, u, k in rows()), nodes_arg)
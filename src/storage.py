@@ -0,0 +1,587 @@
+"""
+Module for implementing the storage engines, which keep the nodes and the links of an undirected graph, and read-only
+views, which proxy the internal containers of graphs and trees without copying them
+"""
+
+from abc import ABC, abstractmethod
+
+from collections.abc import Set
+
+from array import array
+
+from bisect import bisect_left
+
+from typing import Iterable, Iterator, Sequence
+
+from base import Node, Link
+
+OFFSET_TYPE, ID_TYPE = "q", "i"
+
+
+class SetView(Set):
+    """
+    Read-only set-like view of a container. It reflects later changes of the container and is never copied, unless
+    explicitly asked to. Set operations with it return plain sets
+    """
+
+    def __init__(self, container) -> None:
+        """
+        Args:
+            container: A container, that supports membership tests, iteration and length
+        """
+        self.__container = container
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable) -> set:
+        return set(it)
+
+    def copy(self) -> set:
+        """
+        Returns:
+            A set with the same elements
+        """
+        return set(self.__container)
+
+    def union(self, *others: Iterable) -> set:
+        return self.copy().union(*others)
+
+    def intersection(self, *others: Iterable) -> set:
+        return self.copy().intersection(*others)
+
+    def difference(self, *others: Iterable) -> set:
+        return self.copy().difference(*others)
+
+    def issubset(self, other: Iterable) -> bool:
+        return all(x in other for x in self) if isinstance(other, Set) else self.copy().issubset(other)
+
+    def issuperset(self, other: Iterable) -> bool:
+        return all(x in self for x in other)
+
+    def __contains__(self, x) -> bool:
+        try:
+            return x in self.__container
+        except TypeError:
+            return False
+
+    def __iter__(self) -> Iterator:
+        return iter(self.__container)
+
+    def __len__(self) -> int:
+        return len(self.__container)
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+
+class Storage(ABC):
+    """
+    Abstract base class for the storage of the nodes and the links of an undirected graph
+    """
+
+    name: str
+
+    @property
+    @abstractmethod
+    def nodes(self) -> SetView:
+        """
+        Returns:
+            A read-only view of the stored nodes
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def links(self) -> SetView:
+        """
+        Returns:
+            A read-only view of the stored links
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def links_count(self) -> int:
+        """
+        Returns:
+            The number of stored links
+        """
+        pass
+
+    @abstractmethod
+    def neighbors(self, u: Node) -> SetView:
+        """
+        Args:
+            u: A stored node
+        Returns:
+            A read-only view of the neighbors of node u
+        """
+        pass
+
+    @abstractmethod
+    def linked(self, u: Node, v: Node) -> bool:
+        """
+        Args:
+            u: A stored node
+            v: A stored node
+        Returns:
+            Whether there is a link between u and v
+        """
+        pass
+
+    @abstractmethod
+    def load(self, adjacency: dict[Node, set[Node]]) -> None:
+        """
+        Args:
+            adjacency: A symmetric dictionary, that associates each node to the set of its neighbors
+        Store all nodes and links of the given adjacency at once into an empty storage. The sets may be kept as they are
+        """
+        pass
+
+    @abstractmethod
+    def add(self, u: Node) -> None:
+        """
+        Args:
+            u: A new node
+        Store node u without any links
+        """
+        pass
+
+    @abstractmethod
+    def remove(self, u: Node) -> None:
+        """
+        Args:
+            u: A stored node without links
+        Forget node u
+        """
+        pass
+
+    @abstractmethod
+    def connect(self, u: Node, v: Node) -> None:
+        """
+        Args:
+            u: A stored node
+            v: A stored node, not linked to u
+        Store a link between u and v
+        """
+        pass
+
+    @abstractmethod
+    def disconnect(self, u: Node, v: Node) -> None:
+        """
+        Args:
+            u: A stored node
+            v: A stored node, linked to u
+        Forget the link between u and v
+        """
+        pass
+
+    @abstractmethod
+    def __contains__(self, u: Node) -> bool:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+
+class SetStorage(Storage):
+    """
+    Storage, which keeps the nodes, the links and the neighbors of each node in hash sets
+    """
+
+    name = "set"
+
+    def __init__(self) -> None:
+        self.__nodes, self.__links = set(), set()
+        self.__neighbors = {}
+
+    @property
+    def nodes(self) -> SetView:
+        return SetView(self.__nodes)
+
+    @property
+    def links(self) -> SetView:
+        return SetView(self.__links)
+
+    @property
+    def links_count(self) -> int:
+        return len(self.__links)
+
+    def neighbors(self, u: Node) -> SetView:
+        return SetView(self.__neighbors[u])
+
+    def linked(self, u: Node, v: Node) -> bool:
+        return v in self.__neighbors[u]
+
+    def load(self, adjacency: dict[Node, set[Node]]) -> None:
+        self.__nodes.update(adjacency)
+        self.__neighbors.update(adjacency)
+        visited = set()
+        for u, neighbors in adjacency.items():
+            visited.add(u)
+            self.__links.update(Link(u, v) for v in neighbors if v not in visited)
+
+    def add(self, u: Node) -> None:
+        self.__nodes.add(u)
+        self.__neighbors[u] = set()
+
+    def remove(self, u: Node) -> None:
+        self.__nodes.remove(u), self.__neighbors.pop(u)
+
+    def connect(self, u: Node, v: Node) -> None:
+        self.__neighbors[u].add(v)
+        self.__neighbors[v].add(u)
+        self.__links.add(Link(u, v))
+
+    def disconnect(self, u: Node, v: Node) -> None:
+        self.__neighbors[u].remove(v)
+        self.__neighbors[v].remove(u)
+        self.__links.remove(Link(u, v))
+
+    def __contains__(self, u: Node) -> bool:
+        return u in self.__nodes
+
+    def __len__(self) -> int:
+        return len(self.__nodes)
+
+
+class CSRStorage(Storage):
+    """
+    Storage, which interns the nodes to dense integer ids and keeps the adjacency in compressed sparse rows. The
+    neighbors of the node with id i are targets[offsets[i]:offsets[i + 1]], sorted. Changes since the last compaction
+    are kept in small per-row overlays and are merged back into the arrays once they grow large enough
+    """
+
+    name = "csr"
+
+    def __init__(self) -> None:
+        self.__ids, self.__values = {}, []
+        self.__offsets, self.__targets = array(OFFSET_TYPE, [0]), array(ID_TYPE)
+        self.__inserted, self.__deleted = {}, {}
+        self.__pending, self.__links_count = 0, 0
+
+    @property
+    def nodes(self) -> SetView:
+        return SetView(self.__ids)
+
+    @property
+    def links(self) -> SetView:
+        return CSRLinksView(self)
+
+    @property
+    def links_count(self) -> int:
+        return self.__links_count
+
+    def neighbors(self, u: Node) -> SetView:
+        return CSRNeighborsView(self, u)
+
+    def linked(self, u: Node, v: Node) -> bool:
+        return self.__linked(self.__ids[u], self.__ids[v])
+
+    def adjacent(self, u: Node) -> list[Node]:
+        """
+        Args:
+            u: A stored node
+        Returns:
+            A list of the neighbors of node u
+        """
+        values = self.__values
+        return [values[j] for j in self.__row(self.__ids[u])]
+
+    def degree(self, u: Node) -> int:
+        """
+        Args:
+            u: A stored node
+        Returns:
+            The number of neighbors of node u
+        """
+        return len(self.__row(self.__ids[u]))
+
+    def iter_links(self) -> Iterator[Link]:
+        """
+        Returns:
+            A generator of all stored links, each one given once
+        """
+        values = self.__values
+        for i in list(self.__ids.values()):
+            for j in self.__row(i):
+                if i < j:
+                    yield Link(values[i], values[j])
+
+    def load(self, adjacency: dict[Node, set[Node]]) -> None:
+        for u in adjacency:
+            self.add(u)
+        ids, targets = self.__ids, self.__targets
+        for neighbors in adjacency.values():
+            targets.extend(sorted(ids[v] for v in neighbors))
+            self.__offsets.append(len(targets))
+        self.__links_count = len(targets) // 2
+
+    def attach(self, values: list[Node], offsets: Sequence[int], targets: Sequence[int]) -> None:
+        """
+        Args:
+            values: The nodes, ordered by their ids
+            offsets: The row offsets of the adjacency, one more than the nodes
+            targets: The symmetric adjacency rows, each one sorted
+        Use the given arrays as they are in an empty storage, without copying them. They may be read-only views, for example over a memory-mapped file, because they are only ever read and are replaced by new arrays on compaction
+        """
+        self.__values[:] = values
+        self.__ids.update((u, i) for i, u in enumerate(values))
+        self.__offsets, self.__targets = offsets, targets
+        self.__links_count = len(targets) // 2
+
+    def add(self, u: Node) -> None:
+        self.__ids[u] = len(self.__values)
+        self.__values.append(u)
+
+    def remove(self, u: Node) -> None:
+        i = self.__ids.pop(u)
+        self.__values[i] = None
+        self.__inserted.pop(i, None), self.__deleted.pop(i, None)
+        self.__changed()
+
+    def connect(self, u: Node, v: Node) -> None:
+        i, j = self.__ids[u], self.__ids[v]
+        for x, y in ((i, j), (j, i)):
+            if y in (deleted := self.__deleted.get(x, ())):
+                deleted.remove(y)
+            else:
+                self.__inserted.setdefault(x, set()).add(y)
+        self.__links_count += 1
+        self.__changed()
+
+    def disconnect(self, u: Node, v: Node) -> None:
+        i, j = self.__ids[u], self.__ids[v]
+        for x, y in ((i, j), (j, i)):
+            if y in (inserted := self.__inserted.get(x, ())):
+                inserted.remove(y)
+            else:
+                self.__deleted.setdefault(x, set()).add(y)
+        self.__links_count -= 1
+        self.__changed()
+
+    def compact(self) -> None:
+        """
+        Merge all pending changes into the arrays and renumber the nodes densely
+        """
+        renumbered = {i: k for k, i in enumerate(sorted(self.__ids.values()))}
+        offsets, targets = array(OFFSET_TYPE, [0]), array(ID_TYPE)
+        for i in renumbered:
+            targets.extend(sorted(renumbered[j] for j in self.__row(i)))
+            offsets.append(len(targets))
+        self.__values[:] = [self.__values[i] for i in renumbered]
+        self.__ids.clear()
+        self.__ids.update((u, k) for k, u in enumerate(self.__values))
+        self.__offsets, self.__targets = offsets, targets
+        self.__inserted, self.__deleted, self.__pending = {}, {}, 0
+
+    def __row(self, i: int) -> list[int]:
+        res = self.__targets[self.__offsets[i]:self.__offsets[i + 1]] if i + 1 < len(self.__offsets) else []
+        if i in self.__deleted:
+            res = [j for j in res if j not in self.__deleted[i]]
+        if i in self.__inserted:
+            res = [*res, *self.__inserted[i]]
+        return res
+
+    def __linked(self, i: int, j: int) -> bool:
+        if j in self.__inserted.get(i, ()):
+            return True
+        if j in self.__deleted.get(i, ()) or i + 1 >= len(self.__offsets):
+            return False
+        low, high = self.__offsets[i], self.__offsets[i + 1]
+        k = bisect_left(self.__targets, j, low, high)
+        return k < high and self.__targets[k] == j
+
+    def __changed(self) -> None:
+        self.__pending += 1
+        if self.__pending > len(self.__targets) // 2 + 1024:
+            self.compact()
+
+    def __contains__(self, u: Node) -> bool:
+        return u in self.__ids
+
+    def __len__(self) -> int:
+        return len(self.__ids)
+
+
+class CSRNeighborsView(SetView):
+    """
+    Read-only view of the neighbors of a node in a CSR storage
+    """
+
+    def __init__(self, storage: CSRStorage, u: Node) -> None:
+        super().__init__(())
+        self.__storage, self.__u = storage, u
+
+    def copy(self) -> set[Node]:
+        return set(self.__storage.adjacent(self.__u))
+
+    def __contains__(self, v: Node) -> bool:
+        return isinstance(v, Node) and v in self.__storage and self.__storage.linked(self.__u, v)
+
+    def __iter__(self) -> Iterator[Node]:
+        return iter(self.__storage.adjacent(self.__u))
+
+    def __len__(self) -> int:
+        return self.__storage.degree(self.__u)
+
+
+class CSRLinksView(SetView):
+    """
+    Read-only view of the links in a CSR storage
+    """
+
+    def __init__(self, storage: CSRStorage) -> None:
+        super().__init__(())
+        self.__storage = storage
+
+    def copy(self) -> set[Link]:
+        return set(self.__storage.iter_links())
+
+    def __contains__(self, l: Link) -> bool:
+        storage = self.__storage
+        return isinstance(l, Link) and l.u in storage and l.v in storage and storage.linked(l.u, l.v)
+
+    def __iter__(self) -> Iterator[Link]:
+        return self.__storage.iter_links()
+
+    def __len__(self) -> int:
+        return self.__storage.links_count
+
+
+class UndirectedView:
+    """
+    Read-only views of the nodes, the links and the neighbors of an undirected graph
+    """
+
+    def __init__(self, storage: Storage) -> None:
+        self.__storage = storage
+
+    @property
+    def nodes(self) -> SetView:
+        """
+        Returns:
+            A view of the graph nodes
+        """
+        return self.__storage.nodes
+
+    @property
+    def links(self) -> SetView:
+        """
+        Returns:
+            A view of the graph links
+        """
+        return self.__storage.links
+
+    def neighbors(self, u: Node) -> SetView:
+        """
+        Args:
+            u: A present node
+        Returns:
+            A view of the neighbors of node u
+        """
+        if not isinstance(u, Node):
+            u = Node(u)
+        if u not in self.__storage:
+            raise KeyError("Unrecognized node!")
+        return self.__storage.neighbors(u)
+
+
+class DirectedView:
+    """
+    Read-only views of the nodes, the links and the adjacency of a directed graph
+    """
+
+    def __init__(self, nodes: set[Node], links: set[tuple[Node, Node]], prev: dict[Node, set[Node]],
+                 next: dict[Node, set[Node]]) -> None:
+        self.__nodes, self.__links = nodes, links
+        self.__prev, self.__next = prev, next
+
+    @property
+    def nodes(self) -> SetView:
+        """
+        Returns:
+            A view of the graph nodes
+        """
+        return SetView(self.__nodes)
+
+    @property
+    def links(self) -> SetView:
+        """
+        Returns:
+            A view of the graph links
+        """
+        return SetView(self.__links)
+
+    def next(self, u: Node) -> SetView:
+        """
+        Args:
+            u: A present node
+        Returns:
+            A view of the nodes, that node u points to
+        """
+        if not isinstance(u, Node):
+            u = Node(u)
+        return SetView(self.__next[u])
+
+    def prev(self, u: Node) -> SetView:
+        """
+        Args:
+            u: A present node
+        Returns:
+            A view of the nodes, that point to node u
+        """
+        if not isinstance(u, Node):
+            u = Node(u)
+        return SetView(self.__prev[u])
+
+
+class TreeView:
+    """
+    Read-only views of the nodes, the leaves and the hierarchy of a tree
+    """
+
+    def __init__(self, nodes: set[Node], leaves: set[Node], hierarchy: dict[Node, set[Node]]) -> None:
+        self.__nodes, self.__leaves, self.__hierarchy = nodes, leaves, hierarchy
+
+    @property
+    def nodes(self) -> SetView:
+        """
+        Returns:
+            A view of the tree nodes
+        """
+        return SetView(self.__nodes)
+
+    @property
+    def leaves(self) -> SetView:
+        """
+        Returns:
+            A view of the tree leaves
+        """
+        return SetView(self.__leaves)
+
+    def hierarchy(self, u: Node) -> SetView:
+        """
+        Args:
+            u: A present node
+        Returns:
+            A view of the descendants of node u
+        """
+        if not isinstance(u, Node):
+            u = Node(u)
+        return SetView(self.__hierarchy[u])
+
+    descendants = hierarchy
+
+
+def new_storage(storage: str) -> Storage:
+    """
+    Args:
+        storage: The name of a storage engine, "set" or "csr"
+    Returns:
+        An empty storage of the given type
+    """
+    for t in (SetStorage, CSRStorage):
+        if t.name == storage:
+            return t()
+    raise ValueError(f"Storage type {storage} is not supported!")
@@ -8,12 +8,14 @@ from typing import Callable
 
 from collections import defaultdict
 
-from itertools import permutations, product
-
 from directed_graph import DirectedGraph, WeightedNodesDirectedGraph
 
 from undirected_graph import Node, UndirectedGraph, WeightedNodesUndirectedGraph, Iterable, reduce
 
+from storage import TreeView
+
+from hashlib import blake2b
+
 
 def build_heap(ll: list[float], f: Callable = max):
     """
@@ -38,51 +40,41 @@ def build_heap(ll: list[float], f: Callable = max):
         heapify(0, h, i, f)
 
 
+def ahu_ranks(*trees: "Tree") -> list[dict[Node, int]]:
+    """
+    Args:
+        trees: Tree objects
+    Returns:
+        For each tree, the rank of each node among all nodes on the same depth in all given trees. Nodes are ranked by their weights, if all trees are weighted, and then by the sorted ranks of their descendants, bottom-up (Aho-Hopcroft-Ullman). Two nodes on the same depth get the same rank exactly when their subtrees are isomorphic
+    """
+    weights, levels, ranks = all(isinstance(t, WeightedTree) for t in trees), defaultdict(list), [{} for _ in trees]
+    for i, t in enumerate(trees):
+        layer, d = [t.root], 0
+        while layer:
+            levels[d] += [(i, u) for u in layer]
+            layer, d = [v for u in layer for v in t.view.descendants(u)], d + 1
+    for d in range(len(levels) - 1, -1, -1):
+        keys = [(trees[i].weights(u) if weights else 0,
+                 tuple(sorted(map(ranks[i].get, trees[i].view.descendants(u))))) for i, u in levels[d]]
+        ids = {k: j for j, k in enumerate(sorted(set(keys)))}
+        for (i, u), k in zip(levels[d], keys):
+            ranks[i][u] = ids[k]
+    return ranks
+
+
 def isomorphic_bijection(tree0: "Tree", tree1: "Tree") -> dict[Node, Node]:
-    if not isinstance(tree1, Tree):
-        return {}
-    weights = isinstance(tree0, WeightedTree) and isinstance(tree1, WeightedTree)
-    if weights:
-        this_weights, other_weights = defaultdict(int), defaultdict(int)
-        for w in tree0.weights().values():
-            this_weights[w] += 1
-        for w in tree1.weights().values():
-            other_weights[w] += 1
-        if this_weights != other_weights:
-            return {}
-    elif len(tree0.nodes) != len(tree1.nodes):
+    if not isinstance(tree1, Tree) or len(tree0.nodes) != len(tree1.nodes):
         return {}
-    if len(tree0.nodes) != len(tree1.nodes) or len(tree0.leaves) != len(tree1.leaves) or len(
-            tree0.descendants(tree0.root)) != len(tree1.descendants(tree1.root)):
+    ranks0, ranks1 = ahu_ranks(tree0, tree1)
+    if ranks0[tree0.root] != ranks1[tree1.root]:
         return {}
-    this_nodes_descendants, other_nodes_descendants = defaultdict(set), defaultdict(set)
-    for n in tree0.nodes:
-        this_nodes_descendants[len(tree0.descendants(n))].add(n)
-    for n in tree1.nodes:
-        other_nodes_descendants[len(tree1.descendants(n))].add(n)
-    if any(len(this_nodes_descendants[d]) != len(other_nodes_descendants[d]) for d in this_nodes_descendants):
-        return {}
-    this_nodes_descendants = list(sorted(map(list, this_nodes_descendants.values()), key=len))
-    other_nodes_descendants = list(sorted(map(list, other_nodes_descendants.values()), key=len))
-    for possibility in product(*map(permutations, this_nodes_descendants)):
-        flatten_self = sum(map(list, possibility), [])
-        flatten_other = sum(other_nodes_descendants, [])
-        map_dict = dict(zip(flatten_self, flatten_other))
-        possible = True
-        for n, u in map_dict.items():
-            for m, v in map_dict.items():
-                if weights and tree0.weights(n) != tree1.weights(u):
-                    possible = False
-                    break
-                if (m in tree0.descendants(n)) ^ (v in tree1.descendants(u)) or (n in tree0.descendants(m)) ^ (
-                        u in tree1.descendants(v)) or weights and tree0.weights(m) != tree1.weights(v):
-                    possible = False
-                    break
-            if not possible:
-                break
-        if possible:
-            return map_dict
-    return {}
+    result, stack = {tree0.root: tree1.root}, [tree0.root]
+    while stack:
+        v = result[u := stack.pop()]
+        descendants = sorted(tree0.view.descendants(u), key=ranks0.get)
+        result.update(zip(descendants, sorted(tree1.view.descendants(v), key=ranks1.get)))
+        stack += descendants
+    return result
 
 
 def compare(tree0: "Tree", tree1: "Tree") -> bool:
@@ -522,6 +514,8 @@ class Tree:
         self.__root = root
         self.__hierarchy, self.__parent = {root: set()}, {}
         self.__nodes, self.__leaves = {root}, {root}
+        self.__view = TreeView(self.__nodes, self.__leaves, self.__hierarchy)
+        self._fingerprint = None
         if root in inheritance:
             inheritance.pop(root)
 
@@ -565,6 +559,14 @@ class Tree:
         """
         return self.__leaves.copy()
 
+    @property
+    def view(self) -> TreeView:
+        """
+        Returns:
+            Read-only views of the nodes, the leaves and the hierarchy of the tree, which reflect its current state without copying anything. They should not be held onto while the tree is being changed
+        """
+        return self.__view
+
     def leaf(self, n: Node) -> bool:
         """
         Args:
@@ -576,7 +578,7 @@ class Tree:
             n = Node(n)
         if n not in self:
             raise KeyError("Unrecognized node!")
-        return n in self.leaves
+        return n in self.view.leaves
 
     def add(self, curr: Node, u: Node, *rest: Node) -> "Tree":
         """
@@ -600,6 +602,7 @@ class Tree:
                     self.__parent[v] = curr
                     self.__leaves.add(v)
                     self.__hierarchy[v] = set()
+                    self._fingerprint = None
             if self.leaf(curr) and new_nodes:
                 self.__leaves.remove(curr)
         return self
@@ -641,14 +644,15 @@ class Tree:
             v = self.parent(u)
             leaf = self.leaf(u)
             self.__nodes.remove(u), self.__parent.pop(u)
-            for n in self.descendants(u):
+            for n in self.view.descendants(u):
                 self.__parent[n] = v
-            self.__hierarchy[v].update(self.hierarchy(u)), self.__hierarchy[v].remove(u)
+            self.__hierarchy[v].update(self.view.hierarchy(u)), self.__hierarchy[v].remove(u)
             if leaf:
                 self.__leaves.remove(u)
-                if not self.hierarchy(v):
+                if not self.view.hierarchy(v):
                     self.__leaves.add(v)
             self.__hierarchy.pop(u)
+            self._fingerprint = None
         return self
 
     def height(self) -> int:
@@ -658,7 +662,7 @@ class Tree:
         """
 
         def helper(x):
-            return 1 + max([-1, *map(helper, self.descendants(x))])
+            return 1 + max([-1, *map(helper, self.view.descendants(x))])
 
         return helper(self.root)
 
@@ -704,7 +708,35 @@ class Tree:
         Returns:
             An identical copy of the tree
         """
-        return Tree(self.root, {u: self.descendants(u) for u in self.nodes - {self.root}})
+        queue, res = [self.root], Tree(self.root)
+        while queue:
+            if descendants := self.view.descendants(u := queue.pop(0)):
+                res.add(u, *descendants)
+                queue += descendants
+        return res
+
+    def save(self, path: str) -> None:
+        """
+        Args:
+            path: Path to the file to write
+        Save the tree in the binary graph format
+        """
+        from graph_io import save_graph
+
+        save_graph(self, path)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = False) -> "Tree":
+        """
+        Args:
+            path: Path to a file, written by the save method of the same class
+            mmap: Whether to memory-map the file instead of reading it
+        Returns:
+            The saved tree
+        """
+        from graph_io import load_graph
+
+        return load_graph(path, mmap, None, cls)
 
     def subtree(self, u: Node) -> "Tree":
         """
@@ -721,7 +753,7 @@ class Tree:
             return self
         queue, res = [u], Tree(u)
         while queue:
-            for n in self.descendants(v := queue.pop(0)):
+            for n in self.view.descendants(v := queue.pop(0)):
                 res.add(v, n), queue.append(n)
         return res
 
@@ -806,23 +838,23 @@ class Tree:
             if self.leaf(r):
                 return
             only_leaves, min_no_root = True, None
-            for d in self.descendants(r):
+            for d in self.view.descendants(r):
                 if self.leaf(d):
                     dp[r][1].add(min_no_root := d)
                 else:
                     only_leaves = False
             if only_leaves:
                 return
-            for d in self.descendants(r):
+            for d in self.view.descendants(r):
                 if not self.leaf(d):
                     dfs(d)
                     dp[r][0].update(dp[d][0] if len(dp[d][0]) < len(dp[d][1]) else dp[d][1])
                     if min_no_root is None or len(dp[d][0]) < len(dp[min_no_root][0]):
                         min_no_root = d
-            for d in self.descendants(r):
+            for d in self.view.descendants(r):
                 dp[r][1].update(dp[d][1] if len(dp[d][1]) < len(dp[d][0]) and d != min_no_root else dp[d][0])
 
-        if self.nodes == {self.root}:
+        if len(self.view.nodes) == 1:
             return {self.root}
         dp = {n: [{n}, set()] for n in self.nodes}
         dfs(self.root)
@@ -835,7 +867,7 @@ class Tree:
         """
 
         def dfs(x: Node):
-            for y in self.descendants(x):
+            for y in self.view.descendants(x):
                 dfs(y)
                 dp[x][0].update(dp[y][1])
                 dp[x][1].update(dp[y][0] if len(dp[y][0]) > len(dp[y][1]) else dp[y][1])
@@ -853,6 +885,31 @@ class Tree:
         """
         return isomorphic_bijection(self, other)
 
+    def canonical_form(self) -> str:
+        """
+        Returns:
+            The Aho-Hopcroft-Ullman encoding of the tree. Each node is written in brackets, together with its weight for weighted trees, and followed by its descendants in a canonical order. Two trees have the same encoding exactly when they are isomorphic
+        """
+        ranks, weights = ahu_ranks(self)[0], isinstance(self, WeightedTree)
+        result, stack = [], [self.root]
+        while stack:
+            if (u := stack.pop()) is None:
+                result.append(")")
+                continue
+            result.append("(" + (repr(self.weights(u)) if weights else ""))
+            stack.append(None)
+            stack += sorted(self.view.descendants(u), key=ranks.get, reverse=True)
+        return "".join(result)
+
+    def fingerprint(self) -> str:
+        """
+        Returns:
+            A hash of the canonical form of the tree, which is the same exactly for isomorphic trees and in every process. For weighted trees, the weights are considered. It's kept until the tree changes
+        """
+        if self._fingerprint is None:
+            self._fingerprint = blake2b(self.canonical_form().encode(), digest_size=16).hexdigest()
+        return self._fingerprint
+
     def __contains__(self, u: Node) -> bool:
         """
         Args:
@@ -862,7 +919,7 @@ class Tree:
         """
         if not isinstance(u, Node):
             u = Node(u)
-        return u in self.nodes
+        return u in self.view.nodes
 
     def __eq__(self, other: "Tree") -> bool:
         """
@@ -970,6 +1027,7 @@ class WeightedTree(Tree):
             u = Node(u)
         try:
             self.__weights[u] = float(w)
+            self._fingerprint = None
         except ValueError:
             raise TypeError("Real value expected!")
         return self
@@ -993,8 +1051,12 @@ class WeightedTree(Tree):
         return self
 
     def copy(self) -> "WeightedTree":
-        inheritance = {u: (self.weights(u), {v: self.weights(v) for v in self.descendants(u)}) for u in self.nodes}
-        return WeightedTree((self.root, self.weights(self.root)), inheritance)
+        queue, res = [self.root], WeightedTree((self.root, self.weights(self.root)))
+        while queue:
+            if descendants := self.view.descendants(u := queue.pop(0)):
+                res.add(u, {v: self.weights(v) for v in descendants})
+                queue += descendants
+        return res
 
     def subtree(self, u: Node) -> "WeightedTree":
         if not isinstance(u, Node):
@@ -1035,21 +1097,21 @@ class WeightedTree(Tree):
                     dp[r][1] = {r}
                 return
             only_leaves, min_no_root = True, None
-            for d in self.descendants(r):
+            for d in self.view.descendants(r):
                 if self.leaf(d):
                     dp[r][1].add(min_no_root := d)
                 else:
                     only_leaves = False
             if only_leaves:
                 return
-            for d in self.descendants(r):
+            for d in self.view.descendants(r):
                 if not self.leaf(d):
                     dfs(d)
                     dp[r][0].update(dp[d][0] if (d_weights_sum := sum(map(self.weights, dp[d][0]))) < sum(
                         map(self.weights, dp[d][1])) else dp[d][1])
                     if min_no_root is None or d_weights_sum < sum(map(self.weights, dp[min_no_root][0])):
                         min_no_root = d
-            for d in self.descendants(r):
+            for d in self.view.descendants(r):
                 dp[r][1].update(dp[d][1] if sum(map(self.weights, dp[d][1])) < sum(
                     map(self.weights, dp[d][0])) and d != min_no_root else dp[d][0])
 
@@ -1066,7 +1128,7 @@ class WeightedTree(Tree):
         """
 
         def dfs(x):
-            for y in self.descendants(x):
+            for y in self.view.descendants(x):
                 dfs(y)
                 dp[x][0].update(dp[y][1])
                 dp[x][1].update(
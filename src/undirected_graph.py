@@ -7,9 +7,19 @@ __all__ = ["Node", "Link", "Graph", "UndirectedGraph", "WeightedNodesUndirectedG
 
 from functools import reduce
 
-from itertools import combinations
+from itertools import combinations, islice, chain
 
-from base import Node, Link, Graph, Iterable, combine_undirected, isomorphic_bijection_undirected, compare, string
+from math import inf
+
+from typing import Iterator, Sequence, Callable
+
+from base import (Node, Link, Graph, Iterable, combine_undirected, isomorphic_bijection_undirected, compare, string,
+                  fingerprint, undirected_labels, breadth_first, multi_breadth_first, depth_first, path_to,
+                  shortest_paths, dijkstra, cheapest_path, kruskal, boruvka, biconnected, hierholzer, bron_kerbosch,
+                  maximal_cliques, bitsets, bitset_nodes, independent_bitsets, hamilton_bitsets, dominating_bitset,
+                  independent_bitset, dsatur, coloring, edge_coloring, interval_order)
+
+from storage import new_storage, CSRStorage, UndirectedView
 
 
 def links_graph(graph: "UndirectedGraph") -> "UndirectedGraph":
@@ -41,7 +51,7 @@ def links_graph(graph: "UndirectedGraph") -> "UndirectedGraph":
 def cliques_graph(graph: "UndirectedGraph") -> "UndirectedGraph":
     node_weights = isinstance(graph, WeightedNodesUndirectedGraph)
     result = WeightedUndirectedGraph() if node_weights else UndirectedGraph()
-    cliques = graph.complementary().maximal_independent_sets()
+    cliques = list(graph.iter_maximal_cliques())
     if node_weights:
         for u in cliques:
             result.add((Node(frozenset(u)), sum(map(graph.node_weights, u))))
@@ -59,6 +69,23 @@ def cliques_graph(graph: "UndirectedGraph") -> "UndirectedGraph":
     return result
 
 
+def color_classes(order: list[Node], colors: list[int]) -> list[set[Node]]:
+    result = [set() for _ in range(max(colors, default=-1) + 1)]
+    for u, c in zip(order, colors):
+        result[c].add(u)
+    return result
+
+
+def max_size(sets: Iterable[set[Node]]) -> list[set[Node]]:
+    result, k = [set()], 0
+    for s in sets:
+        if len(s) > k:
+            result, k = [s], len(s)
+        elif len(s) == k:
+            result.append(s)
+    return result
+
+
 def complementary(graph: "UndirectedGraph") -> "UndirectedGraph":
     node_weights = isinstance(graph, WeightedNodesUndirectedGraph)
     res = UndirectedGraph({u: graph.nodes for u in graph.nodes})
@@ -74,26 +101,138 @@ class UndirectedGraph(Graph):
     Class for implementing an unweighted undirected graph
     """
 
-    def __init__(self, neighborhood: dict[Node, Iterable[Node]] = {}) -> None:
+    def __init__(self, neighborhood: dict[Node, Iterable[Node]] = {}, storage: str = "set") -> None:
         """
         Args:
             neighborhood: A dictionary, that associates a node to its neighbors in the graph
+            storage: The storage engine of the graph. "set" keeps nodes and links in hash sets, "csr" interns nodes to integer ids and keeps the adjacency in compressed sparse rows, which takes much less memory per link
         """
-        self.__nodes, self.__links = set(), set()
-        self.__neighbors = {}
+        self.__storage = new_storage(storage)
+        self.__view = UndirectedView(self.__storage)
+        self._fingerprint = None
         for u, neighbors in neighborhood.items():
             if u not in self:
                 self.add(u)
             for v in neighbors:
                 self.add(v, u), self.connect(u, v)
 
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[Node, Node]], nodes: Iterable[Node] = (),
+                   storage: str = "set") -> "UndirectedGraph":
+        """
+        Args:
+            edges: An iterable of pairs of nodes, each of which is a link. Repeated links and loops are skipped
+            nodes: Nodes to add even if they have no links
+            storage: The storage engine of the graph, "set" or "csr"
+        Returns:
+            A graph, built in a single pass over the given links, which are loaded into the storage at once
+        """
+        res, adjacency = cls(storage=storage), {}
+        for u in nodes:
+            adjacency.setdefault(u if isinstance(u, Node) else Node(u), set())
+        for u, v in edges:
+            if not isinstance(u, Node):
+                u = Node(u)
+            if not isinstance(v, Node):
+                v = Node(v)
+            if u != v:
+                adjacency.setdefault(u, set()).add(v)
+                adjacency.setdefault(v, set()).add(u)
+            else:
+                adjacency.setdefault(u, set())
+        res.__storage.load(adjacency)
+        return res
+
+    @classmethod
+    def from_adjacency(cls, neighborhood: dict[Node, Iterable[Node]], storage: str = "set") -> "UndirectedGraph":
+        """
+        Args:
+            neighborhood: A dictionary, that associates a node to its neighbors in the graph
+            storage: The storage engine of the graph, "set" or "csr"
+        Returns:
+            The same graph as the one, given by the constructor, but built in a single pass
+        """
+        return cls.from_edges(((u, v) for u, neighbors in neighborhood.items() for v in neighbors), neighborhood,
+                              storage)
+
+    def to_edges(self) -> Iterator[tuple[Node, Node]]:
+        """
+        Returns:
+            A generator of all links as pairs of nodes, each one given once. Nodes without links aren't given
+        """
+        for l in self.view.links:
+            yield l.u, l.v
+
+    @classmethod
+    def from_csr(cls, nodes: Sequence[Node], offsets: Sequence[int], targets: Sequence[int],
+                 storage: str = "csr") -> "UndirectedGraph":
+        """
+        Args:
+            nodes: The nodes of the graph. Each one is identified by its index
+            offsets: The row offsets of the adjacency, one more than the nodes
+            targets: The symmetric adjacency rows, where the neighbors of nodes[i] are the nodes with the indices in targets[offsets[i]:offsets[i + 1]], sorted
+            storage: The storage engine of the graph, "set" or "csr"
+        Returns:
+            A graph with the given adjacency. With the "csr" storage engine, the arrays are used as they are, so they may be memory-mapped
+        """
+        nodes = [u if isinstance(u, Node) else Node(u) for u in nodes]
+        if len(offsets) != len(nodes) + 1 or offsets[-1] != len(targets):
+            raise ValueError("The offsets don't match the nodes and the targets!")
+        res = cls(storage=storage)
+        if isinstance(res.__storage, CSRStorage):
+            res.__storage.attach(list(nodes), offsets, targets)
+        else:
+            res.__storage.load(
+                {u: {nodes[j] for j in targets[offsets[i]:offsets[i + 1]]} for i, u in enumerate(nodes)})
+        return res
+
+    def save(self, path: str) -> None:
+        """
+        Args:
+            path: Path to the file to write
+        Save the graph in the binary graph format
+        """
+        from graph_io import save_graph
+
+        save_graph(self, path)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = False, storage: str = None) -> "UndirectedGraph":
+        """
+        Args:
+            path: Path to a file, written by the save method of the same class
+            mmap: Whether to memory-map the file instead of reading it
+            storage: The storage engine of the graph, "set" or "csr". By default, it's "csr" when memory-mapping and "set" otherwise
+        Returns:
+            The saved graph. When memory-mapping into the "csr" storage engine, its adjacency is read lazily from the file
+        """
+        from graph_io import load_graph
+
+        return load_graph(path, mmap, storage, cls)
+
     @property
     def nodes(self) -> set[Node]:
-        return self.__nodes.copy()
+        return self.__storage.nodes.copy()
 
     @property
     def links(self) -> set[Link]:
-        return self.__links.copy()
+        return self.__storage.links.copy()
+
+    @property
+    def view(self) -> UndirectedView:
+        """
+        Returns:
+            Read-only views of the nodes, the links and the neighbors of the graph, which reflect its current state without copying anything. They should not be held onto while the graph is being changed
+        """
+        return self.__view
+
+    @property
+    def storage(self) -> str:
+        """
+        Returns:
+            The name of the storage engine of the graph
+        """
+        return self.__storage.name
 
     @property
     def degrees_sum(self) -> int:
@@ -101,7 +240,7 @@ class UndirectedGraph(Graph):
         Returns:
             The total sum of all node degrees
         """
-        return 2 * len(self.links)
+        return 2 * self.__storage.links_count
 
     @property
     def leaves(self) -> set[Node]:
@@ -109,7 +248,7 @@ class UndirectedGraph(Graph):
         Returns:
             Graph leaves
         """
-        return {n for n in self.nodes if self.leaf(n)}
+        return {n for n in self.view.nodes if self.leaf(n)}
 
     def neighbors(self, u: Node = None) -> dict[Node, set[Node]] | set[Node]:
         """
@@ -119,19 +258,13 @@ class UndirectedGraph(Graph):
             Neighbors of u or dictionary of all nodes and their neighbors
         """
         if u is None:
-            return {n: self.neighbors(n) for n in self.nodes}
-        if not isinstance(u, Node):
-            u = Node(u)
-        if u not in self:
-            raise KeyError("Unrecognized node!")
-        return self.__neighbors[u].copy()
+            return {n: self.neighbors(n) for n in self.view.nodes}
+        return self.view.neighbors(u).copy()
 
     def degrees(self, u: Node = None) -> dict[Node, int] | int:
         if u is None:
-            return {n: self.degrees(n) for n in self.nodes}
-        if not isinstance(u, Node):
-            u = Node(u)
-        return len(self.neighbors(u))
+            return {n: self.degrees(n) for n in self.view.nodes}
+        return len(self.view.neighbors(u))
 
     def leaf(self, n: Node) -> bool:
         """
@@ -154,7 +287,7 @@ class UndirectedGraph(Graph):
         """
         if not isinstance(u, Node):
             u = Node(u)
-        return self.clique(*self.neighbors(u))
+        return self.clique(*self.view.neighbors(u))
 
     def add(self, u: Node, *current_nodes: Node) -> "UndirectedGraph":
         """
@@ -166,8 +299,8 @@ class UndirectedGraph(Graph):
         if not isinstance(u, Node):
             u = Node(u)
         if u not in self:
-            self.__nodes.add(u)
-            self.__neighbors[u] = set()
+            self.__storage.add(u)
+            self._fingerprint = None
             if current_nodes:
                 UndirectedGraph.connect(self, u, *current_nodes)
         return self
@@ -179,7 +312,8 @@ class UndirectedGraph(Graph):
             if u in self:
                 if tmp := self.neighbors(u):
                     UndirectedGraph.disconnect(self, u, *tmp)
-                self.__nodes.remove(u), self.__neighbors.pop(u)
+                self.__storage.remove(u)
+                self._fingerprint = None
         return self
 
     def connect(self, u: Node, v: Node, *rest: Node) -> "UndirectedGraph":
@@ -195,10 +329,9 @@ class UndirectedGraph(Graph):
         for n in {v, *rest}:
             if not isinstance(n, Node):
                 n = Node(n)
-            if u != n and n not in self.neighbors(u) and n in self:
-                self.__neighbors[u].add(n)
-                self.__neighbors[n].add(u)
-                self.__links.add(Link(u, n))
+            if u != n and n not in self.view.neighbors(u) and n in self:
+                self.__storage.connect(u, n)
+                self._fingerprint = None
         return self
 
     def connect_all(self, u: Node, *rest: Node) -> "UndirectedGraph":
@@ -221,10 +354,9 @@ class UndirectedGraph(Graph):
         for n in {v, *rest}:
             if not isinstance(n, Node):
                 n = Node(n)
-            if n in self.neighbors(u):
-                self.__neighbors[u].remove(n)
-                self.__neighbors[n].remove(u)
-                self.__links.remove(Link(u, n))
+            if n in self.view.neighbors(u):
+                self.__storage.disconnect(u, n)
+                self._fingerprint = None
         return self
 
     def disconnect_all(self, n: Node, *rest: Node) -> "UndirectedGraph":
@@ -235,7 +367,7 @@ class UndirectedGraph(Graph):
         return self.disconnect_all(*rest)
 
     def copy(self) -> "UndirectedGraph":
-        return UndirectedGraph(self.neighbors())
+        return UndirectedGraph(self.neighbors(), self.storage)
 
     def excentricity(self, u: Node) -> int:
         """
@@ -244,16 +376,8 @@ class UndirectedGraph(Graph):
         Returns:
             Excentricity of u (the length of the longest of all shortest paths, starting from it)
         """
-        if not isinstance(u, Node):
-            u = Node(u)
-        res, total, layer = -1, {u}, {u}
-        while layer:
-            new = []
-            while layer:
-                new += (nodes := self.neighbors(layer.pop()) - total)
-                total.update(nodes)
-            layer = new.copy()
-            res += 1
+        for _, res, _ in self.bfs(u):
+            pass
         return res
 
     def diameter(self) -> int:
@@ -261,21 +385,17 @@ class UndirectedGraph(Graph):
         Returns:
             The greatest of all excentricity values in the graph
         """
-        return max(self.excentricity(u) for u in self.nodes)
+        return max(self.excentricity(u) for u in self.view.nodes)
 
     def complementary(self) -> "UndirectedGraph":
         return complementary(self)
 
     def connected(self) -> bool:
-        if len(self.links) + 1 < (n := len(self.nodes)):
+        if len(self.view.links) + 1 < (n := len(self.view.nodes)):
             return False
         if self.degrees_sum > (n - 1) * (n - 2) or n < 2:
             return True
-        queue, total = [u := self.nodes.pop()], {u}
-        while queue:
-            queue += list(next_nodes := self.neighbors(queue.pop(0)) - total)
-            total.update(next_nodes)
-        return total == self.nodes
+        return sum(1 for _ in self.bfs(next(iter(self.view.nodes)))) == n
 
     def is_tree(self, connected: bool = False) -> bool:
         """
@@ -284,7 +404,7 @@ class UndirectedGraph(Graph):
         Returns:
             Whether the graph could be a tree
         """
-        return not self or len(self.nodes) == len(self.links) + 1 and (connected or self.connected())
+        return not self or len(self.view.nodes) == len(self.view.links) + 1 and (connected or self.connected())
 
     def tree(self, root: Node = None, dfs: bool = False) -> "Tree":
         """
@@ -304,7 +424,7 @@ class UndirectedGraph(Graph):
         tree = Tree(root)
         rest, total = [root], {root}
         while rest:
-            for v in self.neighbors(u := rest.pop(-bool(dfs))) - total:
+            for v in self.view.neighbors(u := rest.pop(-bool(dfs))) - total:
                 tree.add(u, v), rest.append(v), total.add(v)
         return tree
 
@@ -315,13 +435,7 @@ class UndirectedGraph(Graph):
             v = Node(v)
         if u not in self or v not in self:
             raise KeyError("Unrecognized node(s)!")
-        rest, total = {u}, {u}
-        while rest:
-            if (n := rest.pop()) == v:
-                return True
-            rest.update(new := self.neighbors(n) - total)
-            total.update(new)
-        return False
+        return any(n == v for n, _, _ in breadth_first(u, self.view.neighbors))
 
     def subgraph(self, nodes: Iterable[Node]) -> "UndirectedGraph":
         """
@@ -331,8 +445,8 @@ class UndirectedGraph(Graph):
             The subgraph, that only contains these nodes and all links between them
         """
         try:
-            nodes = self.nodes.intersection(nodes)
-            return UndirectedGraph({u: self.neighbors(u).intersection(nodes) for u in nodes})
+            nodes = self.view.nodes.intersection(nodes)
+            return UndirectedGraph({u: nodes.intersection(self.view.neighbors(u)) for u in nodes})
         except TypeError:
             raise TypeError("Iterable of nodes expected!")
 
@@ -347,11 +461,7 @@ class UndirectedGraph(Graph):
             u = Node(u)
         if u not in self:
             raise KeyError("Unrecognized node!")
-        rest, total = {u}, {u}
-        while rest:
-            rest.update(next_nodes := self.neighbors(rest.pop()) - total)
-            total.update(next_nodes)
-        return self.subgraph(total)
+        return self.subgraph({n for n, _, _ in breadth_first(u, self.view.neighbors)})
 
     def connection_components(self) -> list["UndirectedGraph"]:
         components, rest = [], self.nodes
@@ -366,27 +476,7 @@ class UndirectedGraph(Graph):
         Returns:
             All cut nodes
         """
-
-        def dfs(u, l):
-            colors[u], levels[u], min_back, is_root, count, is_cut = 1, l, l, not l, 0, False
-            for v in self.neighbors(u):
-                if not colors[v]:
-                    count += 1
-                    is_cut |= (b := dfs(v, l + 1)) >= l and not is_root
-                    min_back = min(min_back, b)
-                if colors[v] == 1 and levels[v] < min_back and levels[v] + 1 != l:
-                    min_back = levels[v]
-            if is_cut or is_root and count > 1:
-                res.add(u)
-            colors[u] = 2
-            return min_back
-
-        levels = {n: 0 for n in self.nodes}
-        colors, res = levels.copy(), set()
-        for n in self.nodes:
-            if not colors[n]:
-                dfs(n, 0)
-        return res
+        return biconnected(self.view.nodes, self.view.neighbors)[1]
 
     def bridge_links(self) -> set[Link]:
         """
@@ -394,29 +484,27 @@ class UndirectedGraph(Graph):
         Returns:
             All bridge links
         """
+        return {Link(*b) for b in biconnected(self.view.nodes, self.view.neighbors)[0] if len(b) == 2}
 
-        def dfs(u, l):
-            colors[u], levels[u], min_back = 1, l, l
-            for v in self.neighbors(u):
-                if not colors[v]:
-                    if (b := dfs(v, l + 1)) > l:
-                        res.add(Link(u, v))
-                    else:
-                        min_back = min(min_back, b)
-                if colors[v] == 1 and levels[v] < min_back and levels[v] + 1 != l:
-                    min_back = levels[v]
-            colors[u] = 2
-            return min_back
-
-        levels = {n: 0 for n in self.nodes}
-        colors, res = levels.copy(), set()
-        for n in self.nodes:
-            if not colors[n]:
-                dfs(n, 0)
-        return res
+    def biconnected_components(self) -> list[set[Node]]:
+        """
+        A biconnected component (block) is a maximal by inclusion set of nodes, that stays connected after removing any one of them. Two blocks share at most one node, which is a cut node
+        Returns:
+            All biconnected components. A node without neighbors is a block on its own
+        """
+        return biconnected(self.view.nodes, self.view.neighbors)[0]
+
+    def block_cut_tree(self) -> "UndirectedGraph":
+        """
+        Returns:
+            The block-cut tree (or forest) of the graph. Its nodes are the cut nodes of the graph and a node with a frozenset of nodes for each block. A cut node is connected to all blocks it belongs to
+        """
+        blocks, cut = biconnected(self.view.nodes, self.view.neighbors)
+        links = ((Node(frozenset(b)), u) for b in blocks for u in b.intersection(cut))
+        return UndirectedGraph.from_edges(links, map(Node, map(frozenset, blocks)))
 
     def full(self) -> bool:
-        return self.degrees_sum == (n := len(self.nodes)) * (n - 1)
+        return self.degrees_sum == (n := len(self.view.nodes)) * (n - 1)
 
     def get_shortest_path(self, u: Node, v: Node) -> list[Node]:
         if not isinstance(u, Node):
@@ -425,21 +513,43 @@ class UndirectedGraph(Graph):
             v = Node(v)
         if u not in self or v not in self:
             raise KeyError("Unrecognized node(s)!")
-        previous, queue, total = {}, [u], {u}
-        while queue:
-            if (n := queue.pop(0)) == v:
-                res, curr_node = [n], n
-                while curr_node != u:
-                    res.insert(0, previous[curr_node])
-                    curr_node = previous[curr_node]
-                return res
-            for m in self.neighbors(n) - total:
-                queue.append(m), total.add(m)
-                previous[m] = n
+        parents = {}
+        for n, _, _ in breadth_first(u, self.view.neighbors, parents):
+            if n == v:
+                return path_to(parents, v)
         return []
 
+    def shortest_path_lengths(self, source: Node) -> dict[Node, int]:
+        return {n: d for n, d, _ in self.bfs(source)}
+
+    def shortest_paths_many(self, pairs: Iterable[tuple[Node, Node]]) -> list[list[Node]]:
+        pairs = [(u if isinstance(u, Node) else Node(u), v if isinstance(v, Node) else Node(v)) for u, v in pairs]
+        if any(u not in self or v not in self for u, v in pairs):
+            raise KeyError("Unrecognized node(s)!")
+        return shortest_paths(pairs, self.view.neighbors)
+
+    def multi_source_distances(self, sources: Iterable[Node]) -> dict[Node, int]:
+        sources = [u if isinstance(u, Node) else Node(u) for u in sources]
+        if any(u not in self for u in sources):
+            raise KeyError("Unrecognized node(s)!")
+        return {n: d for n, d, _ in multi_breadth_first(sources, self.view.neighbors)}
+
+    def bfs(self, source: Node) -> Iterator[tuple[Node, int, Node | None]]:
+        if not isinstance(source, Node):
+            source = Node(source)
+        if source not in self:
+            raise KeyError("Unrecognized node!")
+        return breadth_first(source, self.view.neighbors)
+
+    def dfs(self, source: Node) -> Iterator[tuple[Node, int, Node | None]]:
+        if not isinstance(source, Node):
+            source = Node(source)
+        if source not in self:
+            raise KeyError("Unrecognized node!")
+        return depth_first(source, self.view.neighbors)
+
     def euler_tour_exists(self) -> bool:
-        for n in self.nodes:
+        for n in self.view.nodes:
             if self.degrees(n) % 2:
                 return False
         return self.connected()
@@ -453,38 +563,42 @@ class UndirectedGraph(Graph):
             raise KeyError("Unrecognized node(s)!")
         if u == v:
             return self.euler_tour_exists()
-        for n in self.nodes:
+        for n in self.view.nodes:
             if self.degrees(n) % 2 - (n in {u, v}):
                 return False
         return self.connected()
 
     def euler_tour(self) -> list[Node]:
-        if self.euler_tour_exists():
-            tmp = UndirectedGraph.copy(self)
-            return tmp.disconnect(u := (l := tmp.links.pop()).u, v := l.v).euler_walk(u, v) + [u]
-        return []
+        return list(self.iter_euler_tour())
 
     def euler_walk(self, u: Node, v: Node) -> list[Node]:
+        return list(self.iter_euler_walk(u, v))
+
+    def iter_euler_tour(self) -> Iterator[Node]:
+        """
+        Returns:
+            A generator of the nodes of an Euler tour, which starts and ends with the same node, if such exists, otherwise an empty generator. The graph shouldn't be changed while it's being generated
+        """
+        if not self.view.nodes or not self.euler_tour_exists():
+            return iter(())
+        u = next((n for n in self.view.nodes if self.view.neighbors(n)), next(iter(self.view.nodes)))
+        return hierholzer(u, self.view.neighbors, Link)
+
+    def iter_euler_walk(self, u: Node, v: Node) -> Iterator[Node]:
+        """
+        Args:
+            u: First given node
+            v: Second given node
+        Returns:
+            A generator of the nodes of an Euler walk from u to v, if such exists, otherwise an empty generator. The graph shouldn't be changed while it's being generated
+        """
         if not isinstance(u, Node):
             u = Node(u)
         if not isinstance(v, Node):
             v = Node(v)
-        if u not in self or v not in self:
-            raise KeyError("Unrecognized node(s)!")
-        if self.euler_walk_exists(u, v):
-            path = self.get_shortest_path(u, v)
-            tmp = UndirectedGraph.copy(self)
-            for i in range(len(path) - 1):
-                tmp.disconnect(path[i], path[i + 1])
-            for i, u in enumerate(path):
-                while tmp.neighbors(u):
-                    curr = tmp.disconnect(u, v := tmp.neighbors(u).pop()).get_shortest_path(v, u)
-                    for j in range(len(curr) - 1):
-                        tmp.disconnect(curr[j], curr[j + 1])
-                    while curr:
-                        path.insert(i + 1, curr.pop())
-            return path
-        return []
+        if not self.euler_walk_exists(u, v):
+            return iter(())
+        return hierholzer(v, self.view.neighbors, Link)
 
     def links_graph(self) -> "UndirectedGraph":
         """
@@ -519,111 +633,33 @@ class UndirectedGraph(Graph):
             start: A present node or None
         Returns:
             A sort of the graph nodes, based on how early the interval a particular node could represent begins. If it
-            fails, it returns an empty list. If start is given, t only tries to find a way to start from it
-        """
-
-        def extend_last(ll, max_length):
-            last = ll[-1]
-            return ll + (last,) * (max_length - len(ll))
-
-        def find_start_node(graph, nodes=None):
-            if nodes is None:
-                nodes = graph.nodes
-            subgraph = graph.subgraph(nodes)
-            nodes = {n for n in nodes if subgraph.simplicial(n)}
-            if not nodes:
-                return
-            return max(nodes, key=graph.excentricity)
-
-        def component_interval_sort(graph, comp, priority):
-            max_priority = priority[comp[0]]
-            curr_graph = graph.subgraph(comp)
-            start = find_start_node(curr_graph, {n for n in comp if priority[n] == max_priority})
-            if start is None:
-                return []
-            new_neighbors = graph.neighbors(start)
-            return helper(start, curr_graph, {k: 2 * priority[k] + (k in new_neighbors) for k in set(comp) - {start}})
-
-        def helper(u, graph, priority):
-            if graph.full():
-                return [u, *sorted(graph.nodes - {u}, key=priority.get, reverse=True)]
-            order, neighbors = [u], graph.neighbors(u)
-            comps, total, final = [], {u}, set()
-            for v in neighbors:
-                if v not in total:
-                    total.add(v)
-                    rest, comp, this_final = {v}, {v}, False
-                    while rest:
-                        for n in graph.neighbors(_ := rest.pop()):
-                            if n not in total:
-                                if n in neighbors:
-                                    rest.add(n), comp.add(n), total.add(n)
-                                else:
-                                    if final:
-                                        return []
-                                    this_final = True
-                    if this_final:
-                        final = sorted((graph.nodes - neighbors - {u}).union(comp),
-                                       key=lambda x: (priority[x], x in neighbors), reverse=True)
-                    else:
-                        comps.append(sorted(comp, key=priority.get, reverse=True))
-            max_length = max(map(len, comps)) if comps else 0
-            comparison_function = lambda c: extend_last(tuple(map(priority.get, c)), max_length)
-            comps = sorted(comps, key=comparison_function, reverse=True)
-            for i in range(len(comps) - 1):
-                if priority[comps[i][-1]] < priority[comps[i + 1][0]]:
-                    return []
-            if final and comps and priority[final[0]] > priority[comps[-1][-1]]:
-                return []
-            final_neighbors = neighbors.intersection(final)
-            if final and set(final[:len(final_neighbors)]) != final_neighbors:
-                return []
-            for comp in comps:
-                curr_sort = component_interval_sort(graph, comp, priority)
-                if not curr_sort:
-                    return []
-                order += curr_sort
-            if set(order) == graph.nodes:
-                return order
-            curr_sort = component_interval_sort(graph, final, priority)
-            if not curr_sort:
-                return []
-            return order + curr_sort
-
-        if not self.connected():
-            if start is None:
-                result = []
-                for component in self.connection_components():
-                    if not (curr := component.interval_sort()):
-                        return []
-                    result += curr
-                return result
-            if not isinstance(start, Node):
-                start = Node(start)
-            components = self.connection_components()
-            for c in components:
-                if start in c:
-                    begin = c
-                    break
-            else:
-                raise KeyError("Unrecognized node!")
-            components.remove(begin)
-            if not (result := begin.interval_sort(start)):
-                return []
-            for component in components:
-                if not (curr := component.interval_sort()):
-                    return []
-                result += curr
-            return result
+            fails, it returns an empty list. If start is given, it only tries to find a way to start from it
+        The sort is found by ordering the maximal cliques, given by a lexicographic breadth-first search, with partition refinement. A given start is made to begin the sort by hanging a path of two new nodes on it, the intervals of which can only lie before all others or after them
+        """
         if start is None:
-            start = find_start_node(self)
-            if start is None:
-                return []
+            return interval_order(self.view.nodes, self.view.neighbors)
         if not isinstance(start, Node):
             start = Node(start)
         if start not in self:
             raise KeyError("Unrecognized node!")
-        return helper(start, self, {u: u in self.neighbors(start) for u in self.nodes - {start}})
+        component = {u for u, _, _ in breadth_first(start, self.view.neighbors)}
+        rest = [u for u in self.view.nodes if u not in component]
+        x, y = object(), object()
+        extra = {start: [x], x: [start, y], y: [x]}
+
+        def neighbors(u):
+            return extra[u] if u is x or u is y else chain(self.view.neighbors(u), extra.get(u, ()))
+
+        if not (order := interval_order([x, y, *component], neighbors)):
+            return []
+        if order[0] is not x and order[0] is not y:
+            position, buckets = {u: i for i, u in enumerate(order)}, [[] for _ in order]
+            for i, u in enumerate(order):
+                buckets[i + sum(position[v] > i for v in neighbors(u))].append(u)
+            order = [u for bucket in reversed(buckets) for u in bucket]
+        if rest and not (others := interval_order(rest, self.view.neighbors)):
+            return []
+        return order[2:] + (others if rest else [])
 
     def is_full_k_partite(self, k: int = None) -> bool:
         """
@@ -647,20 +683,11 @@ class UndirectedGraph(Graph):
         Returns:
             Whether these given nodes form a clique
         """
-
-        def helper(rest):
-            if not rest:
-                return True
-            u = rest.pop()
-            if not rest.issubset(self.neighbors(u)):
-                return False
-            return helper(rest)
-
         nodes = {x if isinstance(x, Node) else Node(x) for x in nodes}
-        result = nodes.intersection(self.nodes)
-        if result == self.nodes:
+        result = list(nodes.intersection(self.view.nodes))
+        if len(result) == len(self.view.nodes):
             return self.full()
-        return helper(result)
+        return all(self.view.neighbors(u).issuperset(result[i + 1:]) for i, u in enumerate(result))
 
     def cliques(self, k: int) -> list[set[Node]]:
         """
@@ -675,25 +702,27 @@ class UndirectedGraph(Graph):
             raise TypeError("Integer expected!")
         if k < 0:
             return []
-        if not self.connected():
-            return reduce(lambda x, y: x + y, map(lambda g: g.cliques(k), self.connection_components()))
-        return [set(p) for p in combinations(self.nodes, abs(k)) if self.clique(*p)]
+        if not k:
+            return [set()]
+        result = set()
+        for clique in self.iter_maximal_cliques():
+            if len(clique) >= k:
+                result.update(map(frozenset, combinations(clique, k)))
+        return list(map(set, result))
+
+    def iter_maximal_cliques(self) -> Iterator[set[Node]]:
+        """
+        Returns:
+            A generator of all maximal by inclusion cliques in the graph, found with the Bron-Kerbosch algorithm with pivoting in degeneracy order
+        """
+        return maximal_cliques(self.view.nodes, self.view.neighbors)
 
     def max_cliques(self) -> list[set[Node]]:
         """
         Returns:
             All maximal by cardinality cliques in the graph
         """
-        result, low, high = [set()], 1, len(self.nodes)
-        k = 0
-        while low <= high:
-            if curr := self.cliques(mid := (low + high) // 2):
-                low = mid + 1
-                if mid > k:
-                    result, k = curr, mid
-            else:
-                high = mid - 1
-        return result
+        return max_size(self.iter_maximal_cliques())
 
     def max_cliques_node(self, u: Node) -> list[set[Node]]:
         """
@@ -704,7 +733,7 @@ class UndirectedGraph(Graph):
         """
         if not isinstance(u, Node):
             u = Node(u)
-        return list(map({u}.union, self.subgraph(self.neighbors(u)).max_cliques()))
+        return max_size(bron_kerbosch({u}, set(self.neighbors(u)), set(), self.view.neighbors))
 
     def all_maximal_cliques_node(self, u: Node) -> list[set[Node]]:
         """
@@ -715,23 +744,26 @@ class UndirectedGraph(Graph):
         """
         if not isinstance(u, Node):
             u = Node(u)
-        return list(map({u}.union, self.subgraph(self.neighbors(u)).complementary().maximal_independent_sets()))
+        return list(bron_kerbosch({u}, set(self.neighbors(u)), set(), self.view.neighbors))
 
     def maximal_independent_sets(self) -> list[set[Node]]:
         """
         Returns:
             All maximal by inclusion independent sets in the graph
         """
+        return list(self.iter_maximal_independent_sets())
 
-        def generator(result=set(), total=set(), i=0):
-            for j, n in enumerate(list(self.nodes)[i:]):
-                if result.isdisjoint(self.neighbors(n)):
-                    for res in generator({n, *result}, {n, *self.neighbors(n), *total}, i + j + 1):
-                        yield res
-            if total == self.nodes:
-                yield result
-
-        return [i_s for i_s in generator()]
+    def iter_maximal_independent_sets(self, limit: int = None, min_size: int = 0) -> Iterator[set[Node]]:
+        """
+        Args:
+            limit: The maximal number of generated sets. By default, all are generated
+            min_size: Sets with fewer nodes are skipped
+        Returns:
+            A generator of the maximal by inclusion independent sets in the graph
+        """
+        order, masks = bitsets(self.view.nodes, self.view.neighbors)
+        sets = independent_bitsets(masks, (1 << len(order)) - 1, min_size=min_size)
+        return islice((bitset_nodes(order, s) for s in sets), limit)
 
     def cliques_graph(self) -> "UndirectedGraph":
         """
@@ -741,26 +773,16 @@ class UndirectedGraph(Graph):
         """
         return cliques_graph(self)
 
-    def chromatic_nodes_partition(self) -> list[set[Node]]:
+    def chromatic_nodes_partition(self, exact: bool = True) -> list[set[Node]]:
         """
+        Args:
+            exact: Whether the partition has to be minimal. Otherwise, it's found quickly with the DSatur heuristic
         Returns:
             A list of independent sets in the graph, that cover all nodes without intersecting. This list has as few elements as possible
         """
-
-        def helper(partition, union=set(), i=0):
-            if union == self.nodes:
-                return partition
-            res, entered = list(map(lambda x: {x}, self.nodes)), False
-            for j, s in enumerate(independent_sets[i:]):
-                if {*s, *union} == self.nodes or s.isdisjoint(union):
-                    entered = True
-                    if len(curr := helper(partition + [s - union], {*s, *union}, i + j + 1)) == 2:
-                        return curr
-                    res = min(res, curr, key=len)
-            if not entered:
-                res = partition + self.subgraph(self.nodes - union).chromatic_nodes_partition()
-            return res
-
+        if not exact:
+            order, masks = bitsets(self.view.nodes, self.view.neighbors)
+            return color_classes(order, dsatur(masks))
         if not self.connected():
             r = [comp.chromatic_nodes_partition() for comp in self.connection_components()]
             final = r[0]
@@ -785,21 +807,43 @@ class UndirectedGraph(Graph):
             result = []
             for u in sort:
                 for i, partition in enumerate(result):
-                    if self.neighbors(u).isdisjoint(partition):
+                    if self.view.neighbors(u).isdisjoint(partition):
                         result[i].add(u)
                         break
                 else:
                     result.append({u})
             return result
-        independent_sets = self.maximal_independent_sets()
-        return helper([])
+        order, masks = bitsets(self.view.nodes, self.view.neighbors)
+        return color_classes(order, coloring(masks))
 
-    def chromatic_links_partition(self) -> list[set[Link]]:
+    def chromatic_links_partition(self, exact: bool = True) -> list[set[Link]]:
         """
         Similar to chromatic nodes partition, except links, that share a node, are in different sets
-        """
-        return [set(map(lambda x: x.value, s)) for s in
-                UndirectedGraph.copy(self).links_graph().chromatic_nodes_partition()]
+        Args:
+            exact: Whether the partition has to be minimal. Otherwise, it has at most one more set than the maximal degree in the graph. Bipartite graphs always get as many sets, as the maximal degree. Since every set has at most half of the nodes, the search for fewer sets is skipped, when the links don't fit in as many sets, as the maximal degree
+        """
+        links = list(self.view.links)
+        degree = max((len(self.view.neighbors(u)) for u in self.view.nodes), default=0)
+        bipartite = self.__bipartite()
+        colors = edge_coloring([(l.u, l.v) for l in links], degree + (not bipartite), bipartite)
+        overfull = len(links) > degree * (len(self.view.nodes) // 2)
+        if exact and not bipartite and not overfull and max(colors, default=-1) == degree:
+            at, masks = {u: 0 for u in self.view.nodes}, [0] * len(links)
+            for i, l in enumerate(links):
+                at[l.u] |= 1 << i
+                at[l.v] |= 1 << i
+            for i, l in enumerate(links):
+                masks[i] = (at[l.u] | at[l.v]) & ~(1 << i)
+            colors = coloring(masks, colors)
+        return [s for s in color_classes(links, colors) if s]
+
+    def __bipartite(self) -> bool:
+        parity = {}
+        for u in self.view.nodes:
+            if u not in parity:
+                for v, d, _ in breadth_first(u, self.view.neighbors):
+                    parity[v] = d % 2
+        return all(parity[l.u] != parity[l.v] for l in self.view.links)
 
     def vertex_cover(self) -> set[Node]:
         """
@@ -814,15 +858,6 @@ class UndirectedGraph(Graph):
             A minimal by cardinality set of nodes, that cover all nodes in the graph
         """
 
-        def helper(curr, total, i=0):
-            if total == self.nodes:
-                return curr.copy()
-            result = self.nodes
-            for j, u in enumerate(list(nodes)[i:]):
-                if len(res := helper({u, *curr}, {u, *self.neighbors(u), *total}, i + j + 1)) < len(result):
-                    result = res
-            return result
-
         if not self.connected():
             return reduce(lambda x, y: x.union(y), [comp.dominating_set() for comp in self.connection_components()])
         if self.is_tree(True):
@@ -834,11 +869,8 @@ class UndirectedGraph(Graph):
             if (neighbors := self.neighbors(u)) and {u, *neighbors} != self.nodes:
                 res.add(neighbors.pop())
             return res
-        nodes, isolated = self.nodes, set()
-        for n in nodes:
-            if not self.degrees(n):
-                isolated.add(n), nodes.remove(n)
-        return helper(isolated, isolated)
+        order, masks = bitsets(self.view.nodes, self.view.neighbors)
+        return bitset_nodes(order, dominating_bitset(masks, [1] * len(order)))
 
     def independent_set(self) -> set[Node]:
         """
@@ -856,10 +888,11 @@ class UndirectedGraph(Graph):
         if sort := self.interval_sort():
             result = set()
             for u in reversed(sort):
-                if self.neighbors(u).isdisjoint(result):
+                if self.view.neighbors(u).isdisjoint(result):
                     result.add(u)
             return result
-        return max(self.maximal_independent_sets(), key=len)
+        order, masks = bitsets(self.view.nodes, self.view.neighbors)
+        return bitset_nodes(order, independent_bitset(masks, [1] * len(order)))
 
     def cycle_with_length(self, length: int) -> list[Node]:
         try:
@@ -869,8 +902,8 @@ class UndirectedGraph(Graph):
         if length < 3:
             return []
         if length == 3:
-            for l in self.links:
-                if intersection := self.neighbors(u := l.u).intersection(self.neighbors(v := l.v)):
+            for l in self.view.links:
+                if intersection := self.view.neighbors(u := l.u).intersection(self.view.neighbors(v := l.v)):
                     return [u, v, intersection.pop(), u]
             return []
         tmp = UndirectedGraph.copy(self)
@@ -885,7 +918,7 @@ class UndirectedGraph(Graph):
         def dfs(x: Node, l: int, stack: list[Link]):
             if not l:
                 return list(map(lambda link: link.u, stack)) + [v] if x == v else []
-            for y in filter(lambda _x: Link(x, _x) not in stack, self.neighbors(x)):
+            for y in filter(lambda _x: Link(x, _x) not in stack, self.view.neighbors(x)):
                 if res := dfs(y, l - 1, stack + [Link(x, y)]):
                     return res
             return []
@@ -905,28 +938,13 @@ class UndirectedGraph(Graph):
         return dfs(u, length, [])
 
     def hamilton_tour_exists(self) -> bool:
-        def dfs(x):
-            if tmp.nodes == {x}:
-                return x in can_end_in
-            if all(y not in tmp for y in can_end_in):
-                return False
-            neighbors = tmp.neighbors(x)
-            tmp.remove(x)
-            for y in neighbors:
-                if dfs(y):
-                    tmp.add(x, *neighbors)
-                    return True
-            tmp.add(x, *neighbors)
-            return False
-
-        if (n := len(self.nodes)) == 1 or (2 * (m := len(self.links)) > (n - 1) * (n - 2) + 2 or n > 2 and all(
-                2 * self.degrees(node) >= n for node in self.nodes)):
+        if (n := len(self.view.nodes)) == 1 or (
+                2 * (m := len(self.view.links)) > (n - 1) * (n - 2) + 2 or n > 2 and all(
+                2 * self.degrees(node) >= n for node in self.view.nodes)):
             return True
-        if n > m or self.leaves or not self.connected():
+        if n > m:
             return False
-        tmp = UndirectedGraph.copy(self)
-        can_end_in = tmp.neighbors(u := self.nodes.pop())
-        return dfs(u)
+        return bool(self.hamilton_tour())
 
     def hamilton_walk_exists(self, u: Node, v: Node) -> bool:
         if not isinstance(u, Node):
@@ -935,80 +953,57 @@ class UndirectedGraph(Graph):
             v = Node(v)
         if u not in self or v not in self:
             raise KeyError("Unrecognized node(s)!")
-        if v in self.neighbors(u):
-            return True if all(n in {u, v} for n in self.nodes) else self.hamilton_tour_exists()
-        return UndirectedGraph.copy(self).connect(u, v).hamilton_tour_exists()
+        return bool(self.hamilton_walk(u, v))
 
     def hamilton_tour(self) -> list[Node]:
-        if len(self.nodes) == 1:
+        if len(self.view.nodes) == 1:
             return [self.nodes.pop()]
         if not self or self.leaves or not self.connected():
             return []
-        u = self.nodes.pop()
-        for v in self.neighbors(u):
-            if res := self.hamilton_walk(u, v):
-                return res + [u]
+        order, masks = bitsets(self.view.nodes, self.view.neighbors)
+        if path := hamilton_bitsets(masks, 0, masks[0]):
+            return [order[i] for i in path] + [order[0]]
         return []
 
     def hamilton_walk(self, u: Node = None, v: Node = None) -> list[Node]:
-        def dfs(x, stack):
-            if not tmp.degrees(x) or v is not None and not tmp.degrees(v) or not tmp.connected():
-                return []
-            too_many = v is not None
-            for n in tmp.nodes:
-                if n not in {x, v} and tmp.leaf(n):
-                    if too_many:
-                        return []
-                    too_many = True
-            if not tmp.nodes:
-                return stack
-            neighbors = tmp.neighbors(x)
-            tmp.remove(x)
-            if v is None and len(tmp.nodes) == 1 and tmp.nodes == neighbors:
-                tmp.add(x, (y := neighbors.copy().pop()))
-                return stack + [y]
-            for y in neighbors:
-                if y == v:
-                    if tmp.nodes == {v}:
-                        tmp.add(x, *neighbors)
-                        return stack + [v]
-                    continue
-                if res := dfs(y, stack + [y]):
-                    tmp.add(x, *neighbors)
-                    return res
-            tmp.add(x, *neighbors)
-            return []
-
         if u is not None and not isinstance(u, Node):
             u = Node(u)
         if v is not None and not isinstance(v, Node):
             v = Node(v)
-        tmp = UndirectedGraph.copy(self)
         if u is None:
             u, v = v, u
-        if u is None:
-            if v is not None and v not in self:
-                raise KeyError("Unrecognized node.")
-            for _u in self.nodes:
-                if result := dfs(_u, [_u]):
-                    return result
-                if self.leaf(_u):
-                    return []
+        if u is not None and u not in self or v is not None and v not in self:
+            raise KeyError("Unrecognized node(s)!")
+        if not self.connected():
             return []
-        if u not in self or v is not None and v not in self:
-            raise KeyError("Unrecognized node(s).")
-        return dfs(u, [u])
+        order, masks = bitsets(self.view.nodes, self.view.neighbors)
+        index = {x: i for i, x in enumerate(order)}
+        ends = (1 << len(order)) - 1 if v is None else 1 << index[v]
+        starts = [index[u]] if u is not None else range(len(order))
+        if u is None and (leaves := [i for i, m in enumerate(masks) if m.bit_count() == 1]):
+            starts = leaves[:1]
+        for s in starts:
+            if path := hamilton_bitsets(masks, s, ends):
+                return [order[i] for i in path]
+        return []
 
     def isomorphic_bijection(self, other: "UndirectedGraph") -> dict[Node, Node]:
         return isomorphic_bijection_undirected(self, other)
 
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            self._fingerprint = fingerprint(
+                self.node_weights() if hasattr(self, "node_weights") else dict.fromkeys(self.view.nodes),
+                undirected_labels(self, self.link_weights() if hasattr(self, "link_weights") else {}))
+        return self._fingerprint
+
     def __bool__(self) -> bool:
-        return bool(self.nodes)
+        return bool(self.view.nodes)
 
     def __contains__(self, u: Node) -> bool:
         if not isinstance(u, Node):
             u = Node(u)
-        return u in self.nodes
+        return u in self.__storage
 
     def __add__(self, other: "UndirectedGraph") -> "UndirectedGraph":
         """
@@ -1034,19 +1029,76 @@ class WeightedNodesUndirectedGraph(UndirectedGraph):
     Class for implementing and undirected graph with weights on the nodes
     """
 
-    def __init__(self, neighborhood: dict[Node, tuple[float, Iterable[Node]]] = {}) -> None:
+    def __init__(self, neighborhood: dict[Node, tuple[float, Iterable[Node]]] = {}, storage: str = "set") -> None:
         """
         Args:
             neighborhood: A dictionary, that maps a node to a tuple with its weight and its neighbors
+            storage: The storage engine of the graph, "set" or "csr"
         """
-        super().__init__()
-        self.__node_weights = {}
+        super().__init__(storage=storage)
+        self.__node_weights, self._negative_nodes = {}, 0
         for n, (w, _) in neighborhood.items():
             self.add((n, w))
         for u, (_, neighbors) in neighborhood.items():
             for v in neighbors:
                 self.add((v, 0), u), self.connect(u, v)
 
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[Node, Node]], nodes: dict[Node, float] = {},
+                   storage: str = "set") -> "WeightedNodesUndirectedGraph":
+        """
+        Args:
+            edges: An iterable of pairs of nodes, each of which is a link. Repeated links and loops are skipped
+            nodes: A dictionary of node weights. Nodes, that aren't in it, get a weight of 0
+            storage: The storage engine of the graph, "set" or "csr"
+        Returns:
+            A graph, built in a single pass over the given links, which are loaded into the storage at once
+        """
+        try:
+            weights = {(u if isinstance(u, Node) else Node(u)): float(w) for u, w in nodes.items()}
+        except (TypeError, ValueError):
+            raise TypeError("Real value expected!")
+        res = super().from_edges(edges, weights, storage)
+        res.__node_weights.update((u, weights.get(u, 0.0)) for u in res.view.nodes)
+        res._negative_nodes = sum(w < 0 for w in res.__node_weights.values())
+        return res
+
+    @classmethod
+    def from_csr(cls, nodes: Sequence[Node], offsets: Sequence[int], targets: Sequence[int],
+                 node_weights: Sequence[float] = None, storage: str = "csr") -> "WeightedNodesUndirectedGraph":
+        """
+        Args:
+            nodes: The nodes of the graph. Each one is identified by its index
+            offsets: The row offsets of the adjacency, one more than the nodes
+            targets: The symmetric adjacency rows, where the neighbors of nodes[i] are the nodes with the indices in targets[offsets[i]:offsets[i + 1]], sorted
+            node_weights: The weight of each node in the order of the nodes. By default, every node weighs 0
+            storage: The storage engine of the graph, "set" or "csr"
+        Returns:
+            A graph with the given adjacency and node weights. With the "csr" storage engine, the arrays are used as they are, so they may be memory-mapped
+        """
+        try:
+            weights = [0.0] * len(nodes) if node_weights is None else [float(w) for w in node_weights]
+        except (TypeError, ValueError):
+            raise TypeError("Real value expected!")
+        nodes = [u if isinstance(u, Node) else Node(u) for u in nodes]
+        res = super().from_csr(nodes, offsets, targets, storage=storage)
+        res.__node_weights.update(zip(nodes, weights))
+        res._negative_nodes = sum(w < 0 for w in weights)
+        return res
+
+    @classmethod
+    def from_adjacency(cls, neighborhood: dict[Node, tuple[float, Iterable[Node]]],
+                       storage: str = "set") -> "WeightedNodesUndirectedGraph":
+        """
+        Args:
+            neighborhood: A dictionary, that maps a node to a tuple with its weight and its neighbors
+            storage: The storage engine of the graph, "set" or "csr"
+        Returns:
+            The same graph as the one, given by the constructor, but built in a single pass
+        """
+        return cls.from_edges(((u, v) for u, (_, neighbors) in neighborhood.items() for v in neighbors),
+                              {u: w for u, (w, _) in neighborhood.items()}, storage)
+
     def node_weights(self, n: Node = None) -> dict[Node, float] | float:
         """
         Args:
@@ -1057,7 +1109,7 @@ class WeightedNodesUndirectedGraph(UndirectedGraph):
         if n is not None and not isinstance(n, Node):
             n = Node(n)
         if n is None:
-            return {u: self.node_weights(u) for u in self.nodes}
+            return {u: self.__node_weights[u] for u in self.view.nodes}
         return self.__node_weights[n]
 
     @property
@@ -1080,7 +1132,7 @@ class WeightedNodesUndirectedGraph(UndirectedGraph):
             if u in self:
                 if not isinstance(u, Node):
                     u = Node(u)
-                self.__node_weights.pop(u)
+                self._negative_nodes -= self.__node_weights.pop(u) < 0
         return super().remove(n, *rest)
 
     def set_weight(self, u: Node, w: float) -> "WeightedNodesUndirectedGraph":
@@ -1094,9 +1146,11 @@ class WeightedNodesUndirectedGraph(UndirectedGraph):
             u = Node(u)
         if u in self:
             try:
-                self.__node_weights[u] = float(w)
+                w = float(w)
             except ValueError:
                 raise TypeError("Real value expected!")
+            self._negative_nodes += (w < 0) - (self.__node_weights.get(u, 0.0) < 0)
+            self.__node_weights[u], self._fingerprint = w, None
         return self
 
     def increase_weight(self, u: Node, w: float) -> "WeightedNodesUndirectedGraph":
@@ -1108,15 +1162,16 @@ class WeightedNodesUndirectedGraph(UndirectedGraph):
         """
         if not isinstance(u, Node):
             u = Node(u)
-        if u in self.node_weights():
+        if u in self.__node_weights:
             try:
-                self.set_weight(u, self.node_weights(u) + float(w))
+                self.set_weight(u, self.__node_weights[u] + float(w))
             except ValueError:
                 raise TypeError("Real value expected!")
         return self
 
     def copy(self) -> "WeightedNodesUndirectedGraph":
-        return WeightedNodesUndirectedGraph({n: (self.node_weights(n), self.neighbors(n)) for n in self.nodes})
+        return WeightedNodesUndirectedGraph({n: (self.node_weights(n), self.neighbors(n)) for n in self.nodes},
+                                            self.storage)
 
     def weighted_tree(self, n: Node = None, dfs: bool = False) -> "WeightedTree":
         """
@@ -1136,14 +1191,14 @@ class WeightedNodesUndirectedGraph(UndirectedGraph):
         tree = WeightedTree((n, self.node_weights(n)))
         queue, total = [n], {n}
         while queue:
-            for v in self.neighbors(u := queue.pop(-bool(dfs))) - total:
+            for v in self.view.neighbors(u := queue.pop(-bool(dfs))) - total:
                 tree.add(u, {v: self.node_weights(v)}), queue.append(v), total.add(v)
         return tree
 
     def subgraph(self, nodes: Iterable[Node]) -> "WeightedNodesUndirectedGraph":
         try:
-            nodes = self.nodes.intersection(nodes)
-            neighborhood = {u: (self.node_weights(u), self.neighbors(u).intersection(nodes)) for u in nodes}
+            nodes = self.view.nodes.intersection(nodes)
+            neighborhood = {u: (self.node_weights(u), nodes.intersection(self.view.neighbors(u))) for u in nodes}
             return WeightedNodesUndirectedGraph(neighborhood)
         except TypeError:
             raise TypeError("Iterable of nodes expected!")
@@ -1163,7 +1218,16 @@ class WeightedNodesUndirectedGraph(UndirectedGraph):
         Returns:
             A path between u and v with the least possible sum of node weights
         """
-        return self.weighted_graph().minimal_path(u, v)
+        if not isinstance(u, Node):
+            u = Node(u)
+        if not isinstance(v, Node):
+            v = Node(v)
+        if u not in self or v not in self:
+            raise KeyError("Unrecognized node(s)!")
+        if self._negative_nodes:
+            return self.weighted_graph().minimal_path(u, v)
+        weights = self.__node_weights
+        return cheapest_path(u, v, weights[u], lambda x: ((y, weights[y]) for y in self.view.neighbors(x)))[0]
 
     def weighted_vertex_cover(self) -> set[Node]:
         """
@@ -1178,17 +1242,6 @@ class WeightedNodesUndirectedGraph(UndirectedGraph):
             A minimal by sum of the weights set of nodes, that cover all nodes in the graph
         """
 
-        def helper(curr, total, total_weight, i=0):
-            if total == self.nodes:
-                return curr.copy(), total_weight
-            result, result_sum = self.nodes, self.total_nodes_weight
-            for j, u in enumerate(list(nodes)[i:]):
-                cover, weight = helper({u, *curr}, {u, *self.neighbors(u), *total},
-                                       total_weight + self.node_weights(u), i + j + 1)
-                if weight < result_sum:
-                    result, result_sum = cover, weight
-            return result, result_sum
-
         if not self:
             return set()
         if not self.connected():
@@ -1196,12 +1249,8 @@ class WeightedNodesUndirectedGraph(UndirectedGraph):
                                                     self.connection_components()])
         if self.is_tree(True):
             return self.weighted_tree().weighted_dominating_set()
-        nodes, isolated, weights = self.nodes, set(), 0
-        for n in nodes:
-            if not self.degrees(n):
-                isolated.add(n), nodes.remove(n)
-                weights += self.node_weights(n)
-        return helper(isolated, isolated, weights)[0]
+        order, masks = bitsets(self.view.nodes, self.view.neighbors)
+        return bitset_nodes(order, dominating_bitset(masks, list(map(self.node_weights, order))))
 
     def weighted_independent_set(self) -> set[Node]:
         """
@@ -1209,18 +1258,6 @@ class WeightedNodesUndirectedGraph(UndirectedGraph):
             A set of non-neighboring nodes with a maximal possible sum of the weights
         """
 
-        def helper(curr, total=set(), res_sum=0.0, i=0):
-            if total == self.nodes:
-                return curr, res_sum
-            result, result_sum = set(), 0
-            for j, u in enumerate(list(self.nodes)[i:]):
-                if u not in total and self.node_weights(u) > 0:
-                    cover, weight = helper({u, *curr}, {u, *total, *self.neighbors(u)},
-                                           res_sum + self.node_weights(u), i + j + 1)
-                    if weight > result_sum:
-                        result, result_sum = cover, weight
-            return result, result_sum
-
         if not self:
             return set()
         if not self.connected():
@@ -1228,7 +1265,8 @@ class WeightedNodesUndirectedGraph(UndirectedGraph):
                           [comp.weighted_independent_set() for comp in self.connection_components()])
         if self.is_tree(True):
             return self.weighted_tree().weighted_independent_set()
-        return helper(set())[0]
+        order, masks = bitsets(self.view.nodes, self.view.neighbors)
+        return bitset_nodes(order, independent_bitset(masks, list(map(self.node_weights, order))))
 
 
 class WeightedLinksUndirectedGraph(UndirectedGraph):
@@ -1236,18 +1274,90 @@ class WeightedLinksUndirectedGraph(UndirectedGraph):
     Class for implementing and undirected graph with weights on the links
     """
 
-    def __init__(self, neighborhood: dict[Node, dict[Node, float]] = {}) -> None:
+    def __init__(self, neighborhood: dict[Node, dict[Node, float]] = {}, storage: str = "set") -> None:
         """
         Args:
             neighborhood: A dictionary of nodes and another dictionary, associated with each node. Each such dictionary has for keys the neighbors of said node and the value of each neighbor is the weight of the link between them
+            storage: The storage engine of the graph, "set" or "csr"
         """
-        super().__init__()
-        self.__link_weights = {}
+        super().__init__(storage=storage)
+        self.__link_weights, self._negative_links = {}, 0
         for u, neighbors in neighborhood.items():
             self.add(u)
             for v, w in neighbors.items():
                 self.add(v, {u: w}), self.connect(v, {u: w})
 
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[Node, Node, float]], nodes: Iterable[Node] = (),
+                   storage: str = "set") -> "WeightedLinksUndirectedGraph":
+        """
+        Args:
+            edges: An iterable of triples of two nodes and the weight of the link between them. Loops are skipped and only the first weight of a repeated link is kept
+            nodes: Nodes to add even if they have no links
+            storage: The storage engine of the graph, "set" or "csr"
+        Returns:
+            A graph, built in a single pass over the given links, which are loaded into the storage at once
+        """
+
+        def pairs():
+            for u, v, w in edges:
+                try:
+                    weights.setdefault(l := Link(u, v), float(w))
+                except (TypeError, ValueError):
+                    raise TypeError("Real value expected!")
+                yield l.u, l.v
+
+        weights = {}
+        res = super().from_edges(pairs(), nodes, storage)
+        res.__link_weights.update((l, w) for l, w in weights.items() if l.u != l.v)
+        res._negative_links = sum(w < 0 for w in res.__link_weights.values())
+        return res
+
+    @classmethod
+    def from_csr(cls, nodes: Sequence[Node], offsets: Sequence[int], targets: Sequence[int],
+                 link_weights: Sequence[float] = None, storage: str = "csr") -> "WeightedLinksUndirectedGraph":
+        """
+        Args:
+            nodes: The nodes of the graph. Each one is identified by its index
+            offsets: The row offsets of the adjacency, one more than the nodes
+            targets: The symmetric adjacency rows, where the neighbors of nodes[i] are the nodes with the indices in targets[offsets[i]:offsets[i + 1]], sorted
+            link_weights: The weight of the link, that each element of targets makes with its row's node. The weight is read at the row of the link's end with the smaller index. By default, every link weighs 0
+            storage: The storage engine of the graph, "set" or "csr"
+        Returns:
+            A graph with the given adjacency and link weights. With the "csr" storage engine, the arrays are used as they are, so they may be memory-mapped
+        """
+        nodes = [u if isinstance(u, Node) else Node(u) for u in nodes]
+        res = super().from_csr(nodes, offsets, targets, storage=storage)
+        try:
+            res.__link_weights.update(
+                (Link(u, nodes[targets[k]]), 0.0 if link_weights is None else float(link_weights[k]))
+                for i, u in enumerate(nodes) for k in range(offsets[i], offsets[i + 1]) if i < targets[k])
+        except (TypeError, ValueError):
+            raise TypeError("Real value expected!")
+        res._negative_links = sum(w < 0 for w in res.__link_weights.values())
+        return res
+
+    @classmethod
+    def from_adjacency(cls, neighborhood: dict[Node, dict[Node, float]],
+                       storage: str = "set") -> "WeightedLinksUndirectedGraph":
+        """
+        Args:
+            neighborhood: A dictionary of nodes and another dictionary, associated with each node. Each such dictionary has for keys the neighbors of said node and the value of each neighbor is the weight of the link between them
+            storage: The storage engine of the graph, "set" or "csr"
+        Returns:
+            The same graph as the one, given by the constructor, but built in a single pass
+        """
+        return cls.from_edges(((u, v, w) for u, neighbors in neighborhood.items() for v, w in neighbors.items()),
+                              neighborhood, storage)
+
+    def to_edges(self) -> Iterator[tuple[Node, Node, float]]:
+        """
+        Returns:
+            A generator of all links as triples of two nodes and the weight of the link between them, each one given once
+        """
+        for l in self.view.links:
+            yield l.u, l.v, self.__link_weights[l]
+
     def link_weights(self, u_l: Node | Link = None, v: Node = None) -> dict[Node, float] | dict[Link, float] | float:
         """
         Args:
@@ -1260,12 +1370,12 @@ class WeightedLinksUndirectedGraph(UndirectedGraph):
             If one node is passed, return a dictionary with all of its neighbors and the weight of the link it shares with each of them
         """
         if u_l is None:
-            return {l: self.link_weights(l) for l in self.links}
+            return {l: self.__link_weights[l] for l in self.view.links}
         elif isinstance(u_l, Link):
             return self.__link_weights[u_l]
         else:
             if v is None:
-                return {n: self.link_weights(Link(n, u_l)) for n in self.neighbors(u_l)}
+                return {n: self.__link_weights[Link(n, u_l)] for n in self.view.neighbors(u_l)}
             return self.link_weights(Link(u_l, v))
 
     @property
@@ -1288,15 +1398,15 @@ class WeightedLinksUndirectedGraph(UndirectedGraph):
     def remove(self, n: Node, *rest: Node) -> "WeightedLinksUndirectedGraph":
         for u in {n, *rest}:
             if u in self:
-                for v in self.neighbors(u):
-                    self.__link_weights.pop(Link(u, v))
+                for v in self.view.neighbors(u):
+                    self._negative_links -= self.__link_weights.pop(Link(u, v)) < 0
         return super().remove(n, *rest)
 
     def connect(self, u: Node, nodes_weights: dict[Node, float] = {}) -> "WeightedLinksUndirectedGraph":
         if not isinstance(u, Node):
             u = Node(u)
         nodes_weights = {(k if isinstance(k, Node) else Node(k)): v for k, v in nodes_weights.items()}
-        nodes_weights = {v: w for v, w in nodes_weights.items() if v not in self.neighbors(u)}
+        nodes_weights = {v: w for v, w in nodes_weights.items() if v not in self.view.neighbors(u)}
         if nodes_weights:
             super().connect(u, *nodes_weights.keys())
             if u in self:
@@ -1314,8 +1424,8 @@ class WeightedLinksUndirectedGraph(UndirectedGraph):
     def disconnect(self, u: Node, v: Node, *rest: Node) -> "WeightedLinksUndirectedGraph":
         super().disconnect(u, v, *rest)
         for n in {v, *rest}:
-            if (l := Link(u, n)) in self.link_weights():
-                self.__link_weights.pop(l)
+            if (l := Link(u, n)) in self.__link_weights:
+                self._negative_links -= self.__link_weights.pop(l) < 0
         return self
 
     def set_weight(self, l: Link, w: float) -> "WeightedLinksUndirectedGraph":
@@ -1326,8 +1436,10 @@ class WeightedLinksUndirectedGraph(UndirectedGraph):
         Set the weight of link l to w
         """
         try:
-            if l in self.links:
-                self.__link_weights[l] = float(w)
+            if l in self.view.links:
+                w = float(w)
+                self._negative_links += (w < 0) - (self.__link_weights.get(l, 0.0) < 0)
+                self.__link_weights[l], self._fingerprint = w, None
             return self
         except TypeError:
             raise TypeError("Real value expected!")
@@ -1340,18 +1452,18 @@ class WeightedLinksUndirectedGraph(UndirectedGraph):
         Increase the weight of link l with w
         """
         try:
-            if l in self.link_weights():
-                self.set_weight(l, self.link_weights(l) + float(w))
+            if l in self.__link_weights:
+                self.set_weight(l, self.__link_weights[l] + float(w))
             return self
         except ValueError:
             raise TypeError("Real value expected!")
 
     def copy(self) -> "WeightedLinksUndirectedGraph":
-        return WeightedLinksUndirectedGraph({n: self.link_weights(n) for n in self.nodes})
+        return WeightedLinksUndirectedGraph({n: self.link_weights(n) for n in self.nodes}, self.storage)
 
     def subgraph(self, nodes: Iterable[Node]) -> "WeightedLinksUndirectedGraph":
         try:
-            nodes = self.nodes.intersection(nodes)
+            nodes = self.view.nodes.intersection(nodes)
             neighborhood = {u: {k: v for k, v in self.link_weights(u).items() if k in nodes} for u in nodes}
             return WeightedLinksUndirectedGraph(neighborhood)
         except TypeError:
@@ -1362,80 +1474,23 @@ class WeightedLinksUndirectedGraph(UndirectedGraph):
         Returns:
             A spanning tree or forrest of trees of the graph with the minimal possible weights sum
         """
+        return self.minimal_spanning_forest()[0]
 
-        def insert(x):
-            low, high, w = 0, len(bridge_links), self.link_weights(x)
-            while low < high:
-                mid = (low + high) // 2
-                if w == (mid_weight := self.link_weights(bridge_links[mid])):
-                    bridge_links.insert(mid, x)
-                    return
-                if w < mid_weight:
-                    high = mid
-                else:
-                    if low == mid:
-                        break
-                    low = mid + 1
-            bridge_links.insert(high, x)
-
-        def remove(x):
-            low, high, w = 0, len(bridge_links), self.link_weights(x)
-            while low < high:
-                mid = (low + high) // 2
-                if w == (f_mid := self.link_weights(mid_l := bridge_links[mid])):
-                    if x == mid_l:
-                        bridge_links.pop(mid)
-                        return
-                    i, j, still = mid - 1, mid + 1, True
-                    while still:
-                        still = False
-                        if i >= 0 and self.link_weights(bridge_links[i]) == w:
-                            if x == bridge_links[i]:
-                                bridge_links.pop(i)
-                                return
-                            i -= 1
-                            still = True
-                        if j < len(bridge_links) and self.link_weights(bridge_links[j]) == w:
-                            if x == bridge_links[j]:
-                                bridge_links.pop(j)
-                                return
-                            j += 1
-                            still = True
-                    return
-                if w < f_mid:
-                    high = mid
-                else:
-                    if low == mid:
-                        return
-                    low = mid
-
-        if not self.connected():
-            return reduce(lambda x, y: x.union(y.minimal_spanning_tree()), self.connection_components(), set())
-        if self.is_tree(True):
-            return self.links
-        res_links, total = set(), {u := self.nodes.pop()}
-        bridge_links = []
-        for v in self.neighbors(u):
-            insert(Link(u, v))
-        for _ in range(1, len(self.nodes)):
-            res_links.add(l := bridge_links.pop(0))
-            if (u := l.u) in total:
-                total.add(v := l.v)
-                for _v in self.neighbors(v):
-                    l = Link(v, _v)
-                    if _v in total:
-                        remove(l)
-                    else:
-                        insert(l)
-            else:
-                total.add(u)
-                for _u in self.neighbors(u):
-                    l = Link(u, _u)
-                    if _u in total:
-                        remove(l)
-                    else:
-                        insert(l)
-        return res_links
+    def minimal_spanning_forest(self, processes: int = 1) -> tuple[set[Link], float]:
+        """
+        Args:
+            processes: The number of processes to use. With more than one, Boruvka's algorithm is used and the search for the cheapest link, leaving each component, is split between them. Otherwise, Kruskal's algorithm is used
+        Returns:
+            A spanning tree or forrest of trees of the graph with the minimal possible weights sum and that sum
+        """
+        ids = {u: i for i, u in enumerate(self.view.nodes)}
+        keys = list(self.__link_weights)
+        links = [(ids[l.u], ids[l.v], w) for l, w in self.__link_weights.items()]
+        if processes > 1:
+            res = boruvka(len(ids), links, processes)
+        else:
+            res = kruskal(len(ids), links)
+        return {keys[i] for i in res}, sum(links[i][2] for i in res)
 
     def weighted_graph(self, weights: dict[Node, float] = None) -> "WeightedUndirectedGraph":
         if weights is None:
@@ -1452,7 +1507,16 @@ class WeightedLinksUndirectedGraph(UndirectedGraph):
         Returns:
             A path between u and v with the least possible sum of link weights
         """
-        return self.weighted_graph().minimal_path(u, v)
+        if not isinstance(u, Node):
+            u = Node(u)
+        if not isinstance(v, Node):
+            v = Node(v)
+        if u not in self or v not in self:
+            raise KeyError("Unrecognized node(s)!")
+        if self._negative_links:
+            return self.weighted_graph().minimal_path(u, v)
+        weights = self.__link_weights
+        return cheapest_path(u, v, 0, lambda x: ((y, weights[Link(x, y)]) for y in self.view.neighbors(x)))[0]
 
 
 class WeightedUndirectedGraph(WeightedLinksUndirectedGraph, WeightedNodesUndirectedGraph):
@@ -1460,18 +1524,68 @@ class WeightedUndirectedGraph(WeightedLinksUndirectedGraph, WeightedNodesUndirec
     Class for implementing an undirected graph with weights on the nodes and the links
     """
 
-    def __init__(self, neighborhood: dict[Node, tuple[float, dict[Node, float]]] = {}) -> None:
+    def __init__(self, neighborhood: dict[Node, tuple[float, dict[Node, float]]] = {}, storage: str = "set") -> None:
         """
         Args:
             neighborhood: A dictionary of nodes and a tuple with each node's weight and another dictionary, associated with each node. Each such dictionary has for keys the neighbors of said node and the value of each neighbor is the weight of the link between them
+            storage: The storage engine of the graph, "set" or "csr"
         """
-        WeightedNodesUndirectedGraph.__init__(self), WeightedLinksUndirectedGraph.__init__(self)
+        WeightedNodesUndirectedGraph.__init__(self, storage=storage)
+        WeightedLinksUndirectedGraph.__init__(self, storage=storage)
         for n, (w, _) in neighborhood.items():
             self.add((n, w))
         for u, (_, neighbors) in neighborhood.items():
             for v, w in neighbors.items():
                 self.add((v, 0), {u: w}), self.connect(u, {v: w})
 
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[Node, Node, float]], nodes: dict[Node, float] = {},
+                   storage: str = "set") -> "WeightedUndirectedGraph":
+        """
+        Args:
+            edges: An iterable of triples of two nodes and the weight of the link between them. Loops are skipped and only the first weight of a repeated link is kept
+            nodes: A dictionary of node weights. Nodes, that aren't in it, get a weight of 0
+            storage: The storage engine of the graph, "set" or "csr"
+        Returns:
+            A graph, built in a single pass over the given links, which are loaded into the storage at once
+        """
+        return super().from_edges(edges, nodes, storage)
+
+    @classmethod
+    def from_csr(cls, nodes: Sequence[Node], offsets: Sequence[int], targets: Sequence[int],
+                 node_weights: Sequence[float] = None, link_weights: Sequence[float] = None,
+                 storage: str = "csr") -> "WeightedUndirectedGraph":
+        """
+        Args:
+            nodes: The nodes of the graph. Each one is identified by its index
+            offsets: The row offsets of the adjacency, one more than the nodes
+            targets: The symmetric adjacency rows, where the neighbors of nodes[i] are the nodes with the indices in targets[offsets[i]:offsets[i + 1]], sorted
+            node_weights: The weight of each node in the order of the nodes. By default, every node weighs 0
+            link_weights: The weight of the link, that each element of targets makes with its row's node. The weight is read at the row of the link's end with the smaller index. By default, every link weighs 0
+            storage: The storage engine of the graph, "set" or "csr"
+        Returns:
+            A graph with the given adjacency, node weights and link weights. With the "csr" storage engine, the arrays are used as they are, so they may be memory-mapped
+        """
+        res = super().from_csr(nodes, offsets, targets, link_weights, storage)
+        if node_weights is not None:
+            for u, w in zip(nodes, node_weights):
+                res.set_weight(u, w)
+        return res
+
+    @classmethod
+    def from_adjacency(cls, neighborhood: dict[Node, tuple[float, dict[Node, float]]],
+                       storage: str = "set") -> "WeightedUndirectedGraph":
+        """
+        Args:
+            neighborhood: A dictionary of nodes and a tuple with each node's weight and another dictionary, associated with each node. Each such dictionary has for keys the neighbors of said node and the value of each neighbor is the weight of the link between them
+            storage: The storage engine of the graph, "set" or "csr"
+        Returns:
+            The same graph as the one, given by the constructor, but built in a single pass
+        """
+        return cls.from_edges(
+            ((u, v, w) for u, (_, neighbors) in neighborhood.items() for v, w in neighbors.items()),
+            {u: w for u, (w, _) in neighborhood.items()}, storage)
+
     @property
     def total_weight(self) -> float:
         """
@@ -1509,7 +1623,7 @@ class WeightedUndirectedGraph(WeightedLinksUndirectedGraph, WeightedNodesUndirec
         try:
             if el in self:
                 WeightedNodesUndirectedGraph.set_weight(self, el, float(w))
-            elif el in self.links:
+            elif el in self.view.links:
                 super().set_weight(el, float(w))
             return self
         except ValueError:
@@ -1523,12 +1637,12 @@ class WeightedUndirectedGraph(WeightedLinksUndirectedGraph, WeightedNodesUndirec
         Increase the weight of object el with w
         """
         try:
-            if el in self.link_weights():
+            if el in self.view.links:
                 self.set_weight(el, self.link_weights(el) + float(w))
             else:
                 if not isinstance(el, Node):
                     el = Node(el)
-                if el in self.node_weights():
+                if el in self:
                     return self.set_weight(el, self.node_weights(el) + float(w))
             return self
         except ValueError:
@@ -1536,17 +1650,39 @@ class WeightedUndirectedGraph(WeightedLinksUndirectedGraph, WeightedNodesUndirec
 
     def copy(self) -> "WeightedUndirectedGraph":
         neighborhood = {n: (self.node_weights(n), self.link_weights(n)) for n in self.nodes}
-        return WeightedUndirectedGraph(neighborhood)
+        return WeightedUndirectedGraph(neighborhood, self.storage)
 
     def subgraph(self, nodes: Iterable[Node]) -> "WeightedUndirectedGraph":
         try:
-            nodes = self.nodes.intersection(nodes)
+            nodes = self.view.nodes.intersection(nodes)
             neighborhood = {u: (self.node_weights(u), {k: v for k, v in self.link_weights(u).items() if k in nodes})
                             for u in nodes}
             return WeightedUndirectedGraph(neighborhood)
         except TypeError:
             raise TypeError("Iterable of nodes expected!")
 
+    def __steps(self) -> Callable[[Node], Iterator[tuple[Node, float]]]:
+        node_weights, link_weights = self.node_weights, self.link_weights
+        return lambda x: ((y, w + node_weights(y)) for y, w in link_weights(x).items())
+
+    def __negative(self) -> bool:
+        return self._negative_nodes > 0 or self._negative_links > 0
+
+    def minimal_distances(self, source: Node) -> dict[Node, float]:
+        """
+        Args:
+            source: A present node
+        Returns:
+            A dictionary, mapping each node, reachable from source, to the least possible sum of node and link weights of a path to it. All weights should be non-negative
+        """
+        if not isinstance(source, Node):
+            source = Node(source)
+        if source not in self:
+            raise KeyError("Unrecognized node!")
+        if self.__negative():
+            raise ValueError("Negative weights are not supported!")
+        return dijkstra({source: self.node_weights(source)}, self.__steps())[0]
+
     def minimal_path(self, u: Node, v: Node) -> list[Node]:
         """
         Args:
@@ -1555,6 +1691,16 @@ class WeightedUndirectedGraph(WeightedLinksUndirectedGraph, WeightedNodesUndirec
         Returns:
             A path between u and v with the least possible sum of node and link weights
         """
+        return self.minimal_path_cost(u, v)[0]
+
+    def minimal_path_cost(self, u: Node, v: Node) -> tuple[list[Node], float]:
+        """
+        Args:
+            u: First given node
+            v: Second given node
+        Returns:
+            A path between u and v with the least possible sum of node and link weights and that sum, if such path exists, otherwise an empty list and infinity
+        """
 
         def dfs(x, current_path, current_weight, total_negative, res_path=None, res_weight=0):
             def dijkstra(s, curr_path, curr_weight):
@@ -1605,11 +1751,13 @@ class WeightedUndirectedGraph(WeightedLinksUndirectedGraph, WeightedNodesUndirec
             u = Node(u)
         if not isinstance(v, Node):
             v = Node(v)
-        if v in self:
-            if v in (tmp := self.component(u)):
-                nodes_negative_weights = sum(tmp.node_weights(n) for n in tmp.nodes if tmp.node_weights(n) < 0)
-                links_negative_weights = sum(tmp.link_weights(l) for l in tmp.links if tmp.link_weights(l) < 0)
-                res = dfs(u, [], tmp.node_weights(u), nodes_negative_weights + links_negative_weights)
-                return [l.u for l in res[0]] + [res[0][-1].v]
-            return []
-        raise KeyError("Unrecognized node(s)!")
+        if u not in self or v not in self:
+            raise KeyError("Unrecognized node(s)!")
+        if not self.__negative():
+            return cheapest_path(u, v, self.node_weights(u), self.__steps())
+        if v in (tmp := self.component(u)):
+            nodes_negative_weights = sum(tmp.node_weights(n) for n in tmp.nodes if tmp.node_weights(n) < 0)
+            links_negative_weights = sum(tmp.link_weights(l) for l in tmp.links if tmp.link_weights(l) < 0)
+            res = dfs(u, [], tmp.node_weights(u), nodes_negative_weights + links_negative_weights)
+            return [l.u for l in res[0]] + [res[0][-1].v], res[1]
+        return [], inf
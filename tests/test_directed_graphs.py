@@ -1,5 +1,7 @@
 from unittest import TestCase, main
 
+from math import inf
+
 from undirected_graph import (Node, UndirectedGraph, WeightedNodesUndirectedGraph, WeightedLinksUndirectedGraph,
                               WeightedUndirectedGraph, reduce)
 
@@ -26,6 +28,16 @@ class TestDirectedGraph(TestCase):
         self.assertDictEqual(g.prev(), {n0: {n1, n2}, n1: set(), n2: {n0, n1}, n3: {n0, n1}})
         self.assertDictEqual(g.next(), {n0: {n2, n3}, n1: {n0, n2, n3}, n2: {n0}, n3: set()})
 
+    def test_from_edges(self):
+        g = DirectedGraph.from_edges([(1, 0), (2, 0), (0, 2), (0, 3), (1, 2), (1, 3), (1, 3), (4, 4)])
+        self.assertEqual(g, DirectedGraph({0: ({1, 2}, {2, 3}), 1: (set(), {2, 3}), 4: ([], [])}))
+        self.assertSetEqual(set(self.g0.to_edges()), self.g0.links)
+        self.assertEqual(DirectedGraph.from_edges(self.g0.to_edges(), self.g0.nodes), self.g0)
+
+    def test_from_adjacency(self):
+        self.assertEqual(DirectedGraph.from_adjacency({n: (self.g3.prev(n), self.g3.next(n)) for n in self.g3.nodes}),
+                         self.g3)
+
     def test_get_nodes(self):
         self.assertSetEqual(self.g0.nodes, {n0, n1, n2, n3, n4, n5, n6, n7, n8, n9, n10, n11, n12, n13, n14})
         self.assertSetEqual(self.g1.nodes, {n0, n1, n2, n3, n4, n5})
@@ -38,6 +50,17 @@ class TestDirectedGraph(TestCase):
                              (n2, n4), (n4, n5), (n5, n6), (n6, n4), (n7, n5), (n6, n3), (n10, n11), (n11, n12),
                              (n11, n13), (n12, n13)})
 
+    def test_view(self):
+        g = self.g1.copy()
+        nodes, links, prev, next_ = g.view.nodes, g.view.links, g.view.prev(n1), g.view.next(n1)
+        self.assertSetEqual(set(next_), {n0, n2, n4, n5})
+        g.disconnect(n2, [n1]).add(n6, [n1], [n3])
+        self.assertSetEqual(set(next_), {n0, n4, n5, n6})
+        self.assertSetEqual(set(prev), {n3})
+        self.assertSetEqual(set(nodes), g.nodes)
+        self.assertSetEqual(set(links), g.links)
+        self.assertFalse(hasattr(next_, "add"))
+
     def test_prev(self):
         self.assertSetEqual(self.g0.prev(1), {n0, n8})
         self.assertDictEqual(self.g1.prev(), {n0: {n1}, n1: {n3}, n2: {n0, n1}, n3: {n2}, n4: {n1, n5}, n5: {n1, n3}})
@@ -277,6 +300,26 @@ class TestDirectedGraph(TestCase):
             for j in range(i + 1, len(res)):
                 self.assertFalse(self.g3.reachable(res[j], res[i]))
 
+    def test_toposort_generations(self):
+        self.assertListEqual(self.g0.toposort_generations(), [])
+        self.assertListEqual(self.g2.toposort_generations(), [{n4, n6}, {n5}, {n2}, {n0}, {n1}, {n3}])
+        res = self.g3.toposort_generations()
+        self.assertSetEqual(res[0], self.g3.sources)
+        self.assertEqual(sum(map(len, res)), len(self.g3.nodes))
+        for i, layer in enumerate(res):
+            for u in layer:
+                self.assertTrue(self.g3.prev(u).issubset(set().union(*res[:i])))
+
+    def test_find_cycle(self):
+        self.assertListEqual(self.g2.find_cycle(), [])
+        for g in (self.g0, self.g1):
+            res = g.find_cycle()
+            self.assertEqual(res[0], res[-1])
+            self.assertEqual(len(set(res)), len(res) - 1)
+            for u, v in zip(res, res[1:]):
+                self.assertIn(v, g.next(u))
+        self.assertListEqual(DirectedGraph({0: ([1], [1])}).find_cycle()[1:], [n1, n0])
+
     def test_get_shortest_path(self):
         self.assertListEqual(self.g0.get_shortest_path(0, 6), [n0, n2, n4, n5, n6])
         self.assertListEqual(self.g0.get_shortest_path(7, 8), [n7, n5, n6, n3, n8])
@@ -289,6 +332,46 @@ class TestDirectedGraph(TestCase):
         with self.assertRaises(KeyError):
             self.g0.get_shortest_path(0, -6)
 
+    def test_shortest_path_lengths(self):
+        self.assertDictEqual(self.g2.shortest_path_lengths(4), {n4: 0, n3: 1, n5: 1, n0: 2, n2: 2, n1: 3})
+        self.assertDictEqual(self.g2.shortest_path_lengths(3), {n3: 0})
+        with self.assertRaises(KeyError):
+            self.g2.shortest_path_lengths(-1)
+
+    def test_shortest_paths_many(self):
+        pairs = [(0, 6), (7, 8), (10, 13), (0, 13), (0, 0)]
+        self.assertListEqual(self.g0.shortest_paths_many(pairs),
+                             [[n0, n2, n4, n5, n6], [n7, n5, n6, n3, n8], [n10, n11, n13], [], [n0]])
+        with self.assertRaises(KeyError):
+            self.g0.shortest_paths_many([(0, -6)])
+
+    def test_multi_source_distances(self):
+        self.assertDictEqual(self.g2.multi_source_distances([4, 6]), {n4: 0, n6: 0, n3: 1, n5: 1, n0: 2, n2: 2, n1: 3})
+        with self.assertRaises(KeyError):
+            self.g2.multi_source_distances([-1])
+
+    def test_bfs(self):
+        res = list(self.g0.bfs(0))
+        self.assertTupleEqual(res[0], (n0, 0, None))
+        self.assertSetEqual({n for n, _, _ in res}, self.g0.subgraph(n0).nodes)
+        for n, d, p in res[1:]:
+            self.assertEqual(d, len(self.g0.get_shortest_path(n0, n)) - 1)
+            self.assertIn(p, self.g0.prev(n))
+        self.assertListEqual(list(self.g2.bfs(3)), [(n3, 0, None)])
+        with self.assertRaises(KeyError):
+            self.g0.bfs(-1)
+
+    def test_dfs(self):
+        res = list(DirectedGraph({1: ([0], [2]), 3: ([2], [0])}).dfs(0))
+        self.assertListEqual(res, [(n0, 0, None), (n1, 1, n0), (n2, 2, n1), (n3, 3, n2)])
+        res, seen = list(self.g0.dfs(10)), set()
+        for n, d, p in res:
+            self.assertTrue(p is None or p in seen and p in self.g0.prev(n))
+            seen.add(n)
+        self.assertSetEqual(seen, {n10, n11, n12, n13})
+        with self.assertRaises(KeyError):
+            self.g0.dfs(-1)
+
     def test_euler_tour_exists(self):
         g0 = DirectedGraph.copy(self.g0)
         g0.connect(n11, [n13])
@@ -338,6 +421,28 @@ class TestDirectedGraph(TestCase):
     def test_euler_walk_missing_nodes(self):
         with self.assertRaises(KeyError):
             self.g0.euler_walk_exists(0, -1)
+        with self.assertRaises(KeyError):
+            self.g0.iter_euler_walk(0, -1)
+
+    def test_iter_euler_tour(self):
+        n = 100000
+        g = DirectedGraph({i: ([], [(i + 1) % n, (i + 2) % n]) for i in range(n)})
+        res = list(g.iter_euler_tour())
+        self.assertEqual(len(res), len(g.links) + 1)
+        self.assertEqual(res[0], res[-1])
+        self.assertEqual(len({(res[i], res[i + 1]) for i in range(len(res) - 1)}), len(g.links))
+        for i in range(len(res) - 1):
+            self.assertIn(res[i + 1], g.next(res[i]))
+        self.assertListEqual(list(self.g0.iter_euler_tour()), [])
+
+    def test_iter_euler_walk(self):
+        g0 = DirectedGraph.component(self.g0, n0)
+        g0.connect(n0, [n7]), g0.connect(n5, [n1], [n8])
+        g0.disconnect(n4, [n6]), g0.disconnect(n5, [n7])
+        res = list(g0.iter_euler_walk(n0, n9))
+        self.assertEqual((res[0], res[-1]), (n0, n9))
+        self.assertEqual(len({(res[i], res[i + 1]) for i in range(len(res) - 1)}), len(g0.links))
+        self.assertListEqual(list(g0.iter_euler_walk(n9, n0)), [])
 
     def test_strongly_connected_component(self):
         self.assertSetEqual(self.g0.strongly_connected_component(1), {n1, n2, n3, n4, n5, n6, n7, n8})
@@ -380,6 +485,28 @@ class TestDirectedGraph(TestCase):
                 for v in s:
                     self.assertTrue(self.g3.reachable(u, v))
 
+    def test_scc_map(self):
+        res, ids = self.g0.strongly_connected_components(), self.g0.scc_map()
+        self.assertSetEqual(set(ids), self.g0.nodes)
+        for u, i in ids.items():
+            self.assertIn(u, res[i])
+            self.assertSetEqual(self.g0.strongly_connected_component(u), res[i])
+        for u, v in self.g0.links:
+            self.assertGreaterEqual(ids[u], ids[v])
+        g = DirectedGraph.copy(self.g0)
+        self.assertNotEqual(g.scc_map()[n0], g.scc_map()[n1])
+        g.connect(0, [5])
+        self.assertEqual(g.scc_map()[n0], g.scc_map()[n1])
+        self.assertSetEqual(g.strongly_connected_component(0), {n0, n1, n2, n3, n4, n5, n6, n7, n8})
+        g.remove(n5)
+        self.assertSetEqual(g.strongly_connected_component(0), {n0})
+
+    def test_strongly_connected_components_long_cycle(self):
+        g = DirectedGraph.from_edges((i, (i + 1) % 100000) for i in range(100000))
+        self.assertEqual(len(g.strongly_connected_components()), 1)
+        g.disconnect(0, [99999])
+        self.assertEqual(len(g.strongly_connected_components()), 100000)
+
     def test_scc_dag(self):
         g0 = self.g0.component(0).scc_dag()
         self.assertSetEqual(g0.nodes, {Node(frozenset({n0})), Node(frozenset({n1, n2, n3, n4, n5, n6, n7, n8})),
@@ -387,6 +514,14 @@ class TestDirectedGraph(TestCase):
         self.assertSetEqual(g0.links, {(Node(frozenset({n0})), Node(frozenset({n1, n2, n3, n4, n5, n6, n7, n8}))),
                                        (Node(frozenset({n1, n2, n3, n4, n5, n6, n7, n8})), Node(frozenset({n9})))})
 
+    def test_scc_dag_links(self):
+        for g in (self.g0, self.g1, self.g2, self.g3):
+            res, ids = g.scc_dag(), g.scc_map()
+            self.assertEqual(len(res.nodes), len(g.strongly_connected_components()))
+            self.assertEqual(len(res.strongly_connected_components()), len(res.nodes))
+            self.assertSetEqual({n.value for n in res.nodes}, set(map(frozenset, g.strongly_connected_components())))
+            self.assertEqual(len(res.links), len({(ids[u], ids[v]) for u, v in g.links if ids[u] != ids[v]}))
+
     def test_path_with_length(self):
         self.assertTrue(self.g0.path_with_length(10, 13, 3))
         self.assertTrue(self.g0.path_with_length(4, 8, 4))
@@ -440,7 +575,8 @@ class TestDirectedGraph(TestCase):
             self.assertFalse(self.g2.hamilton_walk_exists(n6, n))
         g2 = DirectedGraph.copy(self.g2)
         g2.connect(n4, [n5]), g2.connect(n2, [n3])
-        self.assertTrue(g0.hamilton_walk_exists(n6, n1))
+        self.assertFalse(g0.hamilton_walk_exists(n6, n1))
+        self.assertTrue(g0.hamilton_walk_exists(n6, n5))
 
     def test_hamilton_walk_exists_missing_nodes(self):
         with self.assertRaises(KeyError):
@@ -472,6 +608,13 @@ class TestDirectedGraph(TestCase):
         with self.assertRaises(KeyError):
             self.g0.hamilton_walk_exists(0, -1)
 
+    def test_hamilton_walk_on_dag(self):
+        g = DirectedGraph({n1: ([n0], [n2, n3]), n3: ([n0, n2], [])})
+        self.assertListEqual(g.hamilton_walk(), [n0, n1, n2, n3])
+        self.assertListEqual(g.hamilton_walk(None, n2), [])
+        g.disconnect(n3, [n2])
+        self.assertListEqual(g.hamilton_walk(), [])
+
     def test_isomorphic_bijection(self):
         g1 = DirectedGraph({11: ([13], [10, 12, 14, 15]), 12: ([10, 11], [13]), 15: ([13], [14])})
         func = self.g1.isomorphic_bijection(g1)
@@ -483,6 +626,18 @@ class TestDirectedGraph(TestCase):
         g1.disconnect(n11, {n13})
         self.assertDictEqual(self.g1.isomorphic_bijection(g1), {})
 
+    def test_fingerprint(self):
+        g1 = DirectedGraph({11: ([13], [10, 12, 14, 15]), 12: ([10, 11], [13]), 15: ([13], [14])})
+        self.assertEqual(self.g1.fingerprint(), res := g1.fingerprint())
+        self.assertNotEqual(g1.transposed().fingerprint(), res)
+        self.assertNotEqual(g1.disconnect(n11, {n13}).fingerprint(), res)
+        self.assertEqual(g1.connect(n11, {n13}).fingerprint(), res)
+        g = WeightedLinksDirectedGraph({0: ({1: 2}, {2: 3})})
+        res = g.fingerprint()
+        self.assertEqual(WeightedLinksDirectedGraph({5: ({3: 2}, {4: 3})}).fingerprint(), res)
+        self.assertNotEqual(WeightedLinksDirectedGraph({5: ({3: 3}, {4: 2})}).fingerprint(), res)
+        self.assertNotEqual(g.set_weight((0, 2), 2).fingerprint(), res)
+
     def test_bool(self):
         g0 = self.g0.component(14)
         self.assertTrue(g0)
@@ -544,6 +699,15 @@ class TestWeightedNodesDirectedGraph(TestCase):
         self.assertDictEqual(g.node_weights(), {n0: 2, n1: 3, n2: 0, n3: 0})
         self.assertSetEqual(g.links, {(n0, n3), (n1, n0), (n2, n0), (n2, n1), (n3, n1)})
 
+    def test_from_edges(self):
+        g = WeightedNodesDirectedGraph.from_edges([(1, 0), (2, 0), (0, 3), (2, 1), (3, 1)], {0: 2, 1: 3})
+        self.assertEqual(g, WeightedNodesDirectedGraph({0: (2, ({1, 2}, {3})), 1: (3, ({2, 3}, []))}))
+        self.assertEqual(WeightedNodesDirectedGraph.from_edges(self.g0.to_edges(), self.g0.node_weights()), self.g0)
+
+    def test_from_adjacency(self):
+        neighborhood = {n: (self.g1.node_weights(n), (self.g1.prev(n), self.g1.next(n))) for n in self.g1.nodes}
+        self.assertEqual(WeightedNodesDirectedGraph.from_adjacency(neighborhood), self.g1)
+
     def test_node_weights(self):
         self.assertEqual(self.g0.node_weights(),
                          {n0: 7, n1: 3, n2: 5, n3: 2, n4: 8, n5: 4, n6: 6, n7: 6, n8: 2, n9: 5, n10: 4, n11: 2, n12: 1,
@@ -771,6 +935,20 @@ class TestWeightedLinksDirectedGraph(TestCase):
         self.assertSetEqual(g.nodes, {n0, n1, n2, n3})
         self.assertDictEqual(g.link_weights(), {(n0, n3): 2, (n1, n0): 1, (n2, n0): 0, (n2, n1): 1, (n3, n1): 4})
 
+    def test_from_edges(self):
+        g = WeightedLinksDirectedGraph.from_edges([(1, 0, 1), (2, 0, 0), (0, 3, 2), (2, 1, 1), (3, 1, 4), (3, 1, 5)])
+        self.assertEqual(g, WeightedLinksDirectedGraph({0: ({1: 1, 2: 0}, {3: 2}), 1: ({2: 1, 3: 4}, {})}))
+        self.assertEqual(WeightedLinksDirectedGraph.from_edges(self.g0.to_edges(), self.g0.nodes), self.g0)
+        with self.assertRaises(TypeError):
+            WeightedLinksDirectedGraph.from_edges([(0, 1, "x")])
+
+    def test_to_edges(self):
+        self.assertDictEqual({(u, v): w for u, v, w in self.g0.to_edges()}, self.g0.link_weights())
+
+    def test_from_adjacency(self):
+        neighborhood = {n: ({}, self.g1.link_weights(n)) for n in self.g1.nodes}
+        self.assertEqual(WeightedLinksDirectedGraph.from_adjacency(neighborhood), self.g1)
+
     def test_link_weights(self):
         self.assertDictEqual(self.g0.link_weights(),
                              {(n0, n1): 2, (n0, n2): 4, (n1, n2): 3, (n2, n3): -6, (n2, n4): 5, (n5, n6): 5,
@@ -967,6 +1145,36 @@ class TestWeightedLinksDirectedGraph(TestCase):
         with self.assertRaises(KeyError):
             self.g1.minimal_path_links(2, 6)
 
+    def test_negative_cycle(self):
+        g = WeightedLinksDirectedGraph({0: ({}, {1: 4, 2: 1}), 2: ({}, {1: -2}), 1: ({}, {3: 1})})
+        self.assertListEqual(g.negative_cycle(), [])
+        self.assertListEqual(self.g0.negative_cycle(), [])
+        res = g.connect(2, {3: -1}).negative_cycle()
+        self.assertEqual(res[0], res[-1])
+        self.assertSetEqual(set(res), {n1, n2, n3})
+        self.assertLess(sum(g.link_weights(res[i], res[i + 1]) for i in range(len(res) - 1)), 0)
+        with self.assertRaises(ValueError):
+            g.minimal_distances(0)
+        with self.assertRaises(ValueError):
+            g.all_minimal_distances()
+
+    def test_minimal_distances(self):
+        g = WeightedLinksDirectedGraph({0: ({}, {1: 4, 2: 1}), 2: ({}, {1: -2}), 1: ({}, {3: 1})})
+        self.assertDictEqual(g.minimal_distances(0), {n0: 0, n2: 1, n1: -1, n3: 0})
+        self.assertListEqual(g.minimal_path_links(0, 3), [n0, n2, n1, n3])
+        self.assertListEqual(g.minimal_path_links(3, 0), [])
+        self.assertDictEqual(self.g3.minimal_distances(0), {n0: 0, n1: 3, n2: 6, n4: 6, n5: 7})
+        with self.assertRaises(KeyError):
+            g.minimal_distances(5)
+
+    def test_all_minimal_distances(self):
+        g = WeightedLinksDirectedGraph({0: ({}, {1: 4, 2: 1}), 2: ({}, {1: -2}), 1: ({}, {3: 1})})
+        self.assertDictEqual(g.all_minimal_distances(), {n0: {n0: 0, n1: -1, n2: 1, n3: 0}, n1: {n1: 0, n3: 1},
+                                                         n2: {n1: -2, n2: 0, n3: -1}, n3: {n3: 0}})
+        res = self.g0.all_minimal_distances()
+        for u in self.g0.nodes:
+            self.assertDictEqual(res[u], self.g0.minimal_distances(u))
+
     def test_isomorphic_bijection(self):
         g1 = WeightedLinksDirectedGraph(
             {n11: ({n13: 3}, {n10: 1, n12: 4, n14: 9, n15: 3}), n12: ({n10: 2}, {n13: -6}), n15: ({n13: 2}, {n14: 5})})
@@ -1025,6 +1233,15 @@ class TestWeightedDirectedGraph(TestCase):
         self.assertDictEqual(g.node_weights(), {n0: 2, n1: 3, n2: 0, n3: 0})
         self.assertDictEqual(g.link_weights(), {(n0, n3): 2, (n1, n0): 1, (n2, n0): 0, (n2, n1): 1, (n3, n1): 4})
 
+    def test_from_edges(self):
+        g = WeightedDirectedGraph.from_edges([(1, 0, 1), (2, 0, 0), (0, 3, 2), (2, 1, 1), (3, 1, 4)], {0: 2, 1: 3})
+        self.assertEqual(g, WeightedDirectedGraph({0: (2, ({1: 1, 2: 0}, {3: 2})), 1: (3, ({2: 1, 3: 4}, {}))}))
+        self.assertEqual(WeightedDirectedGraph.from_edges(self.g0.to_edges(), self.g0.node_weights()), self.g0)
+
+    def test_from_adjacency(self):
+        neighborhood = {n: (self.g1.node_weights(n), ({}, self.g1.link_weights(n))) for n in self.g1.nodes}
+        self.assertEqual(WeightedDirectedGraph.from_adjacency(neighborhood), self.g1)
+
     def test_total_weight(self):
         self.assertEqual((self.g0.total_weight, self.g1.total_weight, self.g2.total_weight, self.g3.total_weight),
                          (112, 44, 55, 83))
@@ -1214,6 +1431,39 @@ class TestWeightedDirectedGraph(TestCase):
         with self.assertRaises(KeyError):
             self.g1.minimal_path(3, 7)
 
+    def test_minimal_path_cost(self):
+        g = WeightedDirectedGraph({0: (1, ({}, {1: 2, 2: 7})), 1: (3, ({}, {2: 1, 3: 5})), 2: (0, ({}, {3: 2})),
+                                   3: (4, ({}, {0: 1})), 4: (1, ({}, {}))})
+        self.assertTupleEqual(g.minimal_path_cost(0, 3), ([n0, n1, n2, n3], 13))
+        self.assertTupleEqual(g.minimal_path_cost(3, 1), ([n3, n0, n1], 11))
+        self.assertTupleEqual(g.minimal_path_cost(0, 4), ([], inf))
+        with self.assertRaises(KeyError):
+            g.minimal_path_cost(0, 5)
+
+    def test_minimal_distances(self):
+        g = WeightedDirectedGraph({0: (1, ({}, {1: 2, 2: 7})), 1: (3, ({}, {2: 1, 3: 5})), 2: (0, ({}, {3: 2})),
+                                   3: (4, ({}, {0: 1})), 4: (1, ({}, {}))})
+        self.assertDictEqual(g.minimal_distances(0), {n0: 1, n1: 6, n2: 7, n3: 13})
+        self.assertDictEqual(g.minimal_distances(4), {n4: 1})
+        with self.assertRaises(KeyError):
+            g.minimal_distances(5)
+
+    def test_negative_weights(self):
+        g = WeightedDirectedGraph({0: (1, ({}, {1: 4, 2: 1})), 1: (2, ({}, {3: 1})), 2: (-1, ({}, {1: -2})),
+                                   3: (0, ({}, {}))})
+        self.assertListEqual(g.negative_cycle(), [])
+        self.assertTupleEqual(g.minimal_path_cost(0, 3), ([n0, n2, n1, n3], 2))
+        self.assertDictEqual(g.minimal_distances(0), {n0: 1, n1: 1, n2: 1, n3: 2})
+        self.assertDictEqual(g.all_minimal_distances(), {n0: {n0: 1, n1: 1, n2: 1, n3: 2}, n1: {n1: 2, n3: 3},
+                                                         n2: {n1: -1, n2: -1, n3: 0}, n3: {n3: 0}})
+        res = g.connect(2, {3: -1}).negative_cycle()
+        self.assertEqual(res[0], res[-1])
+        self.assertSetEqual(set(res), {n1, n2, n3})
+        with self.assertRaises(ValueError):
+            g.minimal_distances(0)
+        with self.assertRaises(ValueError):
+            g.all_minimal_distances()
+
     def test_isomorphic_bijection(self):
         g1 = WeightedDirectedGraph(
             {n10: (3, ({}, {})), n11: (2, ({n13: 3}, {n10: 1, n12: 4, n14: 9, n15: 3})),
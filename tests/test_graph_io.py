@@ -0,0 +1,117 @@
+from unittest import TestCase, main
+
+from os import path
+
+from tempfile import TemporaryDirectory
+
+from graph_io import *
+
+from undirected_graph import *
+
+from directed_graph import *
+
+from tree import Tree, WeightedTree
+
+n0, n1, n2, n3, n4, n5 = map(Node, range(6))
+
+
+class TestGraphIO(TestCase):
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.path = path.join(self.dir.name, "edges.csv")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def write(self, text):
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write(text)
+
+    def test_read_edges(self):
+        self.write("# comment\n0 1\n\n1 2\n2\t0\n")
+        self.assertListEqual(list(read_edges(self.path, node_type=int)), [(n0, n1), (n1, n2), (n2, n0)])
+
+    def test_read_weighted_csv(self):
+        self.write("u,v,w\na,b,1.5\nb,c,-2\n")
+        self.assertListEqual(list(read_edges(self.path, ",", weights=2, header=True, chunk_size=4)),
+                             [(Node("a"), Node("b"), 1.5), (Node("b"), Node("c"), -2.0)])
+
+    def test_read_bad_row(self):
+        self.write("0 1\n2\n")
+        with self.assertRaises(ValueError):
+            list(read_edges(self.path))
+        with self.assertRaises(ValueError):
+            list(read_edges(self.path, weights=1))
+
+    def test_load_edges(self):
+        self.write("0 1\n1 2\n1 2\n3 3\n")
+        for s in ("set", "csr"):
+            g = load_edges(self.path, node_type=int, storage=s)
+            self.assertEqual(g, UndirectedGraph({0: [1], 1: [2], 3: []}))
+            self.assertEqual(g.storage, s)
+        self.assertEqual(load_edges(self.path, DirectedGraph, node_type=int, nodes=[4]),
+                         DirectedGraph({1: ([0], [2]), 3: ([], []), 4: ([], [])}))
+
+    def test_load_weighted_edges(self):
+        self.write("0;1;3\n1;2;-1\n")
+        g = load_edges(self.path, WeightedLinksDirectedGraph, ";", int)
+        self.assertDictEqual(g.link_weights(), {(n0, n1): 3, (n1, n2): -1})
+        g = load_edges(self.path, WeightedUndirectedGraph, ";", int, nodes={0: 2})
+        self.assertDictEqual(g.link_weights(), {Link(0, 1): 3, Link(1, 2): -1})
+        self.assertDictEqual(g.node_weights(), {n0: 2, n1: 0, n2: 0})
+        with self.assertRaises(ValueError):
+            load_edges(self.path, UndirectedGraph, ";", weights=2)
+        with self.assertRaises(TypeError):
+            load_edges(self.path, Tree)
+
+    def test_write_edges(self):
+        g = WeightedLinksUndirectedGraph({0: {1: 2, 2: 3}, 1: {3: -1.5}, 4: {}})
+        write_edges(g, self.path, ",", ["u", "v", "w"], chunk_size=8)
+        self.assertEqual(load_edges(self.path, WeightedLinksUndirectedGraph, ",", int, header=True, nodes=[4]), g)
+        g = DirectedGraph({0: ([1, 2], [3]), 4: ([3], [])})
+        write_edges(g, self.path)
+        with open(self.path, encoding="utf-8") as file:
+            self.assertEqual(len(file.readlines()), len(g.links))
+        self.assertEqual(load_edges(self.path, DirectedGraph, node_type=int), g)
+        with self.assertRaises(TypeError):
+            write_edges(Tree(0), self.path)
+
+    def test_save_load(self):
+        graphs = [UndirectedGraph({0: [1, 2], 2: [3], 4: []}),
+                  WeightedNodesUndirectedGraph({"a": (2, ["b"]), "c": (1.5, [])}),
+                  WeightedLinksUndirectedGraph({0: {1: 2, 2: -1}}), WeightedUndirectedGraph({(0, 1): (2, {"x": 3})}),
+                  DirectedGraph({0: ([1], [2]), 5: ([], [])}), WeightedNodesDirectedGraph({0: (3, ([1], [2]))}),
+                  WeightedLinksDirectedGraph({0: ({1: 2}, {2: 3})}), WeightedDirectedGraph({0: (1, ({1: 2}, {2: 3}))}),
+                  Tree(0, {1: [3, 4], 2: [5]}), WeightedTree((0, 1), {n1: (2, [3]), n2: (3, []), n3: (4, [])}),
+                  UndirectedGraph(), Tree("r")]
+        for g in graphs:
+            g.save(self.path)
+            for mmap in (False, True):
+                res = type(g).load(self.path, mmap)
+                self.assertEqual(type(res), type(g))
+                self.assertEqual(res, g)
+
+    def test_load_mmap(self):
+        g = UndirectedGraph({0: [1, 2], 2: [3], 4: []})
+        g.save(self.path)
+        res = UndirectedGraph.load(self.path, True)
+        self.assertEqual(res.storage, "csr")
+        self.assertEqual(UndirectedGraph.load(self.path, True, "set").storage, "set")
+        self.assertListEqual(res.get_shortest_path(1, 3), [n1, n0, n2, n3])
+        res.connect(0, 3).remove(n1).add(5, 4)
+        self.assertEqual(res, g.copy().connect(0, 3).remove(n1).add(5, 4))
+
+    def test_load_bad_file(self):
+        DirectedGraph({0: ([], [1])}).save(self.path)
+        with self.assertRaises(TypeError):
+            UndirectedGraph.load(self.path)
+        self.assertEqual(load_graph(self.path), DirectedGraph({0: ([], [1])}))
+        self.write("0 1\n")
+        with self.assertRaises(ValueError):
+            load_graph(self.path)
+        with self.assertRaises(TypeError):
+            save_graph({}, self.path)
+
+
+if __name__ == "__main__":
+    main()
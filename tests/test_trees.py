@@ -163,6 +163,15 @@ class TestTree(TestCase):
         self.assertSetEqual(self.t0.leaves, {n4, n6, n7, n8, n9, n10, n11})
         self.assertSetEqual(self.t1.leaves, {n1, n2, n3, n4, n5})
 
+    def test_view(self):
+        t = self.t0.copy()
+        nodes, leaves, descendants = t.view.nodes, t.view.leaves, t.view.descendants(n1)
+        t.remove(n3, False)
+        self.assertSetEqual(set(descendants), {n4, n5, n8, n9})
+        self.assertSetEqual(set(nodes), t.nodes)
+        self.assertSetEqual(set(leaves), t.leaves)
+        self.assertFalse(hasattr(leaves, "add"))
+
     def test_leaf(self):
         self.assertTrue(self.t0.leaf(4))
         self.assertFalse(self.t0.leaf(0))
@@ -229,6 +238,9 @@ class TestTree(TestCase):
     def test_copy(self):
         self.assertEqual(self.t0.copy(), self.t0)
         self.assertEqual(self.t1.copy(), self.t1)
+        t = Tree("a", {c: [c + "a", c + "b"] for c in ("a", "aa", "aab", "aaba", "aabab", "aababa")})
+        self.assertEqual(t.copy(), t)
+        self.assertEqual(len(t.copy().nodes), 13)
 
     def test_subtree(self):
         self.assertEqual(self.t0.subtree(1), Tree(1, {3: {8, 9}, 4: set(), 5: {10, 11}}))
@@ -286,6 +298,39 @@ class TestTree(TestCase):
         func = self.t1.isomorphic_bijection(t1)
         self.assertEqual(func, {n0: n10, n1: n11, n2: n12, n3: n13, n4: n14, n5: n15})
 
+    def test_isomorphic_bijection_large(self):
+        n = 2000
+        t0, t1 = Tree(0), Tree(n)
+        for i in range(1, n):
+            t0.add((i * 7) // 10, i), t1.add(n + (i * 7) // 10 * 13 % n, n + i * 13 % n)
+        func = t0.isomorphic_bijection(t1)
+        self.assertEqual(len(func), n)
+        for u, v in t0.parent().items():
+            self.assertEqual(t1.parent(func[u]), func[v])
+        self.assertDictEqual(t0.isomorphic_bijection(t1.remove(l := n + (n - 1) * 13 % n).add(n, l)), {})
+
+    def test_canonical_form(self):
+        self.assertEqual(self.t1.canonical_form(), "(()()()()())")
+        self.assertEqual(Tree(0, {1: [2, 3], 4: [5]}).canonical_form(), Tree(5, {1: [0], 4: [3, 2]}).canonical_form())
+        self.assertNotEqual(Tree(0, {1: [2, 3], 4: [5]}).canonical_form(), Tree(1, {0: [4], 4: [5], 2: [], 3: []}).canonical_form())
+
+    def test_fingerprint(self):
+        t0 = Tree(10, {11: [12, 13], 12: [14]})
+        self.assertEqual(t0.fingerprint(), Tree("a", {"b": ["c", "d"], "c": ["e"]}).copy().fingerprint())
+        self.assertNotEqual(t0.fingerprint(), res := Tree(11, {10: [], 12: [14], 13: []}).fingerprint())
+        self.assertNotEqual(t0.fingerprint(), self.t1.fingerprint())
+        self.assertEqual(t0.remove(n13).add(14, 13).fingerprint(), Tree(0, {1: [2], 2: [3], 3: [4]}).fingerprint())
+        self.assertNotEqual(t0.fingerprint(), res)
+
+    def test_weighted_fingerprint(self):
+        t0 = WeightedTree((0, 6)).add(0, {1: 1, 2: 1, 3: 0}).add(1, {4: 2})
+        t1 = WeightedTree((10, 6)).add(10, {11: 1, 12: 1, 13: 0}).add(11, {14: 2})
+        self.assertEqual(t0.fingerprint(), res := t1.fingerprint())
+        self.assertNotEqual(Tree.copy(t1).fingerprint(), res)
+        self.assertNotEqual(t1.set_weight(10, 5).fingerprint(), res)
+        self.assertEqual(t1.increase_weight(10, 1).fingerprint(), res)
+        self.assertNotEqual(t0.add(1, {5: 0}).fingerprint(), res)
+
     def test_contains(self):
         self.assertIn(0, self.t0)
         self.assertNotIn(n6, self.t1)
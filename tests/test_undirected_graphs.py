@@ -1,5 +1,7 @@
 from unittest import TestCase, main
 
+from math import inf
+
 from undirected_graph import *
 
 
@@ -48,6 +50,77 @@ class TestUndirectedGraph(TestCase):
                              {n0: {n1, n2, n4, n5, n6}, n1: {n0, n2, n6}, n2: {n0, n1, n3, n5}, n3: {n2}, n4: {n0},
                               n5: {n0, n2}, n6: {n0, n1}})
 
+    def test_from_edges(self):
+        g = UndirectedGraph.from_edges([(0, 1), (1, 0), (1, 2), (2, 2)], [3])
+        self.assertEqual(g, UndirectedGraph({0: {1}, 1: {2}, 3: set()}))
+        for s in ("set", "csr"):
+            self.assertEqual(UndirectedGraph.from_edges(self.g0.to_edges(), self.g0.nodes, s), self.g0)
+
+    def test_from_adjacency(self):
+        for s in ("set", "csr"):
+            self.assertEqual(UndirectedGraph.from_adjacency(self.g3.neighbors(), s), self.g3)
+
+    def test_from_csr(self):
+        for s in ("set", "csr"):
+            g = UndirectedGraph.from_csr([1, 2, 3], [0, 1, 2, 2], [1, 0], s)
+            self.assertEqual(g, UndirectedGraph({1: [2], 3: []}))
+            self.assertSetEqual(g.neighbors(1), {n2})
+        with self.assertRaises(ValueError):
+            UndirectedGraph.from_csr([1, 2, 3], [0, 1, 2], [1, 0])
+        with self.assertRaises(ValueError):
+            UndirectedGraph.from_csr([1, 2], [0, 1, 3], [1, 0])
+
+    def test_node_interning(self):
+        self.assertIs(Node(3), n3)
+        self.assertIsNot(Node(True), n1)
+        self.assertEqual(Node(True), n1)
+        self.assertFalse(hasattr(n3, "__dict__"))
+        with self.assertRaises(ValueError):
+            Node([3])
+
+    def test_link_hash(self):
+        self.assertEqual(Link(n1, n2), Link(2, 1))
+        self.assertEqual(hash(Link(n1, n2)), hash(Link(n2, n1)))
+        self.assertEqual((Link(n2, n1).u, Link(n2, n1).v), (n2, n1))
+        self.assertNotEqual(Link(n1, n2), Link(n1, n3))
+        self.assertIn(n2, Link(n1, n2))
+        self.assertNotIn(n3, Link(n1, n2))
+
+    def test_csr_storage(self):
+        g = UndirectedGraph(self.g0.neighbors(), "csr")
+        self.assertEqual(g.storage, "csr")
+        self.assertEqual(g, self.g0)
+        self.assertDictEqual(g.neighbors(), self.g0.neighbors())
+        self.assertDictEqual(g.degrees(), self.g0.degrees())
+        self.assertEqual(len(g.get_shortest_path(0, 9)), len(self.g0.get_shortest_path(0, 9)))
+        self.assertEqual(len(g.connection_components()), 3)
+        g.remove(n2).disconnect(n7, n8).connect(n0, n14)
+        self.assertEqual(g, self.g0.copy().remove(n2).disconnect(n7, n8).connect(n0, n14))
+        self.assertEqual(g.copy().storage, "csr")
+
+    def test_bad_storage(self):
+        with self.assertRaises(ValueError):
+            UndirectedGraph({}, "list")
+
+    def test_view(self):
+        for s in ("set", "csr"):
+            g = UndirectedGraph(self.g1.neighbors(), s)
+            nodes, links, neighbors = g.view.nodes, g.view.links, g.view.neighbors(n1)
+            self.assertSetEqual(set(neighbors), {n2, n3, n4})
+            self.assertEqual(len(links), len(g.links))
+            g.connect(n1, n0).remove(n4)
+            self.assertSetEqual(set(neighbors), {n0, n2, n3})
+            self.assertSetEqual(set(nodes), g.nodes)
+            self.assertSetEqual(set(links), g.links)
+            self.assertIn(Link(n1, n0), links)
+            self.assertNotIn([], nodes)
+            self.assertFalse(hasattr(nodes, "add"))
+            self.assertFalse(hasattr(neighbors, "remove"))
+
+    def test_view_missing_node(self):
+        with self.assertRaises(KeyError):
+            self.g0.view.neighbors(-1)
+
     def test_get_nodes(self):
         self.assertSetEqual(self.g0.nodes, {n0, n1, n2, n3, n4, n5, n6, n7, n8, n9, n10, n11, n12, n13, n14})
         self.assertSetEqual(self.g1.nodes, {n0, n1, n2, n3, n4, n5})
@@ -391,6 +464,32 @@ class TestUndirectedGraph(TestCase):
         self.assertSetEqual(self.g7.bridge_links(), {Link(n8, n9), Link(n8, n10)})
         self.assertSetEqual(self.g8.bridge_links(), {Link(n7, n8), Link(n7, n9)})
 
+    def test_biconnected_components(self):
+        res = self.g0.biconnected_components()
+        self.assertEqual(len(res), 6)
+        self.assertSetEqual(set(map(frozenset, res)),
+                            {frozenset({n0, n1, n2}), frozenset({n2, n3, n4, n5, n6, n7, n8}), frozenset({n7, n9}),
+                             frozenset({n10, n11}), frozenset({n11, n12, n13}), frozenset({n14})})
+        self.assertListEqual(self.g1.biconnected_components(), [self.g1.nodes])
+        for g in (self.g2, self.g3, self.g4, self.g5, self.g6, self.g7, self.g8):
+            for b in g.biconnected_components():
+                self.assertTrue(len(b) < 3 or not g.subgraph(b).cut_nodes())
+            self.assertEqual(sum(map(len, g.biconnected_components())), len(g.nodes) + sum(
+                len(g.component(u).remove(u).connection_components()) - 1 for u in g.cut_nodes()))
+
+    def test_block_cut_tree(self):
+        res = self.g0.block_cut_tree()
+        self.assertEqual(len(res.nodes), 9)
+        self.assertSetEqual(res.neighbors(n2),
+                            {Node(frozenset({n0, n1, n2})), Node(frozenset({n2, n3, n4, n5, n6, n7, n8}))})
+        self.assertTrue(all(c.is_tree() for c in res.connection_components()))
+        self.assertEqual(len(res.connection_components()), len(self.g0.connection_components()))
+
+    def test_cut_nodes_long_path(self):
+        g = UndirectedGraph.from_edges((i, i + 1) for i in range(100000))
+        self.assertEqual(len(g.cut_nodes()), 99999)
+        self.assertEqual(len(g.bridge_links()), 100000)
+
     def test_full(self):
         self.assertFalse(any(map(lambda g: g.full(),
                                  [self.g0, self.g1, self.g2, self.g3, self.g4, self.g5, self.g6, self.g7, self.g8])))
@@ -410,6 +509,53 @@ class TestUndirectedGraph(TestCase):
         with self.assertRaises(KeyError):
             self.g2.get_shortest_path(n0, n7)
 
+    def test_shortest_path_lengths(self):
+        self.assertDictEqual(self.g0.shortest_path_lengths(0),
+                             {n0: 0, n1: 1, n2: 1, n3: 2, n4: 2, n5: 2, n6: 3, n8: 3, n7: 4, n9: 5})
+        self.assertDictEqual(self.g0.shortest_path_lengths(14), {n14: 0})
+        with self.assertRaises(KeyError):
+            self.g0.shortest_path_lengths(-1)
+
+    def test_shortest_paths_many(self):
+        pairs = [(0, 6), (7, 5), (0, 0), (3, 11), (0, 1)]
+        self.assertListEqual(self.g0.shortest_paths_many(pairs), [[n0, n2, n3, n6], [n7, n8, n5], [n0], [], [n0, n1]])
+        self.assertListEqual(self.g4.shortest_paths_many([(7, 15)]), [self.g4.get_shortest_path(7, 15)])
+        self.assertListEqual(self.g0.shortest_paths_many([]), [])
+        with self.assertRaises(KeyError):
+            self.g0.shortest_paths_many([(0, 1), (0, -1)])
+
+    def test_multi_source_distances(self):
+        self.assertDictEqual(self.g0.multi_source_distances([1, 9, 13]),
+                             {n1: 0, n9: 0, n13: 0, n0: 1, n2: 1, n7: 1, n11: 1, n12: 1, n3: 2, n4: 2, n5: 2, n6: 2,
+                              n8: 2, n10: 2})
+        self.assertDictEqual(self.g0.multi_source_distances([]), {})
+        with self.assertRaises(KeyError):
+            self.g0.multi_source_distances([0, -1])
+
+    def test_bfs(self):
+        res = list(self.g0.bfs(0))
+        self.assertTupleEqual(res[0], (n0, 0, None))
+        self.assertSetEqual({n for n, _, _ in res}, self.g0.component(0).nodes)
+        self.assertEqual(len(res), 10)
+        for n, d, p in res[1:]:
+            self.assertEqual(d, len(self.g0.get_shortest_path(n0, n)) - 1)
+            self.assertIn(p, self.g0.neighbors(n))
+        self.assertListEqual([d for _, d, _ in res], sorted(d for _, d, _ in res))
+        with self.assertRaises(KeyError):
+            self.g0.bfs(-1)
+
+    def test_dfs(self):
+        res = list(UndirectedGraph({0: [1], 1: [2], 2: [3]}).dfs(0))
+        self.assertListEqual(res, [(n0, 0, None), (n1, 1, n0), (n2, 2, n1), (n3, 3, n2)])
+        res, seen = list(self.g0.dfs(7)), set()
+        for n, d, p in res:
+            self.assertTrue(p is None or p in seen and p in self.g0.neighbors(n))
+            seen.add(n)
+        self.assertSetEqual(seen, self.g0.component(7).nodes)
+        self.assertEqual(len(res), len(seen))
+        with self.assertRaises(KeyError):
+            self.g0.dfs(-1)
+
     def test_euler_tour_exist(self):
         g0 = self.g0.copy().connect(4, 9).connect(5, 7).connect(2, 8).disconnect(10, 11)
         self.assertFalse(g0.euler_tour_exists())
@@ -447,6 +593,26 @@ class TestUndirectedGraph(TestCase):
     def test_euler_walk_missing_nodes(self):
         with self.assertRaises(KeyError):
             self.g0.euler_walk(3, -2)
+        with self.assertRaises(KeyError):
+            self.g0.iter_euler_walk(3, -2)
+
+    def test_iter_euler_tour(self):
+        n = 100000
+        g = UndirectedGraph({i: [(i + 1) % n, (i + 2) % n] for i in range(n)})
+        res = g.iter_euler_tour()
+        self.assertIn(next(res), g.neighbors(next(res)))
+        res = list(g.iter_euler_tour())
+        self.assertEqual(len(res), len(g.links) + 1)
+        self.assertEqual(res[0], res[-1])
+        self.assertEqual(len({Link(res[i], res[i + 1]) for i in range(len(res) - 1)}), len(g.links))
+        self.assertListEqual(list(self.g0.iter_euler_tour()), [])
+
+    def test_iter_euler_walk(self):
+        g0 = self.g0.component(n0).disconnect(4, 5).disconnect(7, 8)
+        res = list(g0.iter_euler_walk(2, 9))
+        self.assertEqual((res[0], res[-1]), (n2, n9))
+        self.assertEqual(len({Link(res[i], res[i + 1]) for i in range(len(res) - 1)}), len(g0.links))
+        self.assertListEqual(list(g0.iter_euler_walk(0, 9)), [])
 
     def test_links_graph(self):
         links_g1 = self.g1.links_graph()
@@ -509,6 +675,23 @@ class TestUndirectedGraph(TestCase):
         self.assertTrue(consecutive_1s(g0, g0.interval_sort()))
         self.assertTrue(consecutive_1s(g0, g0.interval_sort(11)))
 
+    def test_interval_sort_large(self):
+        n, intervals = 300, [(7 * i % 97, 7 * i % 97 + i % 13) for i in range(300)]
+        g = UndirectedGraph.from_edges(((i, j) for i in range(n) for j in range(i) if
+                                        intervals[j][0] <= intervals[i][1] and intervals[i][0] <= intervals[j][1]),
+                                       range(n))
+        self.assertTrue(consecutive_1s(g, g.interval_sort()))
+        self.assertTrue(consecutive_1s(g, res := g.interval_sort(97)))
+        self.assertEqual(res[0], Node(97))
+        self.assertListEqual(g.interval_sort(96), [])
+        self.assertListEqual(UndirectedGraph({0: [1, 2, 3], 1: [4], 2: [5], 3: [6]}).interval_sort(), [])
+        self.assertListEqual(UndirectedGraph({0: [1], 1: [2], 2: [3], 3: [0]}).interval_sort(), [])
+        self.assertListEqual(UndirectedGraph({0: [1], 1: [2], 2: [3], 3: [4]}).interval_sort(2), [])
+        g = UndirectedGraph({0: [1, 2, 3, 4, 5], 1: [2], 3: [4], 5: [6]})
+        self.assertTrue(consecutive_1s(g, g.interval_sort()))
+        self.assertTrue(consecutive_1s(g, res := g.interval_sort(1)))
+        self.assertEqual(res[0], n1)
+
     def test_full_k_partite(self):
         self.assertTrue(all(map(lambda g: g.is_full_k_partite() == (g == self.g6),
                                 [self.g0, self.g1, self.g2, self.g3, self.g4, self.g5, self.g6, self.g7, self.g8])))
@@ -575,6 +758,17 @@ class TestUndirectedGraph(TestCase):
         self.assertIn({n2, n6, n7}, res)
         self.assertEqual(len(res), 6)
 
+    def test_iter_maximal_cliques(self):
+        res = list(self.g7.iter_maximal_cliques())
+        self.assertEqual(len(res), len(set(map(frozenset, res))))
+        expected = self.g7.complementary().maximal_independent_sets()
+        self.assertSetEqual(set(map(frozenset, res)), set(map(frozenset, expected)))
+        n = 30000
+        g = UndirectedGraph({i: [i + 1, i + 2] for i in range(n)})
+        self.assertTrue(g.clique(*next(g.iter_maximal_cliques())))
+        self.assertEqual(len(g.max_cliques()), n - 1)
+        self.assertEqual(len(g.cliques(3)), n - 1)
+
     def test_max_cliques_node(self):
         res = self.g2.max_cliques_node(2)
         self.assertIn({n0, n1, n2}, res)
@@ -613,6 +807,16 @@ class TestUndirectedGraph(TestCase):
         self.assertSetEqual(res.nodes, {n012, n234, n45, n5678, n79})
         self.assertSetEqual(res.links, {Link(n012, n234), Link(n234, n45), Link(n45, n5678), Link(n5678, n79)})
 
+    def test_iter_maximal_independent_sets(self):
+        res = list(self.g1.iter_maximal_independent_sets(min_size=3))
+        self.assertIn({n0, n3, n4}, res)
+        self.assertIn({n2, n3, n4}, res)
+        self.assertEqual(len(res), 2)
+        self.assertEqual(len(list(self.g1.iter_maximal_independent_sets(3))), 3)
+        self.assertListEqual(list(UndirectedGraph().iter_maximal_independent_sets()), [set()])
+        g = UndirectedGraph({i: [j for j in range(60) if j != i] for i in range(60)})
+        self.assertEqual(len(list(g.iter_maximal_independent_sets())), 60)
+
     def test_chromatic_nodes_partition(self):
         res = self.g0.chromatic_nodes_partition()
         self.assertEqual(len(res), 3)
@@ -620,6 +824,21 @@ class TestUndirectedGraph(TestCase):
         for subset in res:
             self.assertTrue(self.g0.complementary().clique(*subset))
 
+    def test_chromatic_nodes_partition_dsatur(self):
+        for g in (self.g0, self.g1, self.g4, self.g7):
+            res = g.chromatic_nodes_partition(False)
+            self.assertEqual(sum(map(len, res)), len(g.nodes))
+            self.assertSetEqual(set().union(*res), g.nodes)
+            for s in res:
+                self.assertTrue(g.complementary().clique(*s))
+        n = 80
+        g = UndirectedGraph({i: [j for j in range(i + 1, n) if (i * j) % 7 < 2] for i in range(n)})
+        exact, fast = g.chromatic_nodes_partition(), g.chromatic_nodes_partition(False)
+        self.assertLessEqual(len(exact), len(fast))
+        self.assertGreaterEqual(len(exact), len(g.max_cliques()[0]))
+        for s in exact:
+            self.assertTrue(g.complementary().clique(*s))
+
     def test_chromatic_nodes_partition_on_full_k_partite_graph(self):
         res = self.g6.chromatic_nodes_partition()
         self.assertIn({n0}, res)
@@ -651,6 +870,31 @@ class TestUndirectedGraph(TestCase):
                 for d in res:
                     self.assertEqual(l0 in d, subset == d)
 
+    def test_chromatic_links_partition_fast(self):
+        n = 2000
+        for g, k in ((UndirectedGraph({i: [n + (i + j) % n for j in range(5)] for i in range(n)}), 5),
+                     (UndirectedGraph({i: [(i + 1) % 999, (i + 3) % 999, (i + 5) % 999] for i in range(999)}), 7)):
+            res = g.chromatic_links_partition(False)
+            self.assertLessEqual(len(res), k)
+            self.assertEqual(sum(map(len, res)), len(g.links))
+            for subset in res:
+                self.assertEqual(len({n for l in subset for n in (l.u, l.v)}), 2 * len(subset))
+        g = UndirectedGraph({0: [1, 2], 1: [2]})
+        self.assertEqual(len(g.chromatic_links_partition(False)), 3)
+        self.assertListEqual(UndirectedGraph({0: []}).chromatic_links_partition(), [])
+
+    def test_chromatic_links_partition_exact(self):
+        missing = {(0, 1), (2, 3), (4, 5)}
+        overfull = UndirectedGraph({i: [j for j in range(i + 1, 9) if (i, j) not in missing] for i in range(9)})
+        petersen = UndirectedGraph({i: [(i + 1) % 5, i + 5] for i in range(5)} | {i: [(i + 2) % 5 + 5] for i in range(5, 10)})
+        full = UndirectedGraph({i: list(range(i + 1, 8)) for i in range(8)})
+        for g, k in ((overfull, 9), (petersen, 4), (full, 7)):
+            res = g.chromatic_links_partition()
+            self.assertEqual(len(res), k)
+            self.assertEqual(sum(map(len, res)), len(g.links))
+            for subset in res:
+                self.assertEqual(len({n for l in subset for n in (l.u, l.v)}), 2 * len(subset))
+
     def test_vertex_cover(self):
         res = self.g1.vertex_cover()
         self.assertEqual(len(res), 3)
@@ -766,6 +1010,23 @@ class TestUndirectedGraph(TestCase):
         with self.assertRaises(KeyError):
             self.g0.hamilton_walk(2, -1)
 
+    def test_exact_solvers_on_larger_graph(self):
+        n = 40
+        g = UndirectedGraph({i: [(i + 1) % n, (i + 7) % n] for i in range(n)})
+        res = g.hamilton_tour()
+        self.assertEqual(len(res), n + 1)
+        self.assertSetEqual(set(res), g.nodes)
+        for i in range(n):
+            self.assertIn(res[i], g.neighbors(res[i + 1]))
+        res = g.dominating_set()
+        self.assertEqual(len(res), 8)
+        for u in g.nodes:
+            self.assertTrue(u in res or not g.neighbors(u).isdisjoint(res))
+        res = g.independent_set()
+        self.assertEqual(len(res), 20)
+        for u in res:
+            self.assertTrue(g.neighbors(u).isdisjoint(res))
+
     def test_isomorphic_bijection(self):
         g1 = UndirectedGraph({n11: [n12, n13, n14], n12: [n10, n15], n15: [n10, n13, n14]})
         func = self.g1.isomorphic_bijection(g1)
@@ -773,6 +1034,39 @@ class TestUndirectedGraph(TestCase):
         g1.disconnect(n11, n13)
         self.assertDictEqual(self.g1.isomorphic_bijection(g1), {})
 
+    def test_isomorphic_bijection_regular(self):
+        petersen = UndirectedGraph({0: [1, 4, 5], 3: [2, 4, 8], 9: [4, 6, 7], 5: [7, 8], 2: [1, 7], 6: [1, 8]})
+        outer, inner = [(2 * i) % 5 for i in range(5)], [5 + (3 * i) % 5 for i in range(5)]
+        g = UndirectedGraph({10 + outer[i]: [10 + outer[(i + 1) % 5], 10 + inner[i]] for i in range(5)})
+        g.connect_all(*(10 + inner[i] for i in range(5)))
+        for i in range(5):
+            g.disconnect(10 + inner[i], 10 + inner[(i + 1) % 5])
+        func = petersen.isomorphic_bijection(g)
+        self.assertEqual(len(func), 10)
+        for u in petersen.nodes:
+            self.assertSetEqual(set(map(func.get, petersen.neighbors(u))), g.neighbors(func[u]))
+        n = 300
+        g0 = UndirectedGraph({i: [(i + 1) % n, (i + 5) % n] for i in range(n)})
+        g1 = UndirectedGraph({(7 * i) % n: [(7 * (i + 1)) % n, (7 * (i + 5)) % n] for i in range(n)})
+        self.assertEqual(len(g0.isomorphic_bijection(g1)), n)
+        self.assertDictEqual(g0.isomorphic_bijection(g1.copy().disconnect(0, 7).connect(0, 14)), {})
+
+    def test_fingerprint(self):
+        g1 = UndirectedGraph({n11: [n12, n13, n14], n12: [n10, n15], n15: [n10, n13, n14]})
+        self.assertEqual(self.g1.fingerprint(), g1.fingerprint())
+        self.assertEqual(g1.fingerprint(), g1.copy().fingerprint())
+        res = g1.fingerprint()
+        g1.disconnect(n11, n13)
+        self.assertNotEqual(g1.fingerprint(), res)
+        self.assertEqual(g1.connect(n11, n13).fingerprint(), res)
+        self.assertNotEqual(g1.add(n6).fingerprint(), res)
+        self.assertEqual(g1.remove(n6).fingerprint(), res)
+        n = 300
+        g0 = UndirectedGraph({i: [(i + 1) % n, (i + 5) % n] for i in range(n)})
+        g1 = UndirectedGraph({(7 * i) % n: [(7 * (i + 1)) % n, (7 * (i + 5)) % n] for i in range(n)})
+        self.assertEqual(g0.fingerprint(), g1.fingerprint())
+        self.assertNotEqual(g0.fingerprint(), g1.disconnect(0, 7).connect(0, 14).fingerprint())
+
     def test_bool(self):
         g = self.g0.component(14)
         self.assertTrue(g)
@@ -823,6 +1117,18 @@ class TestWeightedNodesUndirectedGraph(TestCase):
         self.assertDictEqual(g.node_weights(), {n0: 3, n1: 2, n2: 4, n3: 0})
         self.assertSetEqual(g.links, {Link(0, 2), Link(0, 3), Link(1, 2), Link(1, 3)})
 
+    def test_from_edges(self):
+        g = WeightedNodesUndirectedGraph.from_edges([(0, 2), (0, 3), (1, 2), (3, 1)], {0: 3, 1: 2, 2: 4})
+        self.assertEqual(g, WeightedNodesUndirectedGraph({0: (3, {2, 3}), 1: (2, {2, 3}), 2: (4, [])}))
+        self.assertEqual(WeightedNodesUndirectedGraph.from_edges(self.g0.to_edges(), self.g0.node_weights()), self.g0)
+        with self.assertRaises(TypeError):
+            WeightedNodesUndirectedGraph.from_edges([], {0: "x"})
+
+    def test_from_adjacency(self):
+        neighborhood = {n: (self.g1.node_weights(n), self.g1.neighbors(n)) for n in self.g1.nodes}
+        for s in ("set", "csr"):
+            self.assertEqual(WeightedNodesUndirectedGraph.from_adjacency(neighborhood, s), self.g1)
+
     def test_node_weights(self):
         self.assertEqual(self.g0.node_weights(),
                          {n0: 7, n1: 3, n2: 5, n3: 2, n4: 8, n5: 4, n6: 6, n7: 2, n8: 0, n9: 5, n10: 4, n11: 2, n12: 1,
@@ -1086,6 +1392,31 @@ class TestWeightedLinksUndirectedGraph(TestCase):
         self.assertDictEqual(g.link_weights(), {Link(0, 1): 4, Link(0, 2): 3, Link(1, 3): 1})
         self.assertDictEqual(g.neighbors(), {n0: {n1, n2}, n1: {n0, n3}, n2: {n0}, n3: {n1}})
 
+    def test_from_edges(self):
+        g = WeightedLinksUndirectedGraph.from_edges([(0, 1, 4), (0, 2, 3), (1, 0, 3), (1, 3, 1), (4, 4, 2)])
+        self.assertEqual(g, WeightedLinksUndirectedGraph({0: {1: 4, 2: 3}, 1: {3: 1}, 4: {}}))
+        for s in ("set", "csr"):
+            self.assertEqual(WeightedLinksUndirectedGraph.from_edges(self.g0.to_edges(), self.g0.nodes, s), self.g0)
+        with self.assertRaises(TypeError):
+            WeightedLinksUndirectedGraph.from_edges([(0, 1, [])])
+
+    def test_from_csr(self):
+        for s in ("set", "csr"):
+            g = WeightedLinksUndirectedGraph.from_csr([n0, n1, n2], [0, 1, 3, 4], [1, 0, 2, 1], [2, 2, -1, -1], s)
+            self.assertEqual(g, WeightedLinksUndirectedGraph({0: {1: 2}, 2: {1: -1}}))
+            self.assertListEqual(g.minimal_path_links(n0, n2), [n0, n1, n2])
+        g = WeightedLinksUndirectedGraph.from_csr([0, 1], [0, 1, 2], [1, 0])
+        self.assertDictEqual(g.link_weights(), {Link(0, 1): 0})
+        with self.assertRaises(TypeError):
+            WeightedLinksUndirectedGraph.from_csr([n0, n1], [0, 1, 2], [1, 0], ["x", "x"])
+
+    def test_to_edges(self):
+        self.assertSetEqual({(Link(u, v), w) for u, v, w in self.g1.to_edges()}, set(self.g1.link_weights().items()))
+
+    def test_from_adjacency(self):
+        neighborhood = {n: self.g1.link_weights(n) for n in self.g1.nodes}
+        self.assertEqual(WeightedLinksUndirectedGraph.from_adjacency(neighborhood), self.g1)
+
     def test_link_weights(self):
         self.assertDictEqual(self.g0.link_weights(),
                              {Link(n0, n1): 3, Link(n0, n2): 1, Link(n1, n2): -4, Link(n3, n2): 6, Link(n4, n2): 2,
@@ -1284,6 +1615,17 @@ class TestWeightedLinksUndirectedGraph(TestCase):
         g = build_graph(res)
         self.assertTrue(g.is_tree())
 
+    def test_minimal_spanning_forest(self):
+        for g, w in [(self.g0, 22), (self.g1, 10), (self.g2, 1), (self.g3, sum(self.g3.link_weights().values()))]:
+            res, weight = g.minimal_spanning_forest()
+            self.assertEqual(weight, w)
+            self.assertEqual(sum(map(g.link_weights, res)), w)
+            self.assertEqual(len(res), len(g.nodes) - len(g.connection_components()))
+            res, weight = g.minimal_spanning_forest(2)
+            self.assertEqual(weight, w)
+            self.assertEqual(len(res), len(g.nodes) - len(g.connection_components()))
+        self.assertTupleEqual(WeightedLinksUndirectedGraph({0: {}, 1: {}}).minimal_spanning_forest(), (set(), 0))
+
     def test_links_graph(self):
         l02 = Node(Link(0, 2))
         l05 = Node(Link(0, 5))
@@ -1399,6 +1741,24 @@ class TestWeightedUndirectedGraph(TestCase):
         self.assertDictEqual(g.link_weights(), {Link(0, 1): 0, Link(1, 2): 3})
         self.assertDictEqual(g.neighbors(), {n0: {n1}, n1: {n0, n2}, n2: {n1}})
 
+    def test_from_edges(self):
+        g = WeightedUndirectedGraph.from_edges([(0, 1, 0), (2, 1, 3)], {0: 2, 2: 3})
+        self.assertEqual(g, WeightedUndirectedGraph({0: (2, {1: 0}), 2: (3, {1: 3})}))
+        g = WeightedUndirectedGraph.from_edges(self.g0.to_edges(), self.g0.node_weights(), "csr")
+        self.assertEqual(g, self.g0)
+
+    def test_from_csr(self):
+        for s in ("set", "csr"):
+            g = WeightedUndirectedGraph.from_csr([n0, n1, n2], [0, 1, 3, 4], [1, 0, 2, 1], [1, 0, 3], [2, 2, 1, 1], s)
+            self.assertEqual(g, WeightedUndirectedGraph({0: (1, {1: 2}), 1: (0, {}), 2: (3, {1: 1})}))
+            self.assertEqual(g.minimal_path_cost(n0, n2), ([n0, n1, n2], 7))
+        g = WeightedNodesUndirectedGraph.from_csr([0, 1], [0, 1, 2], [1, 0], [-1, 2])
+        self.assertEqual(g, WeightedNodesUndirectedGraph({0: (-1, [1]), 1: (2, [])}))
+
+    def test_from_adjacency(self):
+        neighborhood = {n: (self.g1.node_weights(n), self.g1.link_weights(n)) for n in self.g1.nodes}
+        self.assertEqual(WeightedUndirectedGraph.from_adjacency(neighborhood), self.g1)
+
     def test_total_weight(self):
         self.assertEqual((self.g0.total_weight, self.g1.total_weight, self.g2.total_weight, self.g3.total_weight),
                          (108, 44, 39, 83))
@@ -1554,6 +1914,24 @@ class TestWeightedUndirectedGraph(TestCase):
         with self.assertRaises(KeyError):
             self.g1.minimal_path(3, 7)
 
+    def test_minimal_path_cost(self):
+        g = WeightedUndirectedGraph({0: (1, {1: 2, 2: 7}), 1: (3, {2: 1, 3: 5}), 2: (0, {3: 2}), 3: (4, {}), 4: (1, {})})
+        self.assertTupleEqual(g.minimal_path_cost(0, 3), ([n0, n1, n2, n3], 13))
+        self.assertTupleEqual(g.minimal_path_cost(3, 3), ([n3], 4))
+        self.assertTupleEqual(g.minimal_path_cost(0, 4), ([], inf))
+        self.assertTupleEqual(self.g0.minimal_path_cost(n1, n13), ([], inf))
+        with self.assertRaises(KeyError):
+            g.minimal_path_cost(0, 5)
+
+    def test_minimal_distances(self):
+        g = WeightedUndirectedGraph({0: (1, {1: 2, 2: 7}), 1: (3, {2: 1, 3: 5}), 2: (0, {3: 2}), 3: (4, {}), 4: (1, {})})
+        self.assertDictEqual(g.minimal_distances(0), {n0: 1, n1: 6, n2: 7, n3: 13})
+        self.assertDictEqual(g.minimal_distances(4), {n4: 1})
+        with self.assertRaises(KeyError):
+            g.minimal_distances(5)
+        with self.assertRaises(ValueError):
+            WeightedUndirectedGraph({0: (1, {1: -2})}).minimal_distances(0)
+
     def test_isomorphic_bijection(self):
         g1 = WeightedUndirectedGraph(
             {n10: (3, {}), n11: (2, {n12: 5, n13: 2, n14: 4}), n12: (4, {n10: 2, n15: 1}), n13: (6, {}), n14: (5, {}),
@@ -1564,6 +1942,16 @@ class TestWeightedUndirectedGraph(TestCase):
         g1 = WeightedNodesUndirectedGraph.copy(g1)
         self.assertDictEqual(func, self.g1.isomorphic_bijection(g1))
 
+    def test_fingerprint(self):
+        g1 = WeightedUndirectedGraph(
+            {n10: (3, {}), n11: (2, {n12: 5, n13: 2, n14: 4}), n12: (4, {n10: 2, n15: 1}), n13: (6, {}), n14: (5, {}),
+             n15: (1, {n10: 4, n13: 3, n14: 2})})
+        self.assertEqual(self.g1.fingerprint(), res := g1.fingerprint())
+        self.assertNotEqual(UndirectedGraph.copy(g1).fingerprint(), res)
+        self.assertNotEqual(g1.set_weight(Link(n10, n12), 3).fingerprint(), res)
+        self.assertNotEqual(g1.increase_weight(Link(n10, n12), -1).set_weight(n13, 5).fingerprint(), res)
+        self.assertEqual(g1.set_weight(n13, 6).fingerprint(), res)
+
     def test_equal(self):
         self.assertNotEqual(self.g1, self.g2)
         g1 = self.g1.copy().disconnect(n5, n2, n3).disconnect(n1, n4).connect(n3, {n2: 1, n4: 2})